@@ -0,0 +1,272 @@
+"""
+Chạy hàng loạt trận headless song song (mọi core) để cân bằng game:
+
+    python batch.py --matches 200 --maps 1 2 3 --input bot
+    python batch.py --config balance.json --matches 100 --out out/sweep1
+
+Config JSON (tuỳ chọn) là list cấu hình, mỗi cấu hình ghi đè:
+    [
+      {
+        "name": "more_small_prey",
+        "maps": [1, 2],
+        "enemy_weights": {"map1": {"fish02": 24}},
+        "map_targets": {"1": 600},
+        "drop_weights": {"ob1": 6, "heart": 2},
+        "drop_intervals": {"1": 7.5}
+      }
+    ]
+
+Seed mỗi trận suy ra từ (--seed, tên cấu hình, map, chỉ số trận) nên chạy
+lại y hệt được; trận bất thường replay riêng bằng:
+
+    python batch.py --config balance.json --replay more_small_prey:1:123456
+"""
+import argparse
+import copy
+import csv
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.world.sim import run_match
+from src.world.spawner import _load_fish_enemies
+
+
+# =========================
+# Config
+# =========================
+def load_configs(path):
+    if not path:
+        return [{"name": "base"}]
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+    for i, cfg in enumerate(data):
+        cfg.setdefault("name", f"cfg{i}")
+    return data
+
+
+def build_overrides(cfg, base_enemies):
+    """cfg -> kwargs cho run_match (enemies_cfg / targets / drop_cfg)."""
+    enemies = base_enemies
+    if cfg.get("enemy_weights"):
+        enemies = copy.deepcopy(base_enemies)
+        for map_key, weights in cfg["enemy_weights"].items():
+            for e in enemies.get(map_key, []):
+                if e.get("id") in weights:
+                    e["weight"] = int(weights[e["id"]])
+
+    targets = None
+    if cfg.get("map_targets"):
+        targets = {int(k): int(v) for k, v in cfg["map_targets"].items()}
+
+    drop_cfg = {}
+    if cfg.get("drop_weights"):
+        drop_cfg["weights"] = dict(cfg["drop_weights"])
+    if cfg.get("drop_intervals"):
+        drop_cfg["base_intervals"] = {int(k): float(v) for k, v in cfg["drop_intervals"].items()}
+
+    return {"enemies_cfg": enemies, "targets": targets, "drop_cfg": drop_cfg or None}
+
+
+def match_seed(base_seed, name, map_id, index):
+    # Random(str) băm ổn định (sha512) -> giống nhau giữa các process / lần chạy
+    return random.Random(f"{base_seed}:{name}:{map_id}:{index}").getrandbits(32)
+
+
+# =========================
+# Worker
+# =========================
+def _run_job(job):
+    """Chạy trong process con (phải ở top-level để pickle được)."""
+    r = run_match(
+        job["map_id"],
+        job["mode"],
+        job["seed"],
+        job["seconds"],
+        job["input"],
+        sample_every=job["sample_every"],
+        **job["overrides"],
+    )
+    r["config"] = job["config"]
+    r["index"] = job["index"]
+    return r
+
+
+def make_jobs(configs, args, base_enemies):
+    jobs = []
+    for cfg in configs:
+        overrides = build_overrides(cfg, base_enemies)
+        for map_id in cfg.get("maps", args.maps):
+            for i in range(args.matches):
+                jobs.append({
+                    "config": cfg["name"],
+                    "index": i,
+                    "map_id": int(map_id),
+                    "mode": int(cfg.get("mode", args.mode)),
+                    "seed": match_seed(args.seed, cfg["name"], map_id, i),
+                    "seconds": float(cfg.get("seconds", args.seconds)),
+                    "input": cfg.get("input", args.input),
+                    "sample_every": args.sample_every,
+                    "overrides": overrides,
+                })
+    return jobs
+
+
+# =========================
+# Aggregate
+# =========================
+def _mean_curve(curves):
+    # trận kết thúc sớm: giữ điểm cuối cho các mốc sau
+    n = max(len(c) for c in curves)
+    out = []
+    for i in range(n):
+        out.append(round(statistics.fmean(c[min(i, len(c) - 1)] for c in curves), 2))
+    return out
+
+
+def aggregate(results, sample_every):
+    groups = {}
+    for r in results:
+        groups.setdefault((r["config"], r["map_id"]), []).append(r)
+
+    summary = []
+    for (name, map_id), rs in sorted(groups.items()):
+        wins = [r for r in rs if r["result"] == "win"]
+        ttt = [r["sim_seconds"] for r in wins]
+        deaths = [r["deaths"] for r in rs]
+        summary.append({
+            "config": name,
+            "map_id": map_id,
+            "matches": len(rs),
+            "win_rate": round(len(wins) / len(rs), 4),
+            "lose_rate": round(sum(r["result"] == "lose" for r in rs) / len(rs), 4),
+            "timeout_rate": round(sum(r["result"] == "timeout" for r in rs) / len(rs), 4),
+            "time_to_target_mean": round(statistics.fmean(ttt), 2) if ttt else None,
+            "time_to_target_median": round(statistics.median(ttt), 2) if ttt else None,
+            "deaths_mean": round(statistics.fmean(deaths), 3),
+            "points_mean": round(statistics.fmean(r["points"] for r in rs), 1),
+            "sample_every": sample_every,
+            "points_curve": _mean_curve([r["curve"] for r in rs]),
+        })
+    return summary
+
+
+def write_outputs(out_dir, results, summary, meta):
+    os.makedirs(out_dir, exist_ok=True)
+
+    fields = ["config", "map_id", "index", "seed", "mode", "result", "sim_seconds",
+              "ticks", "points", "target", "deaths", "lives", "wall_seconds"]
+    with open(os.path.join(out_dir, "matches.csv"), "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        w.writeheader()
+        for r in sorted(results, key=lambda r: (r["config"], r["map_id"], r["index"])):
+            row = dict(r)
+            row["lives"] = "/".join(str(x) for x in r["lives"])
+            row["sim_seconds"] = round(r["sim_seconds"], 3)
+            row["wall_seconds"] = round(r["wall_seconds"], 4)
+            w.writerow(row)
+
+    with open(os.path.join(out_dir, "summary.csv"), "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=[k for k in summary[0] if k != "points_curve"], extrasaction="ignore")
+        w.writeheader()
+        w.writerows(summary)
+
+    with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "summary": summary}, f, indent=2)
+
+
+# =========================
+# Main
+# =========================
+def replay(args, configs, base_enemies):
+    name, map_id, seed = args.replay.split(":")
+    cfg = next((c for c in configs if c["name"] == name), None)
+    if cfg is None:
+        print(f"[WARN] config not found: {name}")
+        return
+    r = run_match(
+        int(map_id),
+        int(cfg.get("mode", args.mode)),
+        int(seed),
+        float(cfg.get("seconds", args.seconds)),
+        cfg.get("input", args.input),
+        sample_every=args.sample_every,
+        **build_overrides(cfg, base_enemies),
+    )
+    r.pop("curve")
+    print(json.dumps(r, indent=2))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parallel headless FishGame balance runner")
+    ap.add_argument("--config", default=None, help="file JSON các cấu hình cần so sánh")
+    ap.add_argument("--maps", type=int, nargs="+", default=[1, 2, 3])
+    ap.add_argument("--mode", type=int, default=1, choices=(1, 2))
+    ap.add_argument("--matches", type=int, default=50, help="số trận / cấu hình / map")
+    ap.add_argument("--seconds", type=float, default=600.0)
+    ap.add_argument("--seed", type=int, default=1, help="seed gốc cho toàn bộ batch")
+    ap.add_argument("--input", default="bot", choices=("bot", "random", "idle"))
+    ap.add_argument("--sample-every", type=float, default=10.0, help="giây giữa 2 mẫu points curve")
+    ap.add_argument("--workers", type=int, default=None, help="mặc định = số CPU")
+    ap.add_argument("--out", default=os.path.join("out", "batch"))
+    ap.add_argument("--replay", default=None, metavar="CONFIG:MAP:SEED", help="chạy lại đúng 1 trận")
+    args = ap.parse_args()
+
+    configs = load_configs(args.config)
+    base_enemies = _load_fish_enemies()
+
+    if args.replay:
+        replay(args, configs, base_enemies)
+        return
+
+    jobs = make_jobs(configs, args, base_enemies)
+    workers = args.workers or os.cpu_count() or 1
+
+    t0 = time.perf_counter()
+    results = []
+    if workers <= 1:
+        results = [_run_job(j) for j in jobs]
+    else:
+        # chunksize: đỡ overhead IPC khi nhiều trận ngắn
+        chunk = max(1, len(jobs) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for r in pool.map(_run_job, jobs, chunksize=chunk):
+                results.append(r)
+                if len(results) % 50 == 0 or len(results) == len(jobs):
+                    print(f"  {len(results)}/{len(jobs)} matches")
+    wall = time.perf_counter() - t0
+
+    summary = aggregate(results, args.sample_every)
+    sim_total = sum(r["sim_seconds"] for r in results)
+    meta = {
+        "seed": args.seed,
+        "matches": len(results),
+        "workers": workers,
+        "wall_seconds": round(wall, 3),
+        "matches_per_second": round(len(results) / max(1e-9, wall), 2),
+        "sim_seconds_per_wall_second": round(sim_total / max(1e-9, wall), 1),
+        "configs": configs,
+    }
+    write_outputs(args.out, results, summary, meta)
+
+    for s in summary:
+        ttt = s["time_to_target_mean"]
+        print(
+            f"{s['config']:>16} map{s['map_id']}  win={s['win_rate'] * 100:5.1f}%  "
+            f"ttt={'-' if ttt is None else f'{ttt:.0f}s':>6}  deaths={s['deaths_mean']:.2f}  "
+            f"points={s['points_mean']:.0f}"
+        )
+    print(
+        f"{len(results)} matches on {workers} workers in {wall:.1f}s "
+        f"-> {meta['matches_per_second']} matches/s, {meta['sim_seconds_per_wall_second']} sim-s/s"
+    )
+    print(f"-> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Chạy mô phỏng không vẽ (headless) để cân bằng game:
+
+    python headless.py --map 1 --matches 20 --seconds 600 --seed 1 --input random
+"""
+import argparse
+import time
+
+from src.world.sim import run_match
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Headless FishGame simulation")
+    ap.add_argument("--map", type=int, default=1)
+    ap.add_argument("--mode", type=int, default=1, choices=(1, 2))
+    ap.add_argument("--matches", type=int, default=1)
+    ap.add_argument("--seconds", type=float, default=600.0, help="giới hạn thời gian mô phỏng / trận")
+    ap.add_argument("--seed", type=int, default=None, help="seed trận đầu, các trận sau +1")
+    ap.add_argument("--input", default="random", choices=("random", "idle", "bot"))
+    args = ap.parse_args()
+
+    total_sim = 0.0
+    t0 = time.perf_counter()
+
+    for i in range(args.matches):
+        seed = None if args.seed is None else args.seed + i
+        r = run_match(args.map, args.mode, seed, args.seconds, args.input)
+        total_sim += r["sim_seconds"]
+        rate = r["sim_seconds"] / max(1e-9, r["wall_seconds"])
+        print(
+            f"[{i + 1}/{args.matches}] seed={r['seed']} {r['result']:>7} "
+            f"points={r['points']:>5} sim={r['sim_seconds']:.1f}s "
+            f"wall={r['wall_seconds']:.2f}s ({rate:.0f} sim-s/s)"
+        )
+
+    wall = time.perf_counter() - t0
+    print(f"TOTAL sim={total_sim:.1f}s wall={wall:.2f}s -> {total_sim / max(1e-9, wall):.0f} sim-seconds / wall-second")
+
+
+if __name__ == "__main__":
+    main()
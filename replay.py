@@ -0,0 +1,89 @@
+"""
+Xem lại / kiểm tra replay (.fgr, ghi tự động vào data/replays mỗi trận):
+
+    python replay.py data/replays/<file>.fgr              # xem lại 1x (← / → tua 5 giây, Esc thoát)
+    python replay.py data/replays --headless              # chạy nhanh nhất mọi file, kiểm tra checkpoint
+    python replay.py <file>.fgr --headless --seek 30      # kiểm tra thêm: tua về giây 30 rồi phát lại tới hết
+"""
+import argparse
+import os
+import sys
+import time
+
+from src.world.replay import EXT, ReplayPlayer, load_replay
+
+
+def _paths(items):
+    out = []
+    for p in items:
+        if os.path.isdir(p):
+            out += sorted(os.path.join(p, n) for n in os.listdir(p) if n.endswith(EXT))
+        else:
+            out.append(p)
+    return out
+
+
+def check(path, seek=None) -> bool:
+    rep = load_replay(path)
+    player = ReplayPlayer(rep)
+
+    t0 = time.perf_counter()
+    r = player.run()
+    if seek is not None and r["ok"]:
+        player.seek(int(seek / player.world.fixed_dt))
+        r = player.run()
+    wall = time.perf_counter() - t0
+
+    exp = r["expected"] or {}
+    status = "OK" if r["ok"] else f"DESYNC@{r['desync']}" if r["desync"] else "MISMATCH"
+    sim = r["ticks"] * player.world.fixed_dt
+    print(
+        f"{status:>12} {os.path.basename(path)}  map{rep.header['map'].get('id')} {rep.header['mode']}P "
+        f"result={r['result'] or exp.get('result', '-')} points={r['points']} "
+        f"ticks={r['ticks']} checks={r['checked']} "
+        f"sim={sim:.1f}s wall={wall:.2f}s ({sim / max(1e-9, wall):.0f}x)"
+    )
+    return r["ok"]
+
+
+def watch(path):
+    from src.core.game import GameApp
+    from src.scenes.game_scene import GameScene
+
+    app = GameApp()
+    scene = GameScene(app)
+    app.scenes.scene = scene
+    scene.on_enter(replay=path)
+    app.run()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="FishGame replay viewer / checker")
+    ap.add_argument("paths", nargs="+", help="file .fgr hoặc thư mục chứa replay")
+    ap.add_argument("--headless", action="store_true", help="không vẽ, chạy tối đa tốc độ + kiểm tra")
+    ap.add_argument("--seek", type=float, default=None, help="(headless) tua về giây này rồi phát lại")
+    args = ap.parse_args()
+
+    paths = _paths(args.paths)
+    if not paths:
+        print("[WARN] no replay files")
+        return 1
+
+    if not args.headless:
+        watch(paths[0])
+        return 0
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    bad = 0
+    for p in paths:
+        try:
+            bad += not check(p, args.seek)
+        except Exception as e:
+            print(f"{'ERROR':>12} {os.path.basename(p)}  {e}")
+            bad += 1
+    print(f"{len(paths) - bad}/{len(paths)} replays OK")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
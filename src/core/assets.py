@@ -2,17 +2,25 @@ import os
 import pygame
 from typing import Optional
 
+from src.core.baked import BAKED, load_sizes
+
 
 class Assets:
     def __init__(self):
         self._images = {}
+        self._scaled = {}
+        self._sized = {}
         self._fonts = {}
         self._sounds = {}
 
     # ---------- IMAGE ----------
-    def image(self, path: str):
+    def image(self, path: str, size=None):
         path = path.replace("\\", "/")
 
+        # cần đúng size -> dùng texture đã bake (nếu có), khỏi decode ảnh gốc
+        if size is not None:
+            return self._image_sized(path, (int(size[0]), int(size[1])))
+
         if path not in self._images:
             if not os.path.exists(path):
                 # fallback placeholder (màu tím debug)
@@ -24,6 +32,53 @@ class Assets:
 
         return self._images[path]
 
+    def _image_sized(self, path, size):
+        key = (path, size)
+        surf = self._sized.get(key)
+        if surf is None:
+            if path in self._images:
+                surf = pygame.transform.smoothscale(self._images[path], size)
+            elif not os.path.exists(path):
+                surf = pygame.transform.scale(self.image(path), size)
+            else:
+                surf = load_sizes(path, [size])[0]
+            self._sized[key] = surf
+        return surf
+
+    def source_size(self, path: str):
+        """Size ảnh gốc; ưu tiên manifest bake để không phải decode."""
+        path = path.replace("\\", "/")
+        if path in self._images:
+            return self._images[path].get_size()
+        s = BAKED.source_size(path)
+        return s if s is not None else self.image(path).get_size()
+
+    def has_image(self, path: str) -> bool:
+        return path.replace("\\", "/") in self._images
+
+    def put_image(self, path: str, surf):
+        # dùng cho preload (decode ở thread khác, convert ở main thread)
+        self._images[path.replace("\\", "/")] = surf
+
+    # ---------- SCALED IMAGE ----------
+    def scaled_image(self, path: str, scale: float):
+        """Ảnh đã smoothscale theo scale cố định (tạo 1 lần, vd. item/obstacle)."""
+        path = path.replace("\\", "/")
+        key = (path, round(float(scale), 4))
+
+        surf = self._scaled.get(key)
+        if surf is None:
+            sw, sh = self.source_size(path)
+            w = max(2, int(sw * scale))
+            h = max(2, int(sh * scale))
+            surf = self._image_sized(path, (w, h))
+            self._scaled[key] = surf
+
+        return surf
+
+    def has_scaled_image(self, path: str, scale: float) -> bool:
+        return (path.replace("\\", "/"), round(float(scale), 4)) in self._scaled
+
     # ---------- FONT ----------
     def font(self, path: Optional[str], size: int):
         key = (path, size)
@@ -0,0 +1,116 @@
+# src/core/atlas.py
+"""
+Atlas frame cá (build bởi tools/build_atlas.py):
+- swim_01 / swim_02 của mọi loài xếp vào vài sheet lớn trong assets/atlas/
+  (cá địch theo map, cá người chơi chung 1 nhóm), 2 frame 1 loài luôn cùng sheet
+- assets/atlas/fish_atlas.json: folder -> paths, sheet, rect từng frame
+Runtime: 1 sheet = 1 lần mở file + decode cho cả nhóm loài; frame được cắt ra
+thành surface riêng (blit subsurface chậm hơn ~2x trong pygame) rồi bỏ sheet.
+Chưa build atlas / file nguồn đổi mà chưa build lại -> load file rời như cũ.
+"""
+import json
+import os
+
+import pygame
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+ATLAS_DIR = "assets/atlas"
+ATLAS_INDEX = f"{ATLAS_DIR}/fish_atlas.json"
+
+
+def _abs(path: str) -> str:
+    return os.path.join(ROOT, path)
+
+
+class FishAtlas:
+    def __init__(self, index: str = ATLAS_INDEX):
+        self.index_path = index
+        self._entries = None    # paths tuple -> entry
+        self._by_sheet = {}     # sheet -> [paths tuple]
+
+        # thống kê
+        self.sheet_loads = 0
+        self.frames_cut = 0
+
+    # =========================
+    # Index
+    # =========================
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        self._by_sheet = {}
+        full = _abs(self.index_path)
+        if not os.path.exists(full):
+            return self._entries
+
+        try:
+            with open(full, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+        except Exception as e:
+            print("[WARN] fish atlas index load failed:", e)
+            return self._entries
+
+        for entry in (data.get("fish") or {}).values():
+            paths = tuple(entry.get("paths") or ())
+            # nguồn đã đổi sau khi build -> bỏ, dùng file rời
+            try:
+                if [os.path.getsize(_abs(p)) for p in paths] != list(entry.get("src_bytes", ())):
+                    continue
+            except OSError:
+                continue
+            self._entries[paths] = entry
+            self._by_sheet.setdefault(entry["sheet"], []).append(paths)
+        return self._entries
+
+    def reload(self):
+        self._entries = None
+
+    def sheet_of(self, paths):
+        """Sheet chứa bộ paths, None nếu atlas không có (hoặc đã cũ)."""
+        e = self._load().get(tuple(paths))
+        return e["sheet"] if e else None
+
+    def discard(self, sheet: str):
+        """Sheet lỗi (thiếu file / decode hỏng) -> các loài trong đó quay về file rời."""
+        self._load()
+        for paths in self._by_sheet.pop(sheet, ()):
+            self._entries.pop(paths, None)
+
+    def abs_path(self, sheet: str) -> str:
+        return _abs(sheet)
+
+    # =========================
+    # Cut
+    # =========================
+    def cut(self, sheet: str, surf: pygame.Surface = None):
+        """
+        {paths: [Surface]} mọi loài trong sheet.
+        surf = sheet đã decode sẵn, chưa convert (preload ở worker thread), None -> load tại đây.
+        convert_alpha từng vùng cắt = vừa convert vừa tách khỏi sheet (không convert cả sheet rồi copy).
+        """
+        self._load()
+        if surf is None:
+            surf = pygame.image.load(_abs(sheet))
+            self.sheet_loads += 1
+
+        out = {}
+        for paths in self._by_sheet.get(sheet, ()):
+            rects = self._entries[paths]["rects"]
+            out[paths] = [surf.subsurface(r).convert_alpha() for r in rects]
+            self.frames_cut += len(rects)
+        return out
+
+    def stats(self) -> dict:
+        return {
+            "species": len(self._load()),
+            "sheets": len(self._by_sheet),
+            "sheet_loads": self.sheet_loads,
+            "frames_cut": self.frames_cut,
+        }
+
+
+# instance dùng chung (SPRITES lấy frame từ đây trước)
+ATLAS = FishAtlas()
@@ -0,0 +1,144 @@
+# src/core/baked.py
+"""
+Texture UI đã bake sẵn bởi tools/bake_ui.py:
+- ảnh nguồn (vd. button 1536x1024, ~2MB) -> bản nhỏ đúng size scene dùng, đã trim viền trong suốt
+- assets/baked/manifest.json: nguồn -> size gốc + các biến thể (file, size, vùng trim)
+Runtime: load_sizes(path, sizes) lấy biến thể nhỏ nhất đủ lớn cho mỗi size;
+thiếu bake / bake cũ (file nguồn đã đổi) -> decode file gốc như trước.
+"""
+import json
+import os
+
+import pygame
+
+from src.core.sprite_cache import PROJECT_ROOT
+
+BAKED_DIR = "assets/baked"
+MANIFEST = f"{BAKED_DIR}/manifest.json"
+
+
+def _abs(path: str) -> str:
+    return os.path.join(PROJECT_ROOT, path)
+
+
+def fit_size(src_size, box: int):
+    """Size giữ tỉ lệ sao cho cạnh lớn nhất = box (icon bake / Assets.image(path, size))."""
+    w, h = src_size
+    s = float(box) / float(max(w, h))
+    return int(w * s), int(h * s)
+
+
+class BakedTextures:
+    def __init__(self, manifest: str = MANIFEST):
+        self.manifest_path = manifest
+        self._entries = None
+
+        # thống kê
+        self.hits = 0
+        self.misses = 0
+
+    # =========================
+    # Manifest
+    # =========================
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        full = _abs(self.manifest_path)
+        if not os.path.exists(full):
+            return self._entries
+
+        try:
+            with open(full, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+        except Exception as e:
+            print("[WARN] baked manifest load failed:", e)
+            return self._entries
+
+        for src, entry in (data.get("entries") or {}).items():
+            # nguồn đã đổi sau khi bake -> bỏ, dùng file gốc
+            try:
+                if os.path.getsize(_abs(src)) != int(entry.get("src_bytes", -1)):
+                    continue
+            except OSError:
+                continue
+            self._entries[src] = entry
+        return self._entries
+
+    def reload(self):
+        self._entries = None
+
+    def source_size(self, path: str):
+        e = self._load().get(path.replace("\\", "/"))
+        return tuple(e["src_size"]) if e else None
+
+    def pick(self, path: str, size):
+        """Biến thể nhỏ nhất có w >= size.w và h >= size.h (None nếu không có)."""
+        e = self._load().get(path.replace("\\", "/"))
+        if not e:
+            return None
+        w, h = size
+        best = None
+        for v in e["variants"]:
+            vw, vh = v["size"]
+            if vw >= w and vh >= h and (best is None or vw * vh < best["size"][0] * best["size"][1]):
+                best = v
+        return best
+
+    # =========================
+    # Load
+    # =========================
+    def load(self, path: str, size):
+        """Surface đúng `size` dựng từ bản bake, None nếu không có bản phù hợp."""
+        v = self.pick(path, size)
+        if v is None:
+            self.misses += 1
+            return None
+
+        try:
+            surf = pygame.image.load(_abs(v["file"])).convert_alpha()
+        except Exception as e:
+            print("[WARN] baked texture load failed:", v["file"], e)
+            self.misses += 1
+            return None
+
+        # bù lại viền đã trim -> giữ nguyên bố cục / tâm ảnh
+        vw, vh = v["size"]
+        tx, ty = v.get("trim", (0, 0, vw, vh))[:2]
+        if (surf.get_width(), surf.get_height()) != (vw, vh):
+            full = pygame.Surface((vw, vh), pygame.SRCALPHA)
+            full.blit(surf, (tx, ty))
+            surf = full
+
+        if (vw, vh) != tuple(size):
+            surf = pygame.transform.smoothscale(surf, size)
+
+        self.hits += 1
+        return surf
+
+
+BAKED = BakedTextures()
+
+
+def source_size(path: str):
+    """Size ảnh nguồn, ưu tiên manifest (không phải decode file gốc)."""
+    s = BAKED.source_size(path)
+    if s is not None:
+        return s
+    return pygame.image.load(path).get_size()
+
+
+def load_sizes(path: str, sizes):
+    """
+    [Surface] đúng từng size trong `sizes`.
+    Ưu tiên bản bake; còn thiếu thì decode file gốc (tối đa 1 lần) rồi smoothscale.
+    """
+    out = [BAKED.load(path, s) for s in sizes]
+    if any(surf is None for surf in out):
+        raw = pygame.image.load(path).convert_alpha()
+        out = [
+            surf if surf is not None else pygame.transform.smoothscale(raw, s)
+            for surf, s in zip(out, sizes)
+        ]
+    return out
@@ -0,0 +1,39 @@
+# src/core/fixed_step.py
+"""
+Accumulator cho mô phỏng bước cố định:
+- advance(dt) cộng dt thật của frame, trả về số bước sim cần chạy (mỗi bước = step_dt)
+- tối đa max_steps bước / frame: frame quá dài thì bỏ phần dư (game chậm lại
+  một chút) thay vì chạy bù mãi -> không rơi vào vòng xoáy càng chậm càng nhiều bước
+- alpha = phần lẻ còn lại / step_dt, dùng nội suy vị trí lúc vẽ (prev -> pos)
+"""
+
+
+class FixedStep:
+    def __init__(self, hz=60, max_steps=5):
+        self.hz = int(hz)
+        self.step_dt = 1.0 / self.hz
+        self.max_steps = max(1, int(max_steps))
+
+        self.acc = 0.0
+        self.alpha = 1.0
+
+        # thống kê
+        self.steps = 0
+        self.dropped = 0.0  # giây sim bị bỏ do chạm max_steps
+
+    def advance(self, dt: float) -> int:
+        self.acc += max(0.0, float(dt))
+        n = int(self.acc / self.step_dt)
+        if n > self.max_steps:
+            self.dropped += (n - self.max_steps) * self.step_dt
+            self.acc -= (n - self.max_steps) * self.step_dt
+            n = self.max_steps
+        # sai số float có thể làm acc hơi âm
+        self.acc = max(0.0, self.acc - n * self.step_dt)
+        self.alpha = min(1.0, self.acc / self.step_dt)
+        self.steps += n
+        return n
+
+    def reset(self):
+        self.acc = 0.0
+        self.alpha = 1.0
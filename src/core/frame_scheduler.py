@@ -0,0 +1,82 @@
+# src/core/frame_scheduler.py
+"""
+Nhịp frame cho GameApp.run:
+- scene đang animate (gameplay, loading, fade chuyển scene, overlay F3)
+  -> clock.tick theo fps của scene, vẽ mọi frame như cũ
+- scene tĩnh (menu, leaderboard, pause...) -> vẽ xong thì ngủ trong
+  pygame.event.wait(timeout), không vẽ / flip lại khi không có gì đổi
+- có event -> vẽ ngay, vẽ tiếp thêm LINGER giây (hover, nhấn nút) rồi nghỉ lại
+- hết timeout mà không có event -> vẫn gọi update (timer của scene) nhưng không vẽ
+Scene khai báo qua Scene.animating / Scene.fps, code khác gọi invalidate()
+khi đổi thứ gì đó cần vẽ lại mà không qua event.
+"""
+import time
+
+import pygame
+
+# scene tĩnh vẫn được update ít nhất ~4 lần / giây
+IDLE_TIMEOUT_MS = 250
+# sau event, vẽ tiếp chừng này giây
+LINGER = 0.25
+# dt tối đa đưa vào update sau lúc ngủ chờ event
+MAX_DT = 0.1
+
+_now = time.perf_counter
+
+
+class FrameScheduler:
+    def __init__(self, clock, fps=60):
+        self.clock = clock
+        self.fps = int(fps)
+
+        self._dirty = True
+        self._hot_until = 0.0
+        self._scene = None
+
+        # thống kê
+        self.frames = 0
+        self.drawn = 0
+        self.idle_waits = 0
+
+    def invalidate(self):
+        """Buộc vẽ lại ở frame kế."""
+        self._dirty = True
+
+    def wait(self, active: bool, fps=None):
+        """
+        Chờ tới frame kế -> (dt, events).
+        active: đang animate -> tick theo fps; không -> chờ event (tối đa IDLE_TIMEOUT_MS).
+        """
+        self.frames += 1
+        if active or self._dirty or _now() < self._hot_until:
+            dt = self.clock.tick(fps or self.fps) / 1000.0
+            events = pygame.event.get()
+        else:
+            self.idle_waits += 1
+            ev = pygame.event.wait(IDLE_TIMEOUT_MS)
+            events = pygame.event.get()
+            if ev.type != pygame.NOEVENT:
+                events.insert(0, ev)
+            dt = min(self.clock.tick() / 1000.0, MAX_DT)
+
+        if events:
+            self._hot_until = _now() + LINGER
+        return dt, events
+
+    def should_draw(self, active: bool, scene) -> bool:
+        """Gọi sau update: có cần vẽ + flip frame này không."""
+        if scene is not self._scene:
+            self._scene = scene
+            self._dirty = True
+        draw = active or self._dirty or _now() < self._hot_until
+        self._dirty = False
+        if draw:
+            self.drawn += 1
+        return draw
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "drawn": self.drawn,
+            "idle_waits": self.idle_waits,
+        }
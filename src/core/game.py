@@ -1,9 +1,13 @@
+import os
 import pygame
 
 from src.core.settings import Settings
 from src.core.assets import Assets
 from src.core.scene_manager import SceneManager
 from src.core.save import SaveManager
+from src.core.profiler import PROFILER
+from src.core.frame_scheduler import FrameScheduler
+from src.ui.profiler_overlay import ProfilerOverlay
 
 from src.scenes.boot import BootScene
 from src.scenes.menu import MenuScene
@@ -30,6 +34,8 @@ class GameApp:
             (self.width, self.height)
         )
         self.clock = pygame.time.Clock()
+        # scene tĩnh -> chờ event thay vì vẽ lại 60 lần / giây
+        self.frames = FrameScheduler(self.clock, Settings.FPS)
         self.running = True
 
         # ================= CORE SYSTEMS =================
@@ -67,6 +73,12 @@ class GameApp:
         except Exception:
             pass
 
+        # ================= PROFILER (F3) =================
+        # FISHGAME_PROFILE=trace.json|trace.csv -> đo từ đầu, ghi file khi thoát
+        PROFILER.set_trace(os.environ.get("FISHGAME_PROFILE") or None)
+        self.profiler = PROFILER
+        self.profiler_overlay = ProfilerOverlay(PROFILER, pygame.font.SysFont("consolas", 15))
+
         # ================= SCENE MANAGER =================
         self.scenes = SceneManager(self)
         self.scenes.set_scene(BootScene(self))
@@ -118,19 +130,44 @@ class GameApp:
     # ==================================================
     # MAIN LOOP
     # ==================================================
+    def _animating(self) -> bool:
+        return self.scenes.animating or self.profiler_overlay.visible
+
     def run(self):
+        prof = self.profiler
+        frames = self.frames
+
         while self.running:
-            dt = self.clock.tick(Settings.FPS) / 1000.0
+            dt, events = frames.wait(self._animating(), self.scenes.fps)
+            prof.begin_frame()
 
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.quit()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
                 else:
                     self.scenes.handle_event(event)
 
-            self.scenes.update(dt)
-            self.scenes.draw(self.screen)
+            with prof.scope("update"):
+                self.scenes.update(dt)
+
+            # scene tĩnh, không event -> giữ nguyên frame đang hiển thị
+            if frames.should_draw(self._animating(), self.scenes.scene):
+                with prof.scope("draw"):
+                    self.scenes.draw(self.screen)
+
+                self.profiler_overlay.update(dt)
+                self.profiler_overlay.draw(self.screen)
+
+                with prof.scope("flip"):
+                    pygame.display.flip()
+
+            prof.end_frame()
 
-            pygame.display.flip()
+        if prof.trace_path:
+            path = prof.dump()
+            if path:
+                print("Profiler trace saved:", path)
 
         pygame.quit()
@@ -0,0 +1,68 @@
+# src/core/input.py
+import random
+import pygame
+
+
+class KeyboardInput:
+    """Đọc phím theo controls {"up","down","left","right"} -> hướng (x, y)."""
+
+    def __init__(self, controls):
+        self.controls = controls
+
+    def read(self, player):
+        keys = pygame.key.get_pressed()
+        c = self.controls
+        x = y = 0
+        if keys[c["left"]]:
+            x = -1
+        if keys[c["right"]]:
+            x = 1
+        if keys[c["up"]]:
+            y = -1
+        if keys[c["down"]]:
+            y = 1
+        return x, y
+
+
+class NullInput:
+    """Đứng yên (headless / test)."""
+
+    def read(self, player):
+        return 0, 0
+
+
+class ScriptedInput:
+    """
+    Input theo script: fn(t, player) -> (x, y).
+    t là thời gian đã mô phỏng (tăng theo mỗi lần read với dt cố định).
+    """
+
+    def __init__(self, fn, dt=1.0 / 60.0):
+        self.fn = fn
+        self.dt = float(dt)
+        self.t = 0.0
+
+    def read(self, player):
+        out = self.fn(self.t, player)
+        self.t += self.dt
+        return out
+
+
+class RandomWalkInput:
+    """Bơi ngẫu nhiên, đổi hướng sau mỗi `hold` giây (seeded)."""
+
+    DIRS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1), (0, 0)]
+
+    def __init__(self, rng=None, hold=0.8, dt=1.0 / 60.0):
+        self.rng = rng or random
+        self.hold = float(hold)
+        self.dt = float(dt)
+        self._t = 0.0
+        self._dir = (0, 0)
+
+    def read(self, player):
+        self._t -= self.dt
+        if self._t <= 0:
+            self._t = self.hold
+            self._dir = self.rng.choice(self.DIRS)
+        return self._dir
@@ -0,0 +1,336 @@
+# src/core/preload.py
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from src.core.sprite_cache import SPRITES, PROJECT_ROOT, folder_paths, resolve_path
+from src.core.baked import BAKED, fit_size
+from src.entities.animated_sprite import AnimatedSprite
+
+ITEM_DIR = "assets/ui/items"
+
+HUD_PANEL = "assets/ui/hud/panel.png"
+
+# (path, cạnh lớn nhất khi vẽ) - khớp HUD.draw
+HUD_ICONS = (
+    ("assets/ui/button/heart_full.png", 48),
+    ("assets/ui/button/heart_empty.png", 48),
+    ("assets/ui/items/x2diem.png", 24),
+    ("assets/ui/items/thuong1.png", 24),
+    ("assets/ui/items/thuong2.png", 24),
+    ("assets/ui/items/thuong3.png", 24),
+)
+
+
+def _decode_rgba(path: str):
+    """
+    Chạy trong worker thread: đọc + giải nén PNG/JPG ra raw bytes.
+    KHÔNG convert_alpha ở đây (cần display, phải làm ở main thread).
+    """
+    surf = pygame.image.load(path)
+    return surf.get_size(), pygame.image.tobytes(surf, "RGBA")
+
+
+class Preloader:
+    """
+    Preload tài nguyên trước khi vào scene:
+    - decode file trên ThreadPool (raw RGBA bytes); cá có trong atlas -> decode sheet
+    - main thread: frombytes + convert_alpha, đăng ký vào SPRITES / Assets
+    - sau đó tạo sẵn frame đã scale (quantize) cho từng loài cá
+    step(budget) chạy mỗi frame trong giới hạn thời gian -> không đứng hình,
+    progress (0..1) để scene loading vẽ thanh tiến trình.
+    """
+
+    def __init__(self, assets, registry=None, workers=None):
+        self.assets = assets
+        self.registry = registry or SPRITES
+        self.workers = workers or min(4, os.cpu_count() or 1)
+
+        # folder -> set scale cần tạo sẵn
+        self._fish = {}
+        self._images = []
+        # ảnh tĩnh cần đúng size (items / obstacles / HUD): (path, scale) | (path, (w, h))
+        self._scaled = []
+        self._sized = []
+
+        self._pool = None
+        self._decode = []       # list (kind, key, path, future)
+        self._fish_parts = {}   # folder -> {path: surface}
+        self._scale_jobs = []   # list (folder, scale)
+
+        self._total = 0
+        self._done = 0
+        self.started = False
+        self.finished = False
+
+    # =========================
+    # Build job list
+    # =========================
+    def add_fish(self, folder: str, scales=()):
+        self._fish.setdefault(folder, set()).update(float(s) for s in scales)
+
+    def add_image(self, path: str):
+        path = path.replace("\\", "/")
+        if path not in self._images:
+            self._images.append(path)
+
+    def add_image_dir(self, folder: str, exts=(".png", ".jpg"), scale=None):
+        full = os.path.join(PROJECT_ROOT, folder)
+        if not os.path.isdir(full):
+            return
+        for name in sorted(os.listdir(full)):
+            if name.lower().endswith(exts):
+                self.add_image(f"{folder}/{name}")
+                if scale is not None:
+                    self.add_scaled_image(f"{folder}/{name}", scale)
+
+    def add_scaled_image(self, path: str, scale: float):
+        job = (path.replace("\\", "/"), float(scale))
+        if job not in self._scaled:
+            self._scaled.append(job)
+
+    def add_sized_image(self, path: str, size):
+        job = (path.replace("\\", "/"), (int(size[0]), int(size[1])))
+        if job not in self._sized:
+            self._sized.append(job)
+
+    def _need_source(self, path: str, size):
+        # không có bản bake đủ lớn -> phải decode ảnh gốc (ở worker thread)
+        if size is None or BAKED.pick(path, size) is None:
+            self.add_image(path)
+
+    # =========================
+    # Run
+    # =========================
+    def start(self):
+        if self.started:
+            return
+        self.started = True
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        self._scaled = [
+            (p, s) for p, s in self._scaled
+            if os.path.exists(p) and not self.assets.has_scaled_image(p, s)
+        ]
+        self._sized = [(p, s) for p, s in self._sized if os.path.exists(p)]
+        for p, s in self._scaled:
+            src = BAKED.source_size(p)
+            self._need_source(p, src and (max(2, int(src[0] * s)), max(2, int(src[1] * s))))
+        for p, s in self._sized:
+            self._need_source(p, s)
+
+        sheets = set()
+        for folder, scales in self._fish.items():
+            for s in sorted(scales):
+                self._scale_jobs.append((folder, s))
+
+            paths = folder_paths(folder)
+            if self.registry.has(paths):
+                continue
+            # có trong atlas -> decode sheet (dùng chung nhiều loài) thay vì file rời
+            sheet = self._atlas_sheet(paths)
+            if sheet is not None:
+                if sheet not in sheets:
+                    sheets.add(sheet)
+                    full = self.registry.atlas.abs_path(sheet)
+                    self._decode.append(("sheet", sheet, full, self._pool.submit(_decode_rgba, full)))
+                continue
+            parts = {}
+            for p in folder_paths(folder):
+                try:
+                    full = resolve_path(p)
+                except FileNotFoundError as e:
+                    print("[WARN] preload skipped:", e)
+                    parts = None
+                    break
+                parts[p] = None
+                self._decode.append(("fish", folder, p, self._pool.submit(_decode_rgba, full)))
+            if parts:
+                self._fish_parts[folder] = parts
+
+        for path in self._images:
+            if self.assets.has_image(path) or not os.path.exists(path):
+                continue
+            self._decode.append(("image", path, path, self._pool.submit(_decode_rgba, path)))
+
+        self._total = len(self._decode) + len(self._scale_jobs) + len(self._scaled) + len(self._sized)
+        if self._total == 0:
+            self._finish()
+
+    @property
+    def progress(self) -> float:
+        if self.finished:
+            return 1.0
+        if self._total <= 0:
+            return 0.0
+        return self._done / self._total
+
+    def step(self, budget: float = 0.008) -> bool:
+        """Xử lý phần việc main thread trong `budget` giây. Trả True khi xong."""
+        if not self.started:
+            self.start()
+        if self.finished:
+            return True
+
+        t_end = time.perf_counter() + budget
+
+        # 1) convert_alpha các file đã decode xong (giữ thứ tự submit)
+        while self._decode:
+            kind, key, path, fut = self._decode[0]
+            if not fut.done():
+                return False
+            self._decode.pop(0)
+            self._done += 1
+            try:
+                size, raw = fut.result()
+                surf = pygame.image.frombytes(raw, size, "RGBA")
+                if kind != "sheet":
+                    surf = surf.convert_alpha()
+            except Exception as e:
+                print("[WARN] preload failed:", path, e)
+                if kind == "sheet":
+                    self.registry.atlas.discard(key)
+                self._fish_parts.pop(key, None)
+                continue
+
+            if kind == "image":
+                self.assets.put_image(path, surf)
+            elif kind == "sheet":
+                self.registry.register_sheet(key, surf)
+            else:
+                parts = self._fish_parts.get(key)
+                if parts is not None:
+                    parts[path] = surf
+                    if all(v is not None for v in parts.values()):
+                        self.registry.register(folder_paths(key), list(parts.values()))
+                        del self._fish_parts[key]
+
+            if time.perf_counter() >= t_end:
+                return False
+
+        # 2) tạo sẵn frame scale (cả 2 hướng flip) cho từng loài
+        while self._scale_jobs:
+            folder, scale = self._scale_jobs.pop(0)
+            self._done += 1
+            paths = folder_paths(folder)
+            if self.registry.has(paths) or self._atlas_sheet(paths) is not None:
+                self._warm_scale(self.registry.frames(paths), scale)
+            if time.perf_counter() >= t_end:
+                return False
+
+        # 3) ảnh tĩnh scale sẵn (drops chỉ còn blit)
+        while self._scaled:
+            path, scale = self._scaled.pop(0)
+            self._done += 1
+            self.assets.scaled_image(path, scale)
+            if time.perf_counter() >= t_end:
+                return False
+
+        while self._sized:
+            path, size = self._sized.pop(0)
+            self._done += 1
+            self.assets.image(path, size=size)
+            if time.perf_counter() >= t_end:
+                return False
+
+        self._finish()
+        return True
+
+    def _atlas_sheet(self, paths):
+        atlas = self.registry.atlas
+        return atlas.sheet_of(paths) if atlas is not None else None
+
+    def _warm_scale(self, fs, scale: float):
+        q = AnimatedSprite.quantize_scale(scale)
+        w = max(1, int(fs.base_w * q))
+        h = max(1, int(fs.base_h * q))
+        for i in range(len(fs.frames)):
+            for flip in (False, True):
+                self.registry.scaled_frame(fs, i, w, h, flip)
+
+    def _finish(self):
+        self.finished = True
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# =========================
+# Builders
+# =========================
+def _load_json(rel_path):
+    path = os.path.join(PROJECT_ROOT, rel_path)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f) or {}
+
+
+def add_ui(pre: Preloader, screen_w: int = 1280):
+    """Items (bản scale để vẽ drop) + HUD panel/icons đúng size vẽ (dùng chung mọi map)."""
+    from src.entities.falling_item import DRAW_SCALE
+
+    full = os.path.join(PROJECT_ROOT, ITEM_DIR)
+    if os.path.isdir(full):
+        for name in sorted(os.listdir(full)):
+            if name.lower().endswith(".png"):
+                pre.add_scaled_image(f"{ITEM_DIR}/{name}", DRAW_SCALE)
+
+    pre.add_sized_image(HUD_PANEL, (min(520, int(screen_w * 0.58)), 92))
+    for p, box in HUD_ICONS:
+        src = BAKED.source_size(p)
+        if src is None:
+            pre.add_image(p)
+        else:
+            pre.add_sized_image(p, fit_size(src, box))
+
+
+def build_map_preloader(app, map_data) -> Preloader:
+    """
+    Preload đúng những gì map sẽ dùng:
+    - cá địch của map trong fish_enemies.json (+ scale theo points)
+    - cá người chơi đã chọn (player_fish.json)
+    - items + HUD icons, nền map
+    """
+    from src.entities.prey import PreyFish
+    from src.entities.ai_fish import PredatorFish
+    from src.entities.player import PlayerFish
+
+    pre = Preloader(app.assets)
+    map_id = int((map_data or {}).get("id", 1))
+
+    enemies = _load_json("data/fish_enemies.json").get(f"map{map_id}", [])
+    for e in enemies:
+        pts = int(e.get("points", 10))
+        is_pred = e.get("role", "prey") == "predator" or e.get("ai", "wander") == "predator"
+        if is_pred:
+            scale = PredatorFish.scale_for_points(pts)
+        else:
+            scale = PreyFish.scale_for_points(pts)
+        pre.add_fish(e["path"], [scale])
+
+    # cá người chơi: size lúc đầu trận (+ dải pop khi ăn)
+    fish_db = _load_json("data/player_fish.json")
+    mode = int(app.runtime.get("mode", 1))
+    keys = ["selected_fish_p1"] + (["selected_fish_p2"] if mode == 2 else [])
+    start = PlayerFish.BASE_SCALE / PlayerFish.RENDER_DIV
+    peak = (PlayerFish.BASE_SCALE + PlayerFish.POP_MAX) / PlayerFish.RENDER_DIV
+    step = AnimatedSprite.scale_step
+    scales = [start + i * step for i in range(int((peak - start) / step) + 2)]
+    for k in keys:
+        fish_id = app.save.data.get(k, "fish01")
+        folder = fish_db.get(fish_id, {}).get("path", f"assets/fish/player/{fish_id}")
+        pre.add_fish(folder, scales)
+
+    add_ui(pre, app.width)
+    if map_data and map_data.get("bg"):
+        pre.add_image(map_data["bg"])
+
+    return pre
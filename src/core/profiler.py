@@ -0,0 +1,223 @@
+# src/core/profiler.py
+"""
+Profiler khung hình:
+- scope có tên (player_update, collisions, entity_draw, flip...) đo bằng perf_counter
+- mỗi frame cộng dồn thời gian từng scope, giữ cửa sổ trượt `window` frame
+  -> p50 / p95 / p99 theo ms
+- tắt (enabled=False) thì scope gần như không tốn gì
+- counter theo frame (count): vd. số entity vẽ / bị cull
+- dump ra CSV / JSON (theo đuôi file) để so sánh giữa các build
+
+Bật từ đầu + ghi trace khi thoát:  FISHGAME_PROFILE=trace.json python main.py
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+
+_now = time.perf_counter
+
+
+class _Scope:
+    """Context manager tái sử dụng (1 object / tên scope)."""
+
+    __slots__ = ("prof", "name", "t0")
+
+    def __init__(self, prof, name):
+        self.prof = prof
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self):
+        if self.prof.enabled:
+            self.t0 = _now()
+        return self
+
+    def __exit__(self, *exc):
+        prof = self.prof
+        if prof.enabled and self.t0:
+            cur = prof._frame
+            cur[self.name] = cur.get(self.name, 0.0) + (_now() - self.t0)
+            self.t0 = 0.0
+        return False
+
+
+def percentile(sorted_vals, q):
+    """Nội suy tuyến tính trên list đã sort, q trong [0, 100]."""
+    n = len(sorted_vals)
+    if n == 0:
+        return 0.0
+    k = (n - 1) * (q / 100.0)
+    i = int(k)
+    j = min(i + 1, n - 1)
+    return sorted_vals[i] + (sorted_vals[j] - sorted_vals[i]) * (k - i)
+
+
+class Profiler:
+    def __init__(self, window=240, max_trace=36000):
+        self.enabled = False
+        self.window = int(window)
+        self.max_trace = int(max_trace)
+
+        self._scopes = {}
+        self._frame = {}
+        self._frame_t0 = 0.0
+
+        # name -> deque[ms] (1 giá trị / frame)
+        self.samples = {}
+        # thứ tự xuất hiện (ổn định cho overlay / CSV)
+        self.order = []
+
+        # counters: name -> deque[int] (1 giá trị / frame)
+        self._counts = {}
+        self.counters = {}
+
+        # trace đầy đủ để dump (chỉ giữ khi trace_path có giá trị)
+        self.trace_path = None
+        self.trace = []
+        self.frames = 0
+
+    # =========================
+    # Control
+    # =========================
+    def enable(self, on=True):
+        self.enabled = bool(on)
+        self._frame = {}
+        self._counts = {}
+        self._frame_t0 = 0.0
+
+    def toggle(self):
+        self.enable(not self.enabled)
+        return self.enabled
+
+    def reset(self):
+        self.samples.clear()
+        self.order.clear()
+        self.counters.clear()
+        self.trace.clear()
+        self.frames = 0
+
+    def set_trace(self, path):
+        self.trace_path = path
+        if path:
+            self.enable(True)
+
+    # =========================
+    # Measure
+    # =========================
+    def scope(self, name):
+        s = self._scopes.get(name)
+        if s is None:
+            s = self._scopes[name] = _Scope(self, name)
+        return s
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame = {}
+            self._counts = {}
+            self._frame_t0 = _now()
+
+    def end_frame(self):
+        if not self.enabled or not self._frame_t0:
+            return
+        cur = self._frame
+        cur["frame"] = _now() - self._frame_t0
+        self._frame_t0 = 0.0
+        self.frames += 1
+
+        for name, sec in cur.items():
+            dq = self.samples.get(name)
+            if dq is None:
+                dq = self.samples[name] = deque(maxlen=self.window)
+                self.order.append(name)
+            dq.append(sec * 1000.0)
+
+        counts = self._counts
+        for name, n in counts.items():
+            dq = self.counters.get(name)
+            if dq is None:
+                dq = self.counters[name] = deque(maxlen=self.window)
+            dq.append(n)
+
+        if self.trace_path and len(self.trace) < self.max_trace:
+            row = {k: round(v * 1000.0, 4) for k, v in cur.items()}
+            row.update(counts)
+            self.trace.append(row)
+
+    # =========================
+    # Report
+    # =========================
+    def stats(self, name):
+        vals = sorted(self.samples.get(name, ()))
+        if not vals:
+            return {"n": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "n": len(vals),
+            "mean": sum(vals) / len(vals),
+            "p50": percentile(vals, 50),
+            "p95": percentile(vals, 95),
+            "p99": percentile(vals, 99),
+            "max": vals[-1],
+        }
+
+    def report(self):
+        """[(name, stats)] - 'frame' đứng đầu."""
+        names = sorted(self.order, key=lambda n: (n != "frame", self.order.index(n)))
+        return [(n, self.stats(n)) for n in names]
+
+    def counter_report(self):
+        """[(name, last, mean)] của các counter."""
+        out = []
+        for name, dq in self.counters.items():
+            if dq:
+                out.append((name, dq[-1], sum(dq) / len(dq)))
+        return out
+
+    def dump(self, path=None):
+        """Ghi summary (+ trace từng frame nếu có) ra .json hoặc .csv."""
+        path = path or self.trace_path
+        if not path:
+            return None
+
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+
+        summary = {n: {k: round(v, 4) for k, v in s.items()} for n, s in self.report()}
+        counters = {n: round(mean, 3) for n, _, mean in self.counter_report()}
+
+        try:
+            if path.lower().endswith(".csv"):
+                names = [n for n, _ in self.report()] + list(counters)
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    w = csv.writer(f)
+                    w.writerow(["frame_index"] + names)
+                    for i, fr in enumerate(self.trace):
+                        w.writerow([i] + [fr.get(n, 0.0) for n in names])
+                # summary đi kèm cạnh file CSV
+                with open(path[:-4] + "_summary.json", "w", encoding="utf-8") as f:
+                    json.dump({"summary": summary, "counters": counters}, f, indent=2)
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {
+                            "frames": self.frames,
+                            "window": self.window,
+                            "summary": summary,
+                            "counters": counters,
+                            "trace": self.trace,
+                        },
+                        f,
+                    )
+        except Exception as e:
+            print("[WARN] Profiler dump failed:", e)
+            return None
+        return path
+
+
+# global (World / scenes / GameApp dùng chung)
+PROFILER = Profiler()
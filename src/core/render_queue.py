@@ -0,0 +1,63 @@
+# src/core/render_queue.py
+"""
+Render queue cho world entities:
+- entity.draw(...) nhận 1 layer thay cho screen, layer.blit(surf, dest) chỉ ghi lại
+- flush(screen): mỗi layer (drops -> prey -> predators -> players -> floating text)
+  1 lần Surface.blits, giữ đúng thứ tự push trong layer
+-> vài lần gọi blit / frame thay vì 100-200 lần screen.blit từ Python.
+Counter (PROFILER): "blits" = số surface đã vẽ, "blit_calls" = số lần gọi blit/blits thật.
+"""
+from src.core.profiler import PROFILER
+
+LAYER_DROPS = 0
+LAYER_PREY = 1
+LAYER_PREDATORS = 2
+LAYER_PLAYERS = 3
+LAYER_TEXT = 4
+LAYER_COUNT = 5
+
+
+class RenderLayer:
+    """Giả screen cho entity.draw: blit() chỉ thêm vào hàng đợi."""
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is None and not special_flags:
+            self.items.append((source, dest))
+        else:
+            self.items.append((source, dest, area, special_flags))
+
+    def __len__(self):
+        return len(self.items)
+
+
+class RenderQueue:
+    def __init__(self, layers=LAYER_COUNT):
+        self.layers = [RenderLayer() for _ in range(layers)]
+
+    def layer(self, index: int) -> RenderLayer:
+        return self.layers[index]
+
+    def clear(self):
+        for layer in self.layers:
+            layer.items.clear()
+
+    def flush(self, screen):
+        """Vẽ hết theo thứ tự layer rồi xoá hàng đợi. Trả về số surface đã vẽ."""
+        total = calls = 0
+        for layer in self.layers:
+            items = layer.items
+            if not items:
+                continue
+            screen.blits(items, doreturn=False)
+            total += len(items)
+            calls += 1
+            items.clear()
+
+        PROFILER.count("blits", total)
+        PROFILER.count("blit_calls", calls)
+        return total
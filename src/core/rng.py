@@ -0,0 +1,19 @@
+# src/core/rng.py
+"""
+Stream RNG độc lập cho mô phỏng (thay 1 RNG chung cả trận):
+- derive(seed, "spawner") -> random.Random riêng từng hệ thống, chỉ phụ thuộc
+  (seed trận, tên) -> thêm / bớt / đổi thứ tự hệ thống khác không làm lệch stream này
+- child(rng) -> stream riêng 1 entity, seed rút từ stream cha lúc spawn
+  -> thứ tự update giữa các entity không làm lệch số ngẫu nhiên của nhau
+"""
+import random
+
+
+def derive(seed, name: str) -> random.Random:
+    # seed kiểu str: Random băm sha512 -> như nhau giữa các lần chạy / máy
+    # (không phụ thuộc PYTHONHASHSEED)
+    return random.Random(f"{seed}:{name}")
+
+
+def child(rng) -> random.Random:
+    return random.Random(rng.getrandbits(64))
@@ -0,0 +1,113 @@
+# src/core/sampler.py
+"""
+Chọn ngẫu nhiên theo trọng số (spawn cá / drop), dùng chung cho Spawner + DropSpawner:
+- AliasTable: bảng alias Vose, build O(n) 1 lần, pick O(1) không phụ thuộc số entry
+  -> cho bảng cố định (enemy theo map / khoảng pp, drop weights)
+- CumulativeTable: trọng số cộng dồn + bisect, build rẻ hơn, pick O(log n)
+  -> cho trọng số đổi liên tục (build lại mỗi lần chọn)
+Cả 2: pick(rng) -> 1 item, sample(rng, k) -> k item (có lặp), mỗi item rút đúng
+1 rng.random(). Trọng số <= 0 không bao giờ được chọn; tổng <= 0 -> pick() = None.
+"""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+
+def _clean(weights):
+    return [w if w > 0 else 0.0 for w in map(float, weights)]
+
+
+class AliasTable:
+    __slots__ = ("items", "prob", "alias", "n")
+
+    def __init__(self, items, weights):
+        items = list(items)
+        weights = _clean(weights)
+        if len(items) != len(weights):
+            raise ValueError("items / weights length mismatch")
+        total = sum(weights)
+        if total <= 0:
+            items, weights = [], []
+
+        n = len(items)
+        self.items = items
+        self.n = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        if not n:
+            return
+
+        # Vose: chia mỗi ô 1/n thành phần của i + phần "mượn" từ alias[i]
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # còn sót do sai số float -> ô đầy
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return self.n
+
+    def pick(self, rng=random):
+        n = self.n
+        if not n:
+            return None
+        # 1 số random: phần nguyên chọn ô, phần lẻ chọn item / alias của ô
+        u = rng.random() * n
+        i = int(u)
+        if i >= n:  # random() * n có thể làm tròn lên đúng n
+            i = n - 1
+        return self.items[i] if u - i < self.prob[i] else self.items[self.alias[i]]
+
+    def sample(self, rng=random, k=1):
+        n = self.n
+        if not n:
+            return []
+        items, prob, alias = self.items, self.prob, self.alias
+        rnd = rng.random
+        last = n - 1
+        out = []
+        for _ in range(k):
+            u = rnd() * n
+            i = int(u)
+            if i > last:
+                i = last
+            out.append(items[i] if u - i < prob[i] else items[alias[i]])
+        return out
+
+
+class CumulativeTable:
+    __slots__ = ("items", "cum", "total")
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.set_weights(weights)
+
+    def set_weights(self, weights):
+        """Đổi trọng số (cùng danh sách items), O(n)."""
+        weights = _clean(weights)
+        if len(weights) != len(self.items):
+            raise ValueError("items / weights length mismatch")
+        self.cum = list(accumulate(weights))
+        self.total = self.cum[-1] if self.cum else 0.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def pick(self, rng=random):
+        if self.total <= 0:
+            return None
+        # bisect_right: entry trọng số 0 (cum bằng entry trước) không bao giờ trúng
+        return self.items[bisect_right(self.cum, rng.random() * self.total, 0, len(self.cum) - 1)]
+
+    def sample(self, rng=random, k=1):
+        if self.total <= 0:
+            return []
+        return rng.choices(self.items, cum_weights=self.cum, k=k)
@@ -1,4 +1,10 @@
 class Scene:
+    # frame scheduler (src/core/frame_scheduler.py):
+    # animating = False -> scene tĩnh, chỉ vẽ lại khi có event / invalidate
+    # fps = None -> Settings.FPS
+    animating = True
+    fps = None
+
     def __init__(self, app):
         self.app = app
 
@@ -21,6 +21,23 @@ class SceneManager:
         ).convert()
         self._fade_surf.fill((0, 0, 0))
 
+    @property
+    def transitioning(self) -> bool:
+        # đang fade -> set_scene sẽ bị bỏ qua
+        return self.fade_enabled and self._fade_state != "idle"
+
+    @property
+    def animating(self) -> bool:
+        # đang fade cũng phải vẽ liên tục
+        return self.scene is None or self.transitioning or bool(self.scene.animating)
+
+    @property
+    def fps(self):
+        # fade chạy theo fps mặc định, không theo scene
+        if self.scene is None or self.transitioning:
+            return None
+        return self.scene.fps
+
     def set_scene(self, scene, **kwargs):
         # nếu chưa có scene hoặc tắt fade -> vào thẳng
         if self.scene is None or not self.fade_enabled:
@@ -1,7 +1,11 @@
 
+import os
+
 import pygame
 from src.core.scene import Scene
+from src.core.sprite_cache import PROJECT_ROOT
 from src.ui.image_button import ImageButton
+from src.ui.bg import draw_backdrop
 
 
 # =========================
@@ -12,27 +16,18 @@ class Settings:
     WIDTH = 1280
     HEIGHT = 720
     FPS = 60
+    # mô phỏng gameplay: bước cố định SIM_HZ, tối đa MAX_SIM_STEPS bước / frame
+    SIM_HZ = 60
+    MAX_SIM_STEPS = 5
+    # replay mỗi trận (src/world/replay.py), giữ REPLAY_KEEP file mới nhất
+    RECORD_REPLAYS = True
+    REPLAY_DIR = os.path.join(PROJECT_ROOT, "data", "replays")
+    REPLAY_KEEP = 20
 
 
 # =========================
 # Helpers
 # =========================
-def draw_cover(screen, image, w, h, alpha=255):
-    if image is None:
-        return
-    iw, ih = image.get_width(), image.get_height()
-    if iw <= 0 or ih <= 0:
-        return
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
-    if alpha < 255:
-        surf.set_alpha(alpha)
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
-
-
 def clamp01(v):
     return 0.0 if v < 0 else 1.0 if v > 1 else v
 
@@ -117,6 +112,11 @@ class Toggle:
 # SETTINGS SCENE
 # =========================
 class SettingsScene(Scene):
+    @property
+    def animating(self):
+        # toast "Applied!" đếm ngược; slider / toggle đi theo event
+        return self.toast_t > 0
+
     def on_enter(self, **kwargs):
         self.bg = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
 
@@ -228,11 +228,7 @@ class SettingsScene(Scene):
     # Draw
     # =========================
     def draw(self, screen):
-        draw_cover(screen, self.bg, self.app.width, self.app.height)
-
-        overlay = pygame.Surface((self.app.width, self.app.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 110))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 0, 0, 110))
 
         title = self.h1.render("SETTINGS", True, self.app.theme["text"])
         screen.blit(title, (70, 70))
@@ -0,0 +1,265 @@
+# src/core/sprite_cache.py
+import os
+from collections import OrderedDict
+
+import pygame
+
+from src.core.atlas import ATLAS
+from src.core.profiler import PROFILER
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def resolve_path(p: str) -> str:
+    """
+    Không dùng os.getcwd() (dễ lỗi khi chạy exe / chạy từ thư mục khác)
+    -> thử theo PROJECT_ROOT trước, cwd sau.
+    """
+    p = p.replace("\\", "/")
+
+    if os.path.isabs(p) and os.path.exists(p):
+        return p
+
+    candidate = os.path.join(PROJECT_ROOT, p).replace("\\", "/")
+    if os.path.exists(candidate):
+        return candidate
+
+    candidate2 = os.path.abspath(p).replace("\\", "/")
+    if os.path.exists(candidate2):
+        return candidate2
+
+    raise FileNotFoundError(f"SpriteRegistry: cannot find frame path: {p}")
+
+
+def folder_paths(fish_folder: str):
+    """Đường dẫn 2 frame bơi chuẩn của 1 thư mục cá."""
+    return (f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png")
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+# =========================
+# Frame set (frames gốc của 1 con cá)
+# =========================
+class FrameSet:
+    """Frames gốc (đã convert_alpha) của 1 loài cá, dùng chung mọi instance."""
+
+    def __init__(self, key, frames):
+        if not frames:
+            raise ValueError("FrameSet: frames is empty.")
+        self.key = key
+        self.frames = list(frames)
+        self.base_w = self.frames[0].get_width()
+        self.base_h = self.frames[0].get_height()
+        self.nbytes = sum(surface_bytes(f) for f in self.frames)
+
+
+# =========================
+# Scaled frame LRU (toàn cục, giới hạn theo byte + số frame)
+# =========================
+class ScaledFrameCache:
+    """
+    LRU cho frame đã scale/flip (OrderedDict -> get / put / evict đều O(1)):
+    - key = (frameset key, index, w, h, flip_x)
+    - hit -> move_to_end
+    - vượt max_bytes hoặc max_items (0 = không giới hạn số) -> pop cũ nhất
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_items=600):
+        self.max_bytes = int(max_bytes)
+        self.max_items = int(max_items or 0)
+        self._items = OrderedDict()
+        self.resident_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0
+
+        # giá trị lúc profile() trước (counter theo frame)
+        self._last = (0, 0, 0, 0)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def _over(self) -> bool:
+        if self.resident_bytes > self.max_bytes:
+            return True
+        return bool(self.max_items) and len(self._items) > self.max_items
+
+    def get(self, key):
+        surf = self._items.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def put(self, key, surf):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.resident_bytes -= surface_bytes(old)
+
+        self._items[key] = surf
+        self.resident_bytes += surface_bytes(surf)
+
+        # giữ lại ít nhất frame vừa thêm (kể cả khi 1 frame > budget)
+        while len(self._items) > 1 and self._over():
+            _, ev = self._items.popitem(last=False)
+            self.resident_bytes -= surface_bytes(ev)
+            self.evictions += 1
+
+    def clear(self):
+        self._items.clear()
+        self.resident_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "items": len(self._items),
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "prefetched": self.prefetched,
+        }
+
+    def profile(self, prof=PROFILER):
+        """Đẩy hit / miss / evict / prefetch của frame vừa rồi + dung lượng (KB) vào profiler."""
+        if not prof.enabled:
+            return
+        now = (self.hits, self.misses, self.evictions, self.prefetched)
+        last = self._last
+        self._last = now
+        prof.count("sprite_hits", now[0] - last[0])
+        prof.count("sprite_misses", now[1] - last[1])
+        prof.count("sprite_evictions", now[2] - last[2])
+        prof.count("sprite_prefetched", now[3] - last[3])
+        prof.count("sprite_cache_kb", self.resident_bytes // 1024)
+
+
+# =========================
+# Registry (process-wide)
+# =========================
+class SpriteRegistry:
+    """
+    Kho frame dùng chung toàn process:
+    - frames(paths): load + convert_alpha đúng 1 lần cho mỗi bộ frame
+      (có trong atlas -> load cả sheet, đăng ký mọi loài trong sheet)
+    - scaled_frame(...): frame đã scale/flip lấy qua LRU chung
+    - prefetch(...): tạo sẵn frame sắp dùng (không tính hit / miss)
+    """
+
+    def __init__(self, max_scaled_bytes=64 * 1024 * 1024, max_scaled_items=600, atlas=None):
+        self._sets = {}
+        self.scaled = ScaledFrameCache(max_scaled_bytes, max_scaled_items)
+        self.atlas = atlas
+        self.disk_loads = 0
+
+    @staticmethod
+    def key_for(image_paths):
+        return tuple(p.replace("\\", "/") for p in image_paths)
+
+    def has(self, image_paths) -> bool:
+        return self.key_for(image_paths) in self._sets
+
+    def register(self, image_paths, surfaces) -> FrameSet:
+        """Đăng ký frames đã có sẵn (vd: preload decode ở thread khác)."""
+        key = self.key_for(image_paths)
+        fs = FrameSet(key, surfaces)
+        self._sets[key] = fs
+        return fs
+
+    def register_sheet(self, sheet: str, surf=None):
+        """Cắt 1 sheet atlas, đăng ký các loài chưa có (surf = sheet đã decode sẵn)."""
+        for key, surfaces in self.atlas.cut(sheet, surf).items():
+            if key not in self._sets:
+                self._sets[key] = FrameSet(key, surfaces)
+
+    def frames(self, image_paths) -> FrameSet:
+        key = self.key_for(image_paths)
+        fs = self._sets.get(key)
+        if fs is not None:
+            return fs
+
+        sheet = self.atlas.sheet_of(key) if self.atlas is not None else None
+        if sheet is not None:
+            try:
+                self.register_sheet(sheet)
+                return self._sets[key]
+            except Exception as e:
+                print("[WARN] fish atlas failed, loading loose frames:", sheet, e)
+                self.atlas.discard(sheet)
+
+        surfaces = []
+        for p in key:
+            surfaces.append(pygame.image.load(resolve_path(p)).convert_alpha())
+            self.disk_loads += 1
+
+        if not surfaces:
+            raise ValueError("SpriteRegistry: image_paths is empty or cannot load any frames.")
+
+        fs = FrameSet(key, surfaces)
+        self._sets[key] = fs
+        return fs
+
+    def scaled_frame(self, fs: FrameSet, index: int, w: int, h: int, flip_x: bool):
+        img = fs.frames[index]
+
+        # đúng size gốc + không flip -> dùng thẳng frame gốc
+        if not flip_x and (w, h) == (fs.base_w, fs.base_h):
+            return img
+
+        key = (fs.key, index, w, h, flip_x)
+        cached = self.scaled.get(key)
+        if cached is not None:
+            return cached
+
+        img = self._render(img, w, h, flip_x)
+        self.scaled.put(key, img)
+        return img
+
+    def prefetch(self, fs: FrameSet, index: int, w: int, h: int, flip_x: bool) -> bool:
+        """Tạo sẵn frame nếu chưa có trong LRU -> True nếu vừa phải scale."""
+        if not flip_x and (w, h) == (fs.base_w, fs.base_h):
+            return False
+        key = (fs.key, index, w, h, flip_x)
+        if key in self.scaled:
+            return False
+        self.scaled.put(key, self._render(fs.frames[index], w, h, flip_x))
+        self.scaled.prefetched += 1
+        return True
+
+    @staticmethod
+    def _render(img, w, h, flip_x):
+        if (img.get_width(), img.get_height()) != (w, h):
+            img = pygame.transform.smoothscale(img, (w, h))
+        if flip_x:
+            img = pygame.transform.flip(img, True, False)
+        return img
+
+    def clear(self):
+        self._sets.clear()
+        self.scaled.clear()
+
+    def stats(self) -> dict:
+        out = {
+            "frame_sets": len(self._sets),
+            "base_bytes": sum(fs.nbytes for fs in self._sets.values()),
+            "disk_loads": self.disk_loads,
+        }
+        out.update({f"scaled_{k}": v for k, v in self.scaled.stats().items()})
+        if self.atlas is not None:
+            out.update({f"atlas_{k}": v for k, v in self.atlas.stats().items()})
+        return out
+
+
+# instance dùng chung
+SPRITES = SpriteRegistry(atlas=ATLAS)
@@ -2,6 +2,7 @@
 import random
 import pygame
 from src.entities.animated_sprite import AnimatedSprite
+from src.ui.text import TEXT
 
 
 class PredatorFish:
@@ -13,9 +14,30 @@ class PredatorFish:
     - boss có thêm "dash" ngắn khi áp sát -> kịch tính, có thể chết
     """
 
-    def __init__(self, pos, fish_folder, points=80):
+    __slots__ = (
+        "pos", "prev_pos", "vel", "alive", "rng", "sprite",
+        "points", "is_boss", "scale", "hit_radius", "speed", "aggro_radius",
+        # chase burst
+        "_chase_on", "_chase_off", "_chase_on_cd", "_chase_off_cd",
+        # boss dash
+        "_dash_t", "_dash_cd", "_dash_time", "_dash_left", "_dash_speed",
+        # wander
+        "_wander_t", "_wander_cd", "_wander_dir", "_wander_gain", "_steer_gain",
+    )
+
+    def __init__(self, pos, fish_folder=None, points=80, rng=None):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2(0, 0)
+        self.sprite = None
+        self.reset(pos, fish_folder, points, rng)
+
+    def reset(self, pos, fish_folder=None, points=80, rng=None):
+        """Đặt lại toàn bộ state (object lấy lại từ pool)."""
+        self.rng = rng or random
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.vel.update(0, 0)
 
         self.points = int(points)
         self.alive = True
@@ -30,8 +52,7 @@ class PredatorFish:
         # =========================
         p_vis = max(1, min(320, self.points))
 
-        self.scale = 1.00 + (p_vis / 320.0) * 0.95   # ~1.00 -> ~1.95
-        self.scale = max(0.95, min(self.scale, 2.05))
+        self.scale = self.scale_for_points(self.points)
         self.hit_radius = 18.0 * self.scale
 
         # =========================
@@ -60,13 +81,13 @@ class PredatorFish:
         # normal
         self._chase_on = 0.0
         self._chase_off = 0.0
-        self._chase_on_cd = random.uniform(1.0, 1.6)   # thời gian đuổi
-        self._chase_off_cd = random.uniform(0.5, 0.9)  # thời gian nghỉ
+        self._chase_on_cd = self.rng.uniform(1.0, 1.6)   # thời gian đuổi
+        self._chase_off_cd = self.rng.uniform(0.5, 0.9)  # thời gian nghỉ
 
         # boss: đuổi lâu hơn, nghỉ ít hơn
         if self.is_boss:
-            self._chase_on_cd = random.uniform(1.4, 2.1)
-            self._chase_off_cd = random.uniform(0.28, 0.55)
+            self._chase_on_cd = self.rng.uniform(1.4, 2.1)
+            self._chase_off_cd = self.rng.uniform(0.28, 0.55)
 
         # steering gains
         self._steer_gain = 4.2
@@ -77,26 +98,36 @@ class PredatorFish:
 
         # wander
         self._wander_t = 0.0
-        self._wander_cd = random.uniform(0.9, 1.8)
+        self._wander_cd = self.rng.uniform(0.9, 1.8)
         self._wander_dir = self._rand_dir()
 
         # =========================
         # DASH (boss only)
         # =========================
-        self._dash_cd = random.uniform(2.0, 3.2) if self.is_boss else 999.0
+        self._dash_cd = self.rng.uniform(2.0, 3.2) if self.is_boss else 999.0
         self._dash_t = 0.0
         self._dash_left = 0.0
         self._dash_time = 0.18 if self.is_boss else 0.0
         self._dash_speed = 420.0 if self.is_boss else 0.0  # impulse speed
 
-        # sprite
-        self.sprite = AnimatedSprite(
-            [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"],
-            fps=6
-        )
+        # sprite (None khi mô phỏng headless), dùng lại AnimatedSprite cũ nếu có
+        if fish_folder:
+            paths = [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"]
+            if self.sprite is None:
+                self.sprite = AnimatedSprite(paths, fps=6)
+            else:
+                self.sprite.reset(paths, fps=6)
+        else:
+            self.sprite = None
+
+    @staticmethod
+    def scale_for_points(points) -> float:
+        p_vis = max(1, min(320, int(points)))
+        scale = 1.00 + (p_vis / 320.0) * 0.95   # ~1.00 -> ~1.95
+        return max(0.95, min(scale, 2.05))
 
     def _rand_dir(self):
-        v = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        v = pygame.Vector2(self.rng.uniform(-1, 1), self.rng.uniform(-1, 1))
         if v.length_squared() > 0.01:
             v = v.normalize()
         else:
@@ -107,6 +138,12 @@ class PredatorFish:
         r = self.hit_radius
         return pygame.Rect(int(self.pos.x - r), int(self.pos.y - r), int(r * 2), int(r * 2))
 
+    def draw_radius(self):
+        """Bán kính bao hình vẽ (dùng cho culling, không cần get_image)."""
+        if self.sprite:
+            return 0.5 * max(self.sprite.base_w, self.sprite.base_h) * self.scale
+        return self.hit_radius
+
     def _update_burst_state(self, dt):
         # đang đuổi
         if self._chase_on > 0:
@@ -115,9 +152,9 @@ class PredatorFish:
                 self._chase_off = self._chase_off_cd
                 # random lại CD
                 if self.is_boss:
-                    self._chase_off_cd = random.uniform(0.28, 0.55)
+                    self._chase_off_cd = self.rng.uniform(0.28, 0.55)
                 else:
-                    self._chase_off_cd = random.uniform(0.5, 0.9)
+                    self._chase_off_cd = self.rng.uniform(0.5, 0.9)
             return
         # đang nghỉ
         if self._chase_off > 0:
@@ -125,9 +162,9 @@ class PredatorFish:
             if self._chase_off <= 0:
                 self._chase_on = self._chase_on_cd
                 if self.is_boss:
-                    self._chase_on_cd = random.uniform(1.4, 2.1)
+                    self._chase_on_cd = self.rng.uniform(1.4, 2.1)
                 else:
-                    self._chase_on_cd = random.uniform(1.0, 1.6)
+                    self._chase_on_cd = self.rng.uniform(1.0, 1.6)
             return
         # init lần đầu
         self._chase_on = self._chase_on_cd
@@ -152,7 +189,7 @@ class PredatorFish:
         # chỉ dash khi khá gần để có cảm giác "lao vào"
         if dist < 260 and self._dash_t >= self._dash_cd and self._chase_off <= 0:
             self._dash_t = 0.0
-            self._dash_cd = random.uniform(1.8, 3.0)
+            self._dash_cd = self.rng.uniform(1.8, 3.0)
             self._dash_left = self._dash_time
 
     def update(self, dt, world_w, world_h, players):
@@ -209,7 +246,7 @@ class PredatorFish:
             self._wander_t += dt
             if self._wander_t >= self._wander_cd:
                 self._wander_t = 0.0
-                self._wander_cd = random.uniform(0.9, 1.8)
+                self._wander_cd = self.rng.uniform(0.9, 1.8)
                 self._wander_dir = self._rand_dir()
 
             desired = self._wander_dir * (self.speed * (0.55 if self.is_boss else 0.50))
@@ -222,7 +259,7 @@ class PredatorFish:
                 self.vel = self.vel.normalize() * maxv
 
         # flip
-        if self.vel.x != 0:
+        if self.sprite and self.vel.x != 0:
             self.sprite.flip_x = self.vel.x < 0
 
         # move
@@ -230,21 +267,19 @@ class PredatorFish:
         self.pos.x = max(0, min(world_w, self.pos.x))
         self.pos.y = max(0, min(world_h, self.pos.y))
 
-        self.sprite.update(dt)
+        if self.sprite:
+            self.sprite.update(dt)
 
     def draw(self, screen, camera, font):
-        if not self.alive:
+        if not self.alive or self.sprite is None:
             return
 
         img = self.sprite.get_image(scale=self.scale)
-        rect = img.get_rect(center=camera.world_to_screen(self.pos))
+        rect = img.get_rect(center=camera.entity_to_screen(self))
         screen.blit(img, rect)
 
         if font:
-            p = camera.world_to_screen(self.pos)
-            label = str(self.points)
-            txt = font.render(label, True, (255, 255, 255))
-            out = font.render(label, True, (0, 0, 0))
+            p = camera.entity_to_screen(self)
+            label = TEXT.shadow(font, str(self.points), (255, 255, 255), offset=1)
             y = int(p.y - rect.height // 2 - 12)
-            screen.blit(out, out.get_rect(center=(int(p.x) + 1, y + 1)))
-            screen.blit(txt, txt.get_rect(center=(int(p.x), y)))
+            screen.blit(label, label.get_rect(center=(int(p.x), y)))
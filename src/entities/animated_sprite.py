@@ -1,66 +1,57 @@
-import os
-import pygame
+from src.core.sprite_cache import SPRITES
 
 
 class AnimatedSprite:
     """
-    1) Không dùng os.getcwd() (dễ lỗi khi chạy exe / chạy từ thư mục khác)
-       -> dùng PROJECT_ROOT tính theo vị trí file này.
-    2) Cache scale không phình vô hạn
-       -> quantize scale + giới hạn cache (simple LRU-like).
+    View nhẹ trên frames dùng chung (src/core/sprite_cache.py):
+    1) Frames gốc load 1 lần cho mỗi bộ frame (không load lại mỗi lần spawn).
+    2) Frame đã scale/flip nằm trong LRU toàn cục (giới hạn theo byte)
+       -> cá cùng loài dùng chung, không nhân bản cache theo instance.
+    Mỗi instance chỉ giữ index / timer / flip_x (+ fps).
     """
 
-    PROJECT_ROOT = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "..")
-    )
+    __slots__ = ("_registry", "_set", "fps", "index", "timer", "flip_x")
+
+    scale_step = 0.05
+
+    def __init__(self, image_paths, fps=8, registry=None):
+        self._registry = registry or SPRITES
+        self.reset(image_paths, fps)
+
+    def reset(self, image_paths, fps=8):
+        """Về frame đầu với bộ frame mới (cá lấy lại từ pool)."""
+        self._set = self._registry.frames(image_paths)
 
-    def __init__(self, image_paths, fps=8, max_cache=600, scale_step=0.05):
-        self.frames = []
         self.fps = max(1, int(fps))
         self.index = 0
         self.timer = 0.0
         self.flip_x = False
 
-        self.max_cache = int(max_cache)
-        self.scale_step = float(scale_step)
-
-        # cache: key -> Surface
-        self._cache = {}
-        # order list để pop old cache (nhẹ, đủ dùng)
-        self._cache_order = []
-
-        for p in image_paths:
-            p = self._resolve_path(p)
-            img = pygame.image.load(p).convert_alpha()
-            self.frames.append(img)
-
-        if not self.frames:
-            raise ValueError("AnimatedSprite: image_paths is empty or cannot load any frames.")
-
-        self.base_w = self.frames[0].get_width()
-        self.base_h = self.frames[0].get_height()
+    def __deepcopy__(self, memo):
+        """Bản sao (snapshot replay): frames / registry dùng chung, chỉ copy state riêng."""
+        cp = AnimatedSprite.__new__(AnimatedSprite)
+        cp._registry = self._registry
+        cp._set = self._set
+        cp.fps = self.fps
+        cp.index = self.index
+        cp.timer = self.timer
+        cp.flip_x = self.flip_x
+        return cp
 
     # =========================
-    # Path resolver
+    # Shared data
     # =========================
-    def _resolve_path(self, p: str) -> str:
-        # normalize slash
-        p = p.replace("\\", "/")
-
-        if os.path.isabs(p) and os.path.exists(p):
-            return p
+    @property
+    def frames(self):
+        return self._set.frames
 
-        # thử ghép theo PROJECT_ROOT (ổn định hơn cwd)
-        candidate = os.path.join(self.PROJECT_ROOT, p).replace("\\", "/")
-        if os.path.exists(candidate):
-            return candidate
+    @property
+    def base_w(self) -> int:
+        return self._set.base_w
 
-        # fallback: đôi khi chạy dev vẫn đúng cwd
-        candidate2 = os.path.abspath(p).replace("\\", "/")
-        if os.path.exists(candidate2):
-            return candidate2
-
-        raise FileNotFoundError(f"AnimatedSprite: cannot find frame path: {p}")
+    @property
+    def base_h(self) -> int:
+        return self._set.base_h
 
     # =========================
     # Update
@@ -70,52 +61,45 @@ class AnimatedSprite:
         frame_time = 1.0 / self.fps
         while self.timer >= frame_time:
             self.timer -= frame_time
-            self.index = (self.index + 1) % len(self.frames)
+            self.index = (self.index + 1) % len(self._set.frames)
 
     # =========================
-    # Cache helpers
+    # Scale helpers
     # =========================
-    def _quantize_scale(self, s: float) -> float:
+    @classmethod
+    def quantize_scale(cls, s: float) -> float:
         s = max(0.25, min(5.0, float(s)))
-        step = self.scale_step if self.scale_step > 0 else 0.05
+        step = cls.scale_step if cls.scale_step > 0 else 0.05
         # làm tròn theo step để tránh cache phình
         return round(s / step) * step
 
-    def _cache_put(self, key, surf):
-        if key in self._cache:
-            return
-
-        self._cache[key] = surf
-        self._cache_order.append(key)
-
-        # giới hạn cache: pop các key cũ nhất
-        while len(self._cache_order) > self.max_cache:
-            old = self._cache_order.pop(0)
-            self._cache.pop(old, None)
-
     # =========================
     # Render frame
     # =========================
-    def get_image(self, scale=1.0):
-        scale = self._quantize_scale(scale)
-
-        w = max(1, int(self.base_w * scale))
-        h = max(1, int(self.base_h * scale))
-        key = (self.index, w, h, self.flip_x)
-
-        cached = self._cache.get(key)
-        if cached is not None:
-            return cached
+    def scaled_size(self, scale=1.0):
+        """(w, h) của frame vẽ ở scale (đã quantize) - giống get_image."""
+        scale = self.quantize_scale(scale)
+        return max(1, int(self._set.base_w * scale)), max(1, int(self._set.base_h * scale))
 
-        img = self.frames[self.index]
-
-        # scale
-        if (img.get_width(), img.get_height()) != (w, h):
-            img = pygame.transform.smoothscale(img, (w, h))
-
-        # flip
-        if self.flip_x:
-            img = pygame.transform.flip(img, True, False)
-
-        self._cache_put(key, img)
-        return img
+    def get_image(self, scale=1.0):
+        w, h = self.scaled_size(scale)
+        return self._registry.scaled_frame(self._set, self.index, w, h, self.flip_x)
+
+    def prefetch(self, scales, flips=(False,), limit=1) -> int:
+        """
+        Scale sẵn mọi frame cho các scale / flip sắp vẽ (theo thứ tự ưu tiên),
+        tối đa `limit` surface mỗi lần gọi -> rải chi phí smoothscale ra nhiều tick.
+        """
+        made = 0
+        if limit <= 0:
+            return made
+        fs = self._set
+        for s in scales:
+            w, h = self.scaled_size(s)
+            for flip in flips:
+                for i in range(len(fs.frames)):
+                    if self._registry.prefetch(fs, i, w, h, flip):
+                        made += 1
+                        if made >= limit:
+                            return made
+        return made
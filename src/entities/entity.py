@@ -2,8 +2,13 @@ import pygame
 
 class Entity:
     """Base entity class for OOP clean architecture."""
+
+    # __slots__: không có __dict__ / instance (subclass cũng khai báo slots riêng)
+    __slots__ = ("pos", "prev_pos", "vel", "alive")
+
     def __init__(self, pos):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = pygame.Vector2(pos)   # vị trí tick trước (nội suy lúc vẽ)
         self.vel = pygame.Vector2(0, 0)
         self.alive = True
 
@@ -0,0 +1,34 @@
+import math
+from src.entities.entity import Entity
+
+ASSET_DIR = "assets/ui/items"
+DRAW_SCALE = 0.55
+
+# path -> nửa cạnh lớn của ảnh đã scale (đo ở lần vẽ đầu, dùng cho culling)
+_DRAW_HALF = {}
+
+
+class FallingItem(Entity):
+    """Phần vẽ chung của drop (Obstacle / PowerUp): ảnh item scale DRAW_SCALE, nhấp nhô theo _t."""
+
+    __slots__ = ()
+
+    def asset_path(self):
+        return None
+
+    def draw_radius(self) -> float:
+        # chưa vẽ lần nào -> bound rộng (ảnh item lớn nhất ~500px * 0.55)
+        return _DRAW_HALF.get(self.asset_path(), 160.0) + 3.0
+
+    def draw(self, screen, camera, assets, **kwargs):
+        path = self.asset_path()
+        if not path:
+            return
+
+        p = camera.entity_to_screen(self)
+        y = p.y + (math.sin(self._t * 4.0) * 3.0)
+
+        surf = assets.scaled_image(path, DRAW_SCALE)
+        if path not in _DRAW_HALF:
+            _DRAW_HALF[path] = max(surf.get_width(), surf.get_height()) * 0.5
+        screen.blit(surf, surf.get_rect(center=(int(p.x), int(y))))
@@ -1,9 +1,22 @@
 import pygame
 
+from src.ui.text import TEXT
+
+
 class FloatingText:
+    __slots__ = ("pos", "prev_pos", "vel", "text", "color", "life", "max_life")
+
     def __init__(self, pos, text, color=(255, 240, 180), lifetime=0.9):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2(0, -55)
+        self.reset(pos, text, color, lifetime)
+
+    def reset(self, pos, text, color=(255, 240, 180), lifetime=0.9):
+        """Đặt lại toàn bộ state (object lấy lại từ pool)."""
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.vel.update(0, -55)
         self.text = text
         self.color = color
         self.life = lifetime
@@ -14,9 +27,12 @@ class FloatingText:
         self.pos += self.vel * dt
         return self.life > 0
 
+    def draw_radius(self):
+        return 48.0
+
     def draw(self, screen, camera, font):
         alpha = max(0, min(255, int(255 * (self.life / self.max_life))))
-        surf = font.render(self.text, True, self.color).convert_alpha()
-        surf.set_alpha(alpha)
-        p = camera.world_to_screen(self.pos)
+        # surface dùng chung theo (text, màu, bậc alpha) -> không render mỗi frame
+        surf = TEXT.text(font, self.text, self.color, alpha=alpha)
+        p = camera.entity_to_screen(self)
         screen.blit(surf, surf.get_rect(center=(int(p.x), int(p.y))))
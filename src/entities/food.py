@@ -2,6 +2,8 @@ import pygame
 import random
 
 class Food:
+    __slots__ = ("pos", "radius", "alive")
+
     def __init__(self, pos, radius=8):
         self.pos = pygame.Vector2(pos)
         self.radius = radius
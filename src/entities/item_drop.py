@@ -1,52 +1,65 @@
 import random
-from src.entities.obstacle import Obstacle
-from src.entities.powerup import PowerUp
+from src.world.pools import EntityPools
+from src.core.sampler import AliasTable
 
 class DropSpawner:
     """Spawn obstacles + powerups falling (or rising) randomly."""
-    def __init__(self, world_w, world_h):
+
+    # --- weights theo yêu cầu ---
+    # obstacles thường xuyên
+    # shield2 nhiều, shield1 ít hơn, shield3 ít nhất
+    # heart cực hiếm
+    # x2 trung bình
+    WEIGHTS = {
+        "ob1": 12, "ob2": 12, "ob3": 10, "ob4": 10, "ob5": 9, "ob6": 9,
+        "shield2": 5, "shield1": 3, "shield3": 2,
+        "x2": 4,
+        "heart": 1,
+    }
+
+    # interval gốc theo map (giây), map3+ dùng key 3
+    BASE_INTERVALS = {1: 6.8, 2: 6.0, 3: 5.2}
+    MIN_INTERVAL = 3.8
+
+    def __init__(self, world_w, world_h, rng=None, weights=None, base_intervals=None, pools=None):
         self.world_w = world_w
         self.world_h = world_h
         self.t = 0.0
+        self.rng = rng or random
+        self.pools = pools or EntityPools()
+
+        w = dict(self.WEIGHTS)
+        w.update(weights or {})
+        self.kinds = list(w.keys())
+        self.weights = [int(v) for v in w.values()]
+        if not any(v > 0 for v in self.weights):
+            raise ValueError(f"DropSpawner: need at least one weight > 0, got {w}")
+        self.table = AliasTable(self.kinds, self.weights)
+
+        self.base_intervals = dict(self.BASE_INTERVALS)
+        self.base_intervals.update({int(k): float(v) for k, v in (base_intervals or {}).items()})
 
     def update(self, dt, drops, map_id=1, avg_points=5):
         self.t += dt
 
-        base_interval = 6.8 if map_id == 1 else 6.0 if map_id == 2 else 5.2
-        interval = max(3.8, base_interval - (avg_points / 600.0))
+        base_interval = self.base_intervals.get(int(map_id), self.base_intervals[3])
+        interval = max(self.MIN_INTERVAL, base_interval - (avg_points / 600.0))
 
         if self.t < interval:
             return
         self.t = 0.0
 
         # hướng rơi: 50/50
-        direction = 1 if random.random() < 0.5 else -1
+        direction = 1 if self.rng.random() < 0.5 else -1
         y = -60 if direction == 1 else self.world_h + 60
-        x = random.randint(80, self.world_w - 80)
-
-        # --- weights theo yêu cầu ---
-        # obstacles thường xuyên
-        # shield2 nhiều, shield1 ít hơn, shield3 ít nhất
-        # heart cực hiếm
-        # x2 trung bình
-        kinds = [
-            "ob1","ob2","ob3","ob4","ob5","ob6",
-            "shield2","shield1","shield3",
-            "x2",
-            "heart"
-        ]
-        weights = [
-            12,12,10,10,9,9,
-            5, 3, 2,
-            4,
-            1
-        ]
-        kind = random.choices(kinds, weights=weights, k=1)[0]
+        x = self.rng.randint(80, self.world_w - 80)
+
+        kind = self.table.pick(self.rng)
 
         speed = 140 if map_id == 1 else 160 if map_id == 2 else 180
 
         if kind.startswith("ob"):
             ob_id = int(kind[-1])
-            drops.append(Obstacle((x, y), ob_id=ob_id, direction=direction, speed=speed))
+            drops.append(self.pools.obstacle.acquire((x, y), ob_id=ob_id, direction=direction, speed=speed, rng=self.rng))
         else:
-            drops.append(PowerUp((x, y), kind=kind, direction=direction, speed=speed))
+            drops.append(self.pools.powerup.acquire((x, y), kind=kind, direction=direction, speed=speed, rng=self.rng))
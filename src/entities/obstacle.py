@@ -1,20 +1,27 @@
 import random
-import math
 import pygame
-from src.entities.entity import Entity
+from src.entities.falling_item import FallingItem, ASSET_DIR
 
-ASSET_DIR = "assets/ui/items"
-
-class Obstacle(Entity):
+class Obstacle(FallingItem):
     """Obstacle that damages player on touch."""
-    def __init__(self, pos, ob_id: int, direction=1, speed=140):
+
+    __slots__ = ("kind", "direction", "speed", "radius", "_t")
+
+    def __init__(self, pos, ob_id: int, direction=1, speed=140, rng=None):
         super().__init__(pos)
+        self.reset(pos, ob_id, direction, speed, rng)
+
+    def reset(self, pos, ob_id: int, direction=1, speed=140, rng=None):
+        """Đặt lại toàn bộ state (object lấy lại từ pool)."""
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.alive = True
         self.kind = f"ob{int(ob_id)}"
         self.direction = direction  # 1: top->down, -1: bottom->up
         self.speed = float(speed)
 
         self.radius = 22
-        self._t = random.random() * 10.0
+        self._t = (rng or random).random() * 10.0
 
     def rect(self):
         r = self.radius
@@ -32,14 +39,3 @@ class Obstacle(Entity):
         # out of world -> remove
         if self.pos.y < -120 or self.pos.y > world_h + 120:
             self.alive = False
-
-    def draw(self, screen, camera, assets, **kwargs):
-        p = camera.world_to_screen(self.pos)
-        y = p.y + (math.sin(self._t * 4.0) * 3.0)
-
-        img = assets.image(self.asset_path())
-        scale = 0.55
-        w = max(2, int(img.get_width() * scale))
-        h = max(2, int(img.get_height() * scale))
-        surf = pygame.transform.smoothscale(img, (w, h))
-        screen.blit(surf, surf.get_rect(center=(int(p.x), int(y))))
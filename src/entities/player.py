@@ -2,28 +2,68 @@
 import math
 import pygame
 from src.entities.animated_sprite import AnimatedSprite
+from src.ui.text import TEXT
+from src.core.input import KeyboardInput, NullInput
 
 
 class PlayerFish:
-    def __init__(self, pos, controls, fish_folder, player_id: int = 1):
+    BASE_SCALE = 0.60
+    RENDER_DIV = 1.12
+
+    # size frame mặc định khi không có sprite (headless), = fish01
+    DEFAULT_FRAME_SIZE = (235, 128)
+
+    # ✅ hạ label xuống 1 chút
+    LABEL_LOWER_PX = 10
+
+    # prefetch frame cho dải size sắp vẽ: tối đa N surface / frame vẽ, dải <= MAX_BYTES
+    PREFETCH_PER_FRAME = 1
+    PREFETCH_MAX_BYTES = 8 * 1024 * 1024
+    POP_MAX = 0.65
+
+    __slots__ = (
+        "pos", "prev_pos", "vel", "player_id", "controls", "input", "speed",
+        "points", "base_scale", "scale", "render_div",
+        "_pop", "_pop_decay", "_pop_strength",
+        "lives", "deaths", "invincible", "invincible_time", "shield_tier", "x2_time",
+        "sprite", "frame_size", "_hit_q", "hit_radius",
+        "_font_path", "_label_cache_key", "_label_surf", "_ring_phase",
+        "_prefetch_key",
+    )
+
+    def __init__(
+        self,
+        pos,
+        controls=None,
+        fish_folder=None,
+        player_id: int = 1,
+        input_source=None,
+        frame_size=None,
+    ):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2(0, 0)
 
         self.player_id = int(player_id)
         self.controls = controls
         self.speed = 280.0
 
+        # nguồn điều khiển: bàn phím mặc định, bot/script khi mô phỏng
+        if input_source is None:
+            input_source = KeyboardInput(controls) if controls else NullInput()
+        self.input = input_source
+
         # =========================
         # PROGRESSION
         # =========================
         self.points = 5
 
         # ✅ cá khởi đầu to hơn
-        self.base_scale = 0.60
+        self.base_scale = self.BASE_SCALE
         self.scale = self.base_scale
 
         # ✅ render to rõ hơn (giảm chia)
-        self.render_div = 1.12
+        self.render_div = self.RENDER_DIV
 
         # pop khi ăn
         self._pop = 0.0
@@ -34,31 +74,39 @@ class PlayerFish:
         # LIFE + BUFFS
         # =========================
         self.lives = 3
+        self.deaths = 0                # số lần mất máu (thống kê)
         self.invincible = 0.0          # i-frames sau HIT (va chạm mất máu)
         self.invincible_time = 0.0     # bất tử do thưởng/khiên
         self.shield_tier = 0           # 0/1/2/3
         self.x2_time = 0.0
 
         # =========================
-        # SPRITE
+        # SPRITE (None khi mô phỏng headless)
         # =========================
-        self.sprite = AnimatedSprite(
-            [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"],
-            fps=8
-        )
+        self.sprite = None
+        if fish_folder:
+            self.sprite = AnimatedSprite(
+                [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"],
+                fps=8
+            )
+            self.frame_size = (self.sprite.base_w, self.sprite.base_h)
+        else:
+            self.frame_size = tuple(frame_size or self.DEFAULT_FRAME_SIZE)
+        # (lo, hi, flip) của dải đã prefetch đủ -> dải không đổi thì bỏ qua
+        self._prefetch_key = None
+
+        # hit radius tính từ frame_size + scale (chỉ tính lại khi scale quantize đổi)
+        self._hit_q = None
+        self.hit_radius = 0.0
+        self._refresh_hit_radius()
 
         # =========================
         # LABEL (điểm trên đầu cá) - KHÔNG KHUNG
         # =========================
         self._font_path = "assets/fonts/Fredoka-Bold.ttf"
-        self._font = None
-        self._font_size = 24
         self._label_cache_key = None
         self._label_surf = None
 
-        # ✅ hạ label xuống 1 chút
-        self.LABEL_LOWER_PX = 10
-
         # =========================
         # RING (chỉ khi ăn thưởng khiên/bất tử)
         # =========================
@@ -76,7 +124,7 @@ class PlayerFish:
         self.points += gained
 
         # ✅ pop rõ khi ăn
-        self._pop = min(0.65, self._pop + self._pop_strength)
+        self._pop = min(self.POP_MAX, self._pop + self._pop_strength)
 
         # invalidate label cache
         self._label_cache_key = None
@@ -109,6 +157,58 @@ class PlayerFish:
 
         # scale bám nhanh để thấy lớn rõ
         self.scale += (target - self.scale) * 0.40
+        self._refresh_hit_radius()
+
+    # =========================
+    # PREFETCH (frame scale sắp dùng)
+    # =========================
+    def _prefetch_band(self):
+        """(lo, hi) scale vẽ đã quantize: từ size hiện tại tới đỉnh pop của lần ăn kế."""
+        q = AnimatedSprite.quantize_scale
+        target = self._scale_target_from_points()
+        lo = q(min(self.scale, target) / self.render_div)
+        peak = max(self.scale, target) + min(self.POP_MAX, self._pop + self._pop_strength)
+        return lo, q(peak / self.render_div)
+
+    def prefetch_scales(self, band=None):
+        """
+        Scale vẽ player sắp cần, tăng dần trong dải _prefetch_band() (tính cả scale
+        đang bám dần tới target). Cắt bớt đầu trên khi cả dải (mọi frame, 2 hướng)
+        vượt PREFETCH_MAX_BYTES.
+        """
+        lo, hi = band or self._prefetch_band()
+        step = AnimatedSprite.scale_step
+
+        per_px = 2 * len(self.sprite.frames) * self.sprite.frames[0].get_bytesize()
+        scales = []
+        total = 0
+        for i in range(int(round((hi - lo) / step)) + 1):
+            s = lo + i * step
+            w, h = self.sprite.scaled_size(s)
+            total += w * h * per_px
+            if scales and total > self.PREFETCH_MAX_BYTES:
+                break
+            scales.append(s)
+        return scales
+
+    def prefetch(self, limit=None):
+        """
+        Scale sẵn tối đa `limit` frame (mặc định PREFETCH_PER_FRAME) cho dải sắp vẽ.
+        Gọi 1 lần / frame vẽ (GameScene.draw), không nằm trong bước mô phỏng.
+        """
+        if not self.sprite:
+            return 0
+        limit = self.PREFETCH_PER_FRAME if limit is None else limit
+        flip = self.sprite.flip_x
+        band = self._prefetch_band()
+        key = (band, flip)
+        if key == self._prefetch_key:
+            return 0
+
+        made = self.sprite.prefetch(self.prefetch_scales(band), (flip, not flip), limit)
+        # chưa chạm limit -> cả dải đã có trong cache
+        self._prefetch_key = key if made < limit else None
+        return made
 
     # =========================
     # ITEMS
@@ -140,25 +240,41 @@ class PlayerFish:
         if self.invincible_time > 0 or self.invincible > 0:
             return
         self.lives -= 1
+        self.deaths += 1
         self.invincible = 1.2  # i-frame sau hit
 
+    # =========================
+    # COLLISION RADIUS
+    # =========================
+    @staticmethod
+    def radius_for(frame_size, q: float) -> float:
+        """= max(w, h) * 0.35 của frame đã scale theo q (giống get_image)."""
+        w, h = frame_size
+        return max(max(1, int(w * q)), max(1, int(h * q))) * 0.35
+
+    def _refresh_hit_radius(self):
+        q = AnimatedSprite.quantize_scale(self.scale / self.render_div)
+        if q != self._hit_q:
+            self._hit_q = q
+            self.hit_radius = self.radius_for(self.frame_size, q)
+
+    def collision_radius(self) -> float:
+        return self.hit_radius
+
+    def draw_radius(self) -> float:
+        """Bán kính bao hình vẽ (dùng cho culling)."""
+        w, h = (self.sprite.base_w, self.sprite.base_h) if self.sprite else self.frame_size
+        return 0.5 * max(w, h) * (self.scale + self._pop) / self.render_div
+
     # =========================
     # UPDATE
     # =========================
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        self.vel.update(0, 0)
-
-        if keys[self.controls["left"]]:
-            self.vel.x = -1
-            self.sprite.flip_x = True
-        if keys[self.controls["right"]]:
-            self.vel.x = 1
-            self.sprite.flip_x = False
-        if keys[self.controls["up"]]:
-            self.vel.y = -1
-        if keys[self.controls["down"]]:
-            self.vel.y = 1
+        ix, iy = self.input.read(self)
+        self.vel.update(ix, iy)
+
+        if self.sprite and ix:
+            self.sprite.flip_x = ix < 0
 
         if self.vel.length_squared() > 0:
             self.vel = self.vel.normalize()
@@ -188,45 +304,29 @@ class PlayerFish:
         # ring animation phase
         self._ring_phase += dt * 7.0
 
-        self.sprite.update(dt)
+        if self.sprite:
+            self.sprite.update(dt)
 
     # =========================
     # LABEL RENDER (NO BOX)
     # =========================
-    def _ensure_font(self, size: int):
-        if self._font is None or size != self._font_size:
-            self._font_size = size
-            try:
-                self._font = pygame.font.Font(self._font_path, size)
-            except Exception:
-                self._font = pygame.font.Font(None, size)
-            self._label_cache_key = None
-
     def _label_color(self):
         return (210, 255, 245)
 
     def _get_label_surface(self) -> pygame.Surface:
         # size chữ tăng nhẹ theo scale
         size = int(24 + min(14, (self.scale - self.base_scale) * 4.5))
-        self._ensure_font(size)
 
         text = str(int(self.points))
         key = (text, size)
         if key == self._label_cache_key and self._label_surf is not None:
             return self._label_surf
 
-        color = self._label_color()
-
-        shadow = self._font.render(text, True, (0, 0, 0))
-        main = self._font.render(text, True, color)
-
-        surf = pygame.Surface((main.get_width() + 6, main.get_height() + 6), pygame.SRCALPHA)
-        surf.blit(shadow, (4, 4))
-        surf.blit(main, (1, 1))
-
+        # font theo size dùng chung (TEXT), bóng lệch 3px như trước
+        font = TEXT.font(self._font_path, size)
         self._label_cache_key = key
-        self._label_surf = surf
-        return surf
+        self._label_surf = TEXT.shadow(font, text, self._label_color(), offset=3)
+        return self._label_surf
 
     # =========================
     # RING (glow) - CHỈ KHI ĂN THƯỞNG KHIÊN/BẤT TỬ
@@ -271,7 +371,7 @@ class PlayerFish:
         draw_scale = (self.scale + self._pop) / self.render_div
         img = self.sprite.get_image(scale=draw_scale)
 
-        rect = img.get_rect(center=camera.world_to_screen(self.pos))
+        rect = img.get_rect(center=camera.entity_to_screen(self))
 
         # không return ẩn/hiện nữa, mà nhấp nháy bằng alpha (nhẹ hơn)
         if self.invincible > 0:
@@ -5,6 +5,21 @@ from typing import Optional
 
 from src.entities.entity import Entity
 from src.entities.animated_sprite import AnimatedSprite
+from src.ui.text import TEXT
+
+
+_FALLBACK = {}
+
+
+def _fallback_circle(r: int) -> pygame.Surface:
+    surf = _FALLBACK.get(r)
+    if surf is None:
+        surf = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
+        c = (r + 1, r + 1)
+        pygame.draw.circle(surf, (255, 170, 90), c, r)
+        pygame.draw.circle(surf, (0, 0, 0), c, r, 2)
+        _FALLBACK[r] = surf
+    return surf
 
 
 class PreyFish(Entity):
@@ -15,6 +30,12 @@ class PreyFish(Entity):
     - ai: wander | dart
     """
 
+    __slots__ = (
+        "rng", "points", "ai", "scale", "hit_radius", "base_speed",
+        "_turn_t", "_turn_cd", "_dart_t", "_dart_cd", "_dart_time",
+        "flip_x", "sprite", "_label_value", "_label_surf",
+    )
+
     def __init__(
         self,
         pos,
@@ -23,17 +44,39 @@ class PreyFish(Entity):
         speed: float = 120.0,
         ai: str = "wander",
         fps: int = 8,
+        rng=None,
     ):
         super().__init__(pos)
+        self.sprite: Optional[AnimatedSprite] = None
+
+        # ===== LABEL CACHE (giữ qua các lần reset: label theo points) =====
+        self._label_value = None
+        self._label_surf = None
+
+        PreyFish.reset(self, pos, fish_folder, points, speed, ai, fps, rng)
+
+    def reset(
+        self,
+        pos,
+        fish_folder: Optional[str] = None,
+        points: int = 10,
+        speed: float = 120.0,
+        ai: str = "wander",
+        fps: int = 8,
+        rng=None,
+    ):
+        """Đặt lại toàn bộ state (object lấy lại từ pool)."""
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.alive = True
+        self.rng = rng or random
 
         self.points = int(points)
         self.ai = (ai or "wander").lower()
 
         # ===== SCALE THEO POINTS =====
-        # clamp để không quá to / quá bé
         p = max(1, min(320, self.points))
-        self.scale = 0.55 + (p / 320.0) * 1.10     # ~0.55 -> ~1.65
-        self.scale = max(0.45, min(self.scale, 1.75))
+        self.scale = self.scale_for_points(self.points)
 
         # ===== HIT RADIUS THEO SCALE =====
         # base hit radius cho cá nhỏ
@@ -46,31 +89,35 @@ class PreyFish(Entity):
 
         # ===== WANDER / DART STATE =====
         self._turn_t = 0.0
-        self._turn_cd = random.uniform(0.9, 1.6)
+        self._turn_cd = self.rng.uniform(0.9, 1.6)
 
         # dart: burst ngắn
         self._dart_t = 0.0
-        self._dart_cd = random.uniform(1.2, 2.4)
+        self._dart_cd = self.rng.uniform(1.2, 2.4)
         self._dart_time = 0.0
 
         # ===== INIT VELOCITY =====
-        ang = random.random() * 6.283
+        ang = self.rng.random() * 6.283
         self.vel = pygame.Vector2(1, 0).rotate_rad(ang) * self.base_speed
 
-        # ===== SPRITE =====
-        self.sprite: Optional[AnimatedSprite] = None
+        # ===== SPRITE (dùng lại AnimatedSprite cũ nếu có) =====
         self.flip_x = False
 
         if fish_folder:
-            self.sprite = AnimatedSprite(
-                [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"],
-                fps=fps,
-            )
+            paths = [f"{fish_folder}/swim_01.png", f"{fish_folder}/swim_02.png"]
+            if self.sprite is None:
+                self.sprite = AnimatedSprite(paths, fps=fps)
+            else:
+                self.sprite.reset(paths, fps=fps)
+        else:
+            self.sprite = None
 
-        # ===== LABEL CACHE =====
-        self._label_value = None
-        self._label_surf = None
-        self._label_outline = None
+    @staticmethod
+    def scale_for_points(points) -> float:
+        # clamp để không quá to / quá bé
+        p = max(1, min(320, int(points)))
+        scale = 0.55 + (p / 320.0) * 1.10     # ~0.55 -> ~1.65
+        return max(0.45, min(scale, 1.75))
 
     # =========================
     # HITBOX
@@ -84,11 +131,17 @@ class PreyFish(Entity):
             int(r * 2),
         )
 
+    def draw_radius(self) -> float:
+        """Bán kính bao hình vẽ (dùng cho culling, không cần get_image)."""
+        if self.sprite:
+            return 0.5 * max(self.sprite.base_w, self.sprite.base_h) * self.scale
+        return self.hit_radius
+
     # =========================
     # HELPERS
     # =========================
     def _rand_dir(self) -> pygame.Vector2:
-        v = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+        v = pygame.Vector2(self.rng.uniform(-1, 1), self.rng.uniform(-1, 1))
         if v.length_squared() > 0.001:
             v = v.normalize()
         else:
@@ -118,7 +171,7 @@ class PreyFish(Entity):
         self._turn_t += dt
         if self._turn_t >= self._turn_cd:
             self._turn_t = 0.0
-            self._turn_cd = random.uniform(0.9, 1.6)
+            self._turn_cd = self.rng.uniform(0.9, 1.6)
 
             # đổi hướng nhẹ
             dirv = self._rand_dir()
@@ -144,8 +197,8 @@ class PreyFish(Entity):
         else:
             if self._dart_t >= self._dart_cd:
                 self._dart_t = 0.0
-                self._dart_cd = random.uniform(1.2, 2.4)
-                self._dart_time = random.uniform(0.18, 0.32)
+                self._dart_cd = self.rng.uniform(1.2, 2.4)
+                self._dart_time = self.rng.uniform(0.18, 0.32)
 
         boost = 1.0
         if self._dart_time > 0.0:
@@ -182,15 +235,14 @@ class PreyFish(Entity):
         if self._label_value == self.points and self._label_surf is not None:
             return
         self._label_value = self.points
-        s = str(self.points)
-        self._label_surf = font.render(s, True, (245, 250, 255))
-        self._label_outline = font.render(s, True, (0, 0, 0))
+        # cá cùng điểm dùng chung 1 surface (TEXT)
+        self._label_surf = TEXT.shadow(font, str(self.points), (245, 250, 255), offset=1)
 
     # =========================
     # DRAW
     # =========================
     def draw(self, screen, camera, assets=None, font=None, **kwargs):
-        p = camera.world_to_screen(self.pos)
+        p = camera.entity_to_screen(self)
 
         if self.sprite:
             img = self.sprite.get_image(scale=self.scale)
@@ -198,9 +250,9 @@ class PreyFish(Entity):
             screen.blit(img, rect)
             r_for_label = rect.height // 2
         else:
-            # fallback
-            pygame.draw.circle(screen, (255, 170, 90), (int(p.x), int(p.y)), int(self.hit_radius))
-            pygame.draw.circle(screen, (0, 0, 0), (int(p.x), int(p.y)), int(self.hit_radius), 2)
+            # fallback (surface vẽ sẵn -> screen có thể là RenderLayer)
+            img = _fallback_circle(int(self.hit_radius))
+            screen.blit(img, img.get_rect(center=(int(p.x), int(p.y))))
             r_for_label = int(self.hit_radius)
 
         if font:
@@ -208,5 +260,4 @@ class PreyFish(Entity):
             tx = int(p.x)
             ty = int(p.y - r_for_label - 12)
 
-            screen.blit(self._label_outline, self._label_outline.get_rect(center=(tx + 1, ty + 1)))
             screen.blit(self._label_surf, self._label_surf.get_rect(center=(tx, ty)))
@@ -1,5 +1,4 @@
 # src/entities/shy_prey_fish.py
-import random
 import pygame
 from typing import Optional
 
@@ -12,6 +11,8 @@ class ShyPreyFish(PreyFish):
     - player tới gần thì chạy trốn
     """
 
+    __slots__ = ("flee_radius", "flee_boost", "_wander_t")
+
     def __init__(
         self,
         pos,
@@ -21,6 +22,7 @@ class ShyPreyFish(PreyFish):
         flee_radius: float = 260.0,
         flee_boost: float = 2.2,
         fps: int = 8,
+        rng=None,
     ):
         super().__init__(
             pos=pos,
@@ -29,12 +31,29 @@ class ShyPreyFish(PreyFish):
             speed=speed,
             ai="wander",
             fps=fps,
+            rng=rng,
         )
+        self._reset_shy(flee_radius, flee_boost)
+
+    def reset(
+        self,
+        pos,
+        fish_folder: Optional[str] = None,
+        points: int = 20,
+        speed: float = 130.0,
+        flee_radius: float = 260.0,
+        flee_boost: float = 2.2,
+        fps: int = 8,
+        rng=None,
+    ):
+        super().reset(pos, fish_folder, points, speed, "wander", fps, rng)
+        self._reset_shy(flee_radius, flee_boost)
 
+    def _reset_shy(self, flee_radius, flee_boost):
         self.flee_radius = float(flee_radius)
         self.flee_boost = float(flee_boost)
 
-        self._wander_t = random.random() * 10.0
+        self._wander_t = self.rng.random() * 10.0
 
     def update(self, dt, world_w, world_h, players=None, **kwargs):
         flee_dir = None
@@ -58,7 +77,7 @@ class ShyPreyFish(PreyFish):
             self._wander_t += dt
             if self._wander_t > 1.1:
                 self._wander_t = 0.0
-                self.vel = self.vel.rotate_rad(random.uniform(-0.65, 0.65))
+                self.vel = self.vel.rotate_rad(self.rng.uniform(-0.65, 0.65))
             if self.vel.length_squared() > 1:
                 self.vel = self.vel.normalize() * self.base_speed
 
@@ -3,6 +3,7 @@ import pygame
 
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
+from src.ui.bg import draw_backdrop
 from src.entities.animated_sprite import AnimatedSprite
 
 
@@ -13,22 +14,6 @@ def clamp(x, a, b):
     return a if x < a else b if x > b else x
 
 
-def draw_cover(screen, image, w, h, alpha=255):
-    if image is None:
-        return
-    iw, ih = image.get_width(), image.get_height()
-    if iw <= 0 or ih <= 0:
-        return
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
-    if alpha < 255:
-        surf.set_alpha(alpha)
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
-
-
 # =========================
 # Fish Card
 # =========================
@@ -102,6 +87,9 @@ class FishCard:
 # Fish Select Scene
 # =========================
 class FishSelectScene(Scene):
+    # cá preview chỉ 8 fps, hover card vẫn mượt ở 30
+    fps = 30
+
     def on_enter(self, **kwargs):
         self.bg = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
 
@@ -219,7 +207,17 @@ class FishSelectScene(Scene):
 
         self.app.runtime["players"] = players
 
-        self.app.scenes.set_scene(GameScene(self.app), map_data=map_data)
+        # preload cá/items của map trước khi vào trận (tránh giật lúc spawn)
+        from src.core.preload import build_map_preloader
+        from src.scenes.loading import LoadingScene
+        self.app.scenes.set_scene(
+            LoadingScene(
+                self.app,
+                build_map_preloader(self.app, map_data),
+                GameScene(self.app),
+                map_data=map_data,
+            )
+        )
 
     # =========================
     # Events
@@ -270,11 +268,7 @@ class FishSelectScene(Scene):
         return pygame.Rect(340, 92, 260, 28)
 
     def draw(self, screen):
-        draw_cover(screen, self.bg, self.app.width, self.app.height)
-
-        overlay = pygame.Surface((self.app.width, self.app.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 90))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 0, 0, 90))
 
         title = self.h1.render("Select Fish", True, self.app.theme["text"])
         screen.blit(title, (70, 45))
@@ -1,30 +1,16 @@
 import json
-import pygame
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
-
-
-# =========================
-# Helpers
-# =========================
-def draw_cover(screen, image, w, h, alpha=255):
-    if image is None:
-        return
-    iw, ih = image.get_width(), image.get_height()
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
-    if alpha < 255:
-        surf.set_alpha(alpha)
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
+from src.ui.bg import draw_backdrop
 
 
 # =========================
 # GAME OVER SCENE
 # =========================
 class GameOverScene(Scene):
+    # tĩnh: chỉ vẽ lại khi có event
+    animating = False
+
     def on_enter(self, map_id=1, points=0, time_alive=0.0, **kwargs):
         # ===== BACKGROUND =====
         self.bg = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
@@ -161,13 +147,7 @@ class GameOverScene(Scene):
     # Draw
     # ======================
     def draw(self, screen):
-        draw_cover(screen, self.bg, self.app.width, self.app.height)
-
-        overlay = pygame.Surface(
-            (self.app.width, self.app.height), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 120))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 0, 0, 120))
 
         # ===== TITLE =====
         title = self.title_font.render(
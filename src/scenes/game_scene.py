@@ -3,22 +3,40 @@ import pygame
 from typing import List
 
 from src.core.scene import Scene
-from src.world.camera import Camera
+from src.world.world import World
 from src.entities.player import PlayerFish
-from src.entities.floating_text import FloatingText
-from src.world.spawner import Spawner
-from src.entities.item_drop import DropSpawner
 from src.ui.hud import HUD
 from src.ui.image_button import ImageButton
+from src.core.profiler import PROFILER
+from src.core.sprite_cache import SPRITES
+from src.core.fixed_step import FixedStep
+from src.core.settings import Settings
+from src.world.replay import ReplayPlayer, ReplayRecorder, load_replay, new_replay_path, prune_replays
+from src.core.render_queue import (
+    RenderQueue, LAYER_DROPS, LAYER_PREY, LAYER_PREDATORS, LAYER_PLAYERS, LAYER_TEXT,
+)
 
 
 class GameScene(Scene):
-    MAP_TARGETS = {1: 500, 2: 3000, 3: 5000}
+    # nới vùng nhìn khi cull (label điểm nằm trên đầu cá)
+    CULL_MARGIN = 40
+
+    # xem replay: ← / → tua lùi / tới chừng này giây
+    REPLAY_SEEK = 5.0
 
     # =========================
     # Enter
     # =========================
-    def on_enter(self, map_data=None, **kwargs):
+    def on_enter(self, map_data=None, replay=None, **kwargs):
+        """replay: Replay / đường dẫn file .fgr -> phát lại trận đã ghi thay vì chơi."""
+        self.replay = None
+        self.recorder = None
+        if replay is not None:
+            if isinstance(replay, str):
+                replay = load_replay(replay)
+            self.replay = ReplayPlayer(replay, sprites=True)
+            map_data = replay.header["map"]
+
         self.map = map_data or {
             "id": 1,
             "bg": None,
@@ -28,11 +46,12 @@ class GameScene(Scene):
 
         self.world_w, self.world_h = self.map.get("world_size", [2400, 1344])
         self.map_id = int(self.map.get("id", 1))
-        self.TARGET_POINTS = self.MAP_TARGETS.get(self.map_id, 300)
 
         # ===== mode: 1P/2P =====
         self.mode = int(self.app.runtime.get("mode", 1))
         self.mode = 2 if self.mode == 2 else 1
+        if self.replay is not None:
+            self.mode = self.replay.world.mode
 
         # ===== Background (cache scaled 1 lần) =====
         self.bg = self.app.assets.image(self.map["bg"]) if self.map.get("bg") else None
@@ -42,42 +61,33 @@ class GameScene(Scene):
             else None
         )
 
-        # ===== Camera =====
-        self.camera = Camera(self.app.width, self.app.height, self.world_w, self.world_h)
-
         # ===== Fonts + HUD =====
         self.font_big = self.app.assets.font(None, 26)
         self.font_small = self.app.assets.font(None, 18)
-        self.hud = HUD(self.font_big, self.font_small)
-
-        # ===== Players =====
-        self._ensure_players()
-
-        # ===== Enemies / Drops =====
-        self.preys = []
-        self.predators = []
-        self.spawner = Spawner(self.world_w, self.world_h)
-
-        self.drops = []
-        self.drop_spawner = DropSpawner(self.world_w, self.world_h)
 
-        self.floating: List[FloatingText] = []
-        self.elapsed = 0.0
+        # entity push (surface, dest) vào đây, flush 1 lần Surface.blits / layer
+        self.render_queue = RenderQueue()
+        self.hud = HUD(self.font_big, self.font_small)
 
-        # ===== Spawn caps theo map/mode (EASY BALANCE) =====
-        if self.map_id == 1:
-            self.max_preys = 22 if self.mode == 1 else 28
-            self.max_predators = 2 if self.mode == 1 else 3
-        elif self.map_id == 2:
-            self.max_preys = 28 if self.mode == 1 else 36
-            self.max_predators = 3 if self.mode == 1 else 4
-        else:  # map3+
-            self.max_preys = 34 if self.mode == 1 else 44
-            self.max_predators = 4 if self.mode == 1 else 5
+        # ===== Simulation (bước cố định, vẽ nội suy giữa 2 tick) =====
+        self.sim = FixedStep(Settings.SIM_HZ, Settings.MAX_SIM_STEPS)
 
-        # ===== Camera init =====
-        self._camera_follow_players()
-        self.camera.update(0.0)
+        if self.replay is not None:
+            self.world = self.replay.world
+            self.players = self.world.players
+        else:
+            # ===== Players =====
+            self._ensure_players()
+
+            self.world = World(
+                self.map,
+                self.players,
+                mode=self.mode,
+                view_size=(self.app.width, self.app.height),
+                fixed_dt=self.sim.step_dt,
+            )
+            self._start_recording()
+        self.TARGET_POINTS = self.world.TARGET_POINTS
 
         # ===== BGM =====
         if self.app.sound_on:
@@ -120,10 +130,14 @@ class GameScene(Scene):
             "right": pygame.K_d,
         }
 
+        self.player_fish = [f"assets/fish/player/{p1_fish}"]
+        if self.mode == 2:
+            self.player_fish.append(f"assets/fish/player/{p2_fish}")
+
         p1 = PlayerFish(
             pos=(self.world_w / 2 - 80, self.world_h / 2),
             controls=p1_controls,
-            fish_folder=f"assets/fish/player/{p1_fish}",
+            fish_folder=self.player_fish[0],
             player_id=1,
         )
         p1.points = 5
@@ -134,7 +148,7 @@ class GameScene(Scene):
             p2 = PlayerFish(
                 pos=(self.world_w / 2 + 80, self.world_h / 2),
                 controls=p2_controls,
-                fish_folder=f"assets/fish/player/{p2_fish}",
+                fish_folder=self.player_fish[1],
                 player_id=2,
             )
             p2.points = 5
@@ -143,52 +157,46 @@ class GameScene(Scene):
         self.players: List[PlayerFish] = players
         self.app.runtime["players"] = players
 
+    # =========================
+    # Replay
+    # =========================
+    def _start_recording(self):
+        if not Settings.RECORD_REPLAYS:
+            return
+        prune_replays(Settings.REPLAY_DIR, Settings.REPLAY_KEEP - 1)
+        path = new_replay_path(Settings.REPLAY_DIR, self.map_id, self.mode)
+        try:
+            self.recorder = ReplayRecorder(self.world, path, fish=self.player_fish)
+        except Exception as e:
+            print("[WARN] Replay recording disabled:", e)
+            self.recorder = None
+
+    def stop_recording(self, result=None):
+        """Kết thúc file replay (hết trận / bỏ trận từ Pause)."""
+        if self.recorder is not None:
+            self.recorder.close(result)
+            self.recorder = None
+
+    def _seek_replay(self, seconds):
+        rp = self.replay
+        rp.seek(rp.tick + int(seconds / self.world.fixed_dt))
+        self.world = rp.world
+        self.players = self.world.players
+        self.sim.reset()
+
     # =========================
     # Helpers
     # =========================
-    def _player_radius(self, p: PlayerFish) -> float:
-        img = p.sprite.get_image(scale=(p.scale / p.render_div))
-        return max(img.get_width(), img.get_height()) * 0.35
-
-    def _player_rect(self, p: PlayerFish) -> pygame.Rect:
-        r = self._player_radius(p)
-        return pygame.Rect(int(p.pos.x - r), int(p.pos.y - r), int(r * 2), int(r * 2))
-
-    def _camera_follow_players(self):
-        if len(self.players) >= 2:
-            center = (self.players[0].pos + self.players[1].pos) / 2
-            self.camera.follow(center)
-        else:
-            self.camera.follow(self.players[0].pos)
+    @property
+    def camera(self):
+        return self.world.camera
+
+    @property
+    def elapsed(self) -> float:
+        return self.world.elapsed
 
     def _team_points(self) -> int:
-        return int(sum(p.points for p in self.players))
-
-    def _all_dead(self) -> bool:
-        return all(p.lives <= 0 for p in self.players)
-
-    # DESPAWN xa camera để cá không tích tụ mãi
-    def _despawn_far_entities(self):
-        view_l = self.camera.offset.x
-        view_r = self.camera.offset.x + self.camera.sw
-        view_t = self.camera.offset.y
-        view_b = self.camera.offset.y + self.camera.sh
-
-        pad = 520  # càng lớn càng ít despawn (520 là cân bằng)
-        left = view_l - pad
-        right = view_r + pad
-        top = view_t - pad
-        bottom = view_b + pad
-
-        for e in self.preys:
-            if getattr(e, "alive", True):
-                if e.pos.x < left or e.pos.x > right or e.pos.y < top or e.pos.y > bottom:
-                    e.alive = False
-
-        for e in self.predators:
-            if getattr(e, "alive", True):
-                if e.pos.x < left or e.pos.x > right or e.pos.y < top or e.pos.y > bottom:
-                    e.alive = False
+        return self.world.team_points()
 
     # =========================
     # Pause
@@ -205,6 +213,16 @@ class GameScene(Scene):
     # Events
     # =========================
     def handle_event(self, event):
+        if self.replay is not None:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self._end_replay()
+                elif event.key == pygame.K_LEFT:
+                    self._seek_replay(-self.REPLAY_SEEK)
+                elif event.key == pygame.K_RIGHT:
+                    self._seek_replay(self.REPLAY_SEEK)
+            return
+
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self._pause_game()
         self.btn_pause.handle_event(event)
@@ -213,197 +231,153 @@ class GameScene(Scene):
     # Update
     # =========================
     def update(self, dt):
-        self.elapsed += dt
-
-        # players
-        for p in self.players:
-            if p.lives > 0:
-                p.update(dt)
-
-            r = self._player_radius(p)
-            p.pos.x = max(r, min(self.world_w - r, p.pos.x))
-            p.pos.y = max(r, min(self.world_h - r, p.pos.y))
-
-        # camera follow
-        self._camera_follow_players()
-        self.camera.update(dt)
-
-        # difficulty points:
-        # - 1P: dùng điểm player[0]
-        # - 2P: dùng trung bình team để spawn hợp lý hơn
-        if self.mode == 1:
-            diff_pts = int(self.players[0].points)
-        else:
-            diff_pts = max(1, int(self._team_points() / max(1, len(self.players))))
-
-        # update prey
-        for prey in self.preys:
-            prey.update(dt, self.world_w, self.world_h, players=self.players)
-
-        # update predator
-        for pr in self.predators:
-            pr.update(dt, self.world_w, self.world_h, players=self.players)
-
-        # spawn: theo TỔNG cap (tránh OR spawn miết)
-        total_now = len(self.preys) + len(self.predators)
-        total_cap = self.max_preys + self.max_predators
-
-        if total_now < total_cap:
-            self.spawner.update(
-                dt,
-                player_points=diff_pts,
-                preys=self.preys,
-                predators=self.predators,
-                camera=self.camera,
-                map_id=self.map_id
-            )
-
-        # drops
-        self.drop_spawner.update(dt, self.drops, self.map_id, diff_pts)
-        for d in self.drops:
-            d.update(dt, self.world_w, self.world_h)
-
-        # collision
-        self._handle_collisions()
-
-        # despawn xa camera (giảm đông dần theo thời gian)
-        self._despawn_far_entities()
-
-        # cleanup
-        self.preys = [e for e in self.preys if getattr(e, "alive", True)]
-        self.predators = [e for e in self.predators if getattr(e, "alive", True)]
-        self.drops = [d for d in self.drops if d.alive]
-        self.floating = [ft for ft in self.floating if ft.update(dt)]
+        if self.replay is not None:
+            self._update_replay()
+            return
 
-        self._check_end_conditions()
+        # dt thật của frame -> n bước sim cố định (frame dài không làm cá xuyên qua nhau)
+        rec = self.recorder
+        result = None
+        for _ in range(self.sim.advance(dt)):
+            result = self.world.step()
+            if rec is not None:
+                rec.tick()
+            if result is not None:
+                break
+        if rec is not None:
+            rec.frame(dt)
+
+        if result is not None:
+            self.sim.reset()
+            self.stop_recording(result)
+            self._finish(result)
+        self.camera.alpha = self.sim.alpha
+
+    def _update_replay(self):
+        # 1x: mỗi frame phát đúng 1 frame đã ghi (cùng dt, cùng số tick)
+        frame = self.replay.next_frame()
+        if frame is None:
+            self._end_replay()
+            return
+        self.world = self.replay.world
+        self.sim.advance(frame[0])
+        self.camera.alpha = self.sim.alpha
 
-    # =========================
-    # Collision
-    # =========================
-    def _handle_collisions(self):
-        for p in self.players:
-            if p.lives <= 0:
-                continue
-
-            p_rect = self._player_rect(p)
-
-            # ===== prey collisions =====
-            for prey in self.preys:
-                if getattr(prey, "alive", True) and p_rect.colliderect(prey.rect()):
-                    if prey.points <= int(p.points * 1.02):
-                        prey.alive = False
-                        gained = p.add_points(prey.points)
-                        self.floating.append(FloatingText(prey.pos, f"+{gained}"))
-                    else:
-                        p.hit()
-                        self.camera.shake(6, 0.15)
-
-            # ===== predator collisions (EASY FAIR RULE) =====
-            for pr in self.predators:
-                if not getattr(pr, "alive", True):
-                    continue
-                if not p_rect.colliderect(pr.rect()):
-                    continue
-
-                # ✅ đủ lớn thì ăn predator (công bằng)
-                if pr.points <= int(p.points * 0.92):
-                    pr.alive = False
-                    gained = p.add_points(pr.points)
-                    self.floating.append(FloatingText(pr.pos, f"+{gained}"))
-                    self.camera.shake(6, 0.12)
-                else:
-                    p.hit()
-                    self.camera.shake(10, 0.22)
-
-            # ===== drops collisions =====
-            for d in self.drops:
-                if d.alive and p_rect.colliderect(d.rect()):
-                    d.alive = False
-                    if str(d.kind).startswith("ob"):
-                        p.hit()
-                        self.camera.shake(8, 0.2)
-                    else:
-                        p.apply_item(d.kind)
+    def _end_replay(self):
+        rp = self.replay
+        if rp.desync is not None:
+            print(f"[WARN] Replay desync at tick {rp.desync}: {rp.replay.path}")
+        from src.scenes.menu import MenuScene
+        self.app.scenes.set_scene(MenuScene(self.app))
 
     # =========================
     # End game
     # =========================
-    def _check_end_conditions(self):
-        if self._team_points() >= self.TARGET_POINTS:
-            try:
-                pygame.mixer.music.fadeout(800)
-            except Exception:
-                pass
-            from src.scenes.victory import VictoryScene
-            self.app.scenes.set_scene(
-                VictoryScene(self.app),
-                map_id=self.map_id,
-                points=self._team_points(),
-                time_alive=self.elapsed,
-            )
-            return
+    def _finish(self, result):
+        try:
+            pygame.mixer.music.fadeout(800)
+        except Exception:
+            pass
 
-        if self.mode == 1:
-            if self.players[0].lives <= 0:
-                try:
-                    pygame.mixer.music.fadeout(800)
-                except Exception:
-                    pass
-                from src.scenes.game_over import GameOverScene
-                self.app.scenes.set_scene(
-                    GameOverScene(self.app),
-                    map_id=self.map_id,
-                    points=self._team_points(),
-                    time_alive=self.elapsed,
-                )
+        if result == "win":
+            from src.scenes.victory import VictoryScene
+            next_scene = VictoryScene(self.app)
         else:
-            if self._all_dead():
-                try:
-                    pygame.mixer.music.fadeout(800)
-                except Exception:
-                    pass
-                from src.scenes.game_over import GameOverScene
-                self.app.scenes.set_scene(
-                    GameOverScene(self.app),
-                    map_id=self.map_id,
-                    points=self._team_points(),
-                    time_alive=self.elapsed,
-                )
+            from src.scenes.game_over import GameOverScene
+            next_scene = GameOverScene(self.app)
+
+        self.app.scenes.set_scene(
+            next_scene,
+            map_id=self.map_id,
+            points=self._team_points(),
+            time_alive=self.elapsed,
+        )
 
     # =========================
     # Draw
     # =========================
     def draw(self, screen):
-        screen.fill((8, 30, 55))
-
-        if self.bg_world:
-            screen.blit(self.bg_world, (-self.camera.offset.x, -self.camera.offset.y))
+        prof = PROFILER
+
+        with prof.scope("bg_blit"):
+            screen.fill((8, 30, 55))
+
+            if self.bg_world:
+                off = self.camera.render_offset()
+                screen.blit(self.bg_world, (-off.x, -off.y))
+
+        w = self.world
+
+        # frame scale player sắp cần: 1 lần / frame vẽ, ngoài bước mô phỏng
+        with prof.scope("prefetch"):
+            for p in self.players:
+                if p.lives > 0:
+                    p.prefetch()
+
+        with prof.scope("entity_draw"):
+            cam = self.camera
+            view = cam.view_rect(self.CULL_MARGIN)
+            sees = cam.sees
+            rq = self.render_queue
+            drawn = culled = 0
+
+            out = rq.layer(LAYER_DROPS)
+            for d in w.drops:
+                if sees(d.pos, d.draw_radius(), view):
+                    d.draw(out, cam, self.app.assets)
+                    drawn += 1
+                else:
+                    culled += 1
 
-        for d in self.drops:
-            d.draw(screen, self.camera, self.app.assets)
+            out = rq.layer(LAYER_PREY)
+            for prey in w.preys:
+                if sees(prey.pos, prey.draw_radius(), view):
+                    prey.draw(out, cam, self.app.assets, self.font_small)
+                    drawn += 1
+                else:
+                    culled += 1
 
-        for prey in self.preys:
-            prey.draw(screen, self.camera, self.app.assets, self.font_small)
+            out = rq.layer(LAYER_PREDATORS)
+            for pr in w.predators:
+                if sees(pr.pos, pr.draw_radius(), view):
+                    pr.draw(out, cam, self.font_small)
+                    drawn += 1
+                else:
+                    culled += 1
+
+            out = rq.layer(LAYER_PLAYERS)
+            for p in self.players:
+                if p.lives > 0:
+                    if sees(p.pos, p.draw_radius(), view):
+                        p.draw(out, cam)
+                        drawn += 1
+                    else:
+                        culled += 1
 
-        for pr in self.predators:
-            pr.draw(screen, self.camera, self.font_small)
+            out = rq.layer(LAYER_TEXT)
+            for ft in w.floating:
+                if sees(ft.pos, ft.draw_radius(), view):
+                    ft.draw(out, cam, self.font_small)
+                    drawn += 1
+                else:
+                    culled += 1
 
-        for p in self.players:
-            if p.lives > 0:
-                p.draw(screen, self.camera)
+            rq.flush(screen)
 
-        for ft in self.floating:
-            ft.draw(screen, self.camera, self.font_small)
+            prof.count("drawn", drawn)
+            prof.count("culled", culled)
+            SPRITES.scaled.profile(prof)
 
-        self.hud.draw(
-            screen,
-            assets=self.app.assets,
-            lives=self.players[0].lives,
-            points=self._team_points(),
-            elapsed=self.elapsed,
-            target=self.TARGET_POINTS,
-            player=self.players[0],
-            map_name=self.map.get("name", ""),
-        )
+        with prof.scope("hud"):
+            self.hud.draw(
+                screen,
+                assets=self.app.assets,
+                lives=self.players[0].lives,
+                points=self._team_points(),
+                elapsed=self.elapsed,
+                target=self.TARGET_POINTS,
+                player=self.players[0],
+                map_name=self.map.get("name", ""),
+            )
 
-        self.btn_pause.draw(screen)
+            self.btn_pause.draw(screen)
@@ -1,29 +1,16 @@
 import pygame
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
-
-
-# =========================
-# Helpers
-# =========================
-def draw_cover(screen, image, w, h, alpha=255):
-    if image is None:
-        return
-    iw, ih = image.get_width(), image.get_height()
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
-    if alpha < 255:
-        surf.set_alpha(alpha)
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
+from src.ui.bg import draw_backdrop
 
 
 # =========================
 # LEADERBOARD SCENE
 # =========================
 class LeaderboardScene(Scene):
+    # tĩnh: chỉ vẽ lại khi có event
+    animating = False
+
     def on_enter(self, **kwargs):
         # ===== BACKGROUND =====
         self.bg = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
@@ -79,14 +66,7 @@ class LeaderboardScene(Scene):
     # Draw
     # =========================
     def draw(self, screen):
-        draw_cover(screen, self.bg, self.app.width, self.app.height)
-
-        # overlay tối
-        overlay = pygame.Surface(
-            (self.app.width, self.app.height), pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 110))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 0, 0, 110))
 
         # ===== TITLE =====
         title = self.h1.render(
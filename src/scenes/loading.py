@@ -0,0 +1,67 @@
+import pygame
+from src.core.scene import Scene
+from src.ui.bg import draw_backdrop
+
+
+class LoadingScene(Scene):
+    """
+    Màn loading dùng chung:
+    - mỗi frame chạy preloader.step() trong giới hạn thời gian
+    - vẽ % + thanh tiến trình theo preloader.progress
+    - xong (và đủ min_time) thì chuyển sang scene kế tiếp
+    """
+
+    def __init__(self, app, preloader, next_scene=None, min_time=0.0, **next_kwargs):
+        super().__init__(app)
+        self.preloader = preloader
+        self.next_scene = next_scene
+        self.next_kwargs = next_kwargs
+        self.min_time = float(min_time)
+
+    def on_enter(self, **kwargs):
+        self.t = 0.0
+        self.done = False
+        self.bg = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
+        self.preloader.start()
+
+    def _make_next(self):
+        return self.next_scene
+
+    def update(self, dt):
+        if self.done:
+            return
+
+        self.t += dt
+        finished = self.preloader.step()
+
+        if finished and self.t >= self.min_time and not self.app.scenes.transitioning:
+            self.done = True
+            self.app.scenes.set_scene(self._make_next(), **self.next_kwargs)
+
+    def draw(self, screen):
+        # background cover + overlay
+        draw_backdrop(
+            screen,
+            self.bg,
+            self.app.width,
+            self.app.height,
+            overlay=(0, 0, 0, 70)
+        )
+
+        # loading text + %
+        cx, cy = self.app.width // 2, self.app.height // 2
+        pct = int(self.preloader.progress * 100)
+
+        font = self.app.assets.font(None, 44)
+        txt = font.render(f"Loading... {pct}%", True, (230, 240, 255))
+        screen.blit(txt, txt.get_rect(center=(cx, cy)))
+
+        # progress bar
+        bar = pygame.Rect(0, 0, int(self.app.width * 0.4), 14)
+        bar.center = (cx, cy + 46)
+        fill = bar.copy()
+        fill.w = int(bar.w * self.preloader.progress)
+        pygame.draw.rect(screen, (18, 32, 52), bar, border_radius=7)
+        if fill.w > 0:
+            pygame.draw.rect(screen, (120, 200, 255), fill, border_radius=7)
+        pygame.draw.rect(screen, (190, 225, 255), bar, 2, border_radius=7)
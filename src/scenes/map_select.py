@@ -2,26 +2,12 @@ import json
 import pygame
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
+from src.ui.bg import BACKDROPS, draw_backdrop
+from src.core.baked import source_size
 
 FONT_PATH = "assets/fonts/Baloo2-Bold.ttf"
 
 
-def draw_cover(screen, image, w, h, alpha=255):
-    if image is None:
-        return
-    iw, ih = image.get_width(), image.get_height()
-    if iw <= 0 or ih <= 0:
-        return
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
-    if alpha < 255:
-        surf.set_alpha(alpha)
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
-
-
 class MapCard:
     def __init__(self, rect, map_data, thumb, unlocked, font_title, font_small):
         self.rect = pygame.Rect(rect)
@@ -33,44 +19,56 @@ class MapCard:
 
         self.hover = 0.0
         self.lift = 0.0
+        self.settled = True
+
+        # thumb bo góc đã dựng (theo size)
+        self._thumb_key = None
+        self._thumb_surf = None
 
     def update(self, dt, mouse_pos):
         target = 1.0 if self.rect.collidepoint(mouse_pos) else 0.0
         self.hover += (target - self.hover) * min(1.0, dt * 10)
         self.lift = self.hover * 6
+        self.settled = abs(target - self.hover) < 0.005
 
     def hit(self, pos):
         return self.rect.collidepoint(pos)
 
-    def _draw_thumb_rounded_cover(self, screen, thumb, rect, radius=14):
-        # nền
-        pygame.draw.rect(screen, (8, 14, 26), rect, border_radius=radius)
-
-        if thumb is None:
-            pygame.draw.rect(screen, (60, 90, 130), rect, 2, border_radius=radius)
-            return
-
-        tw, th = thumb.get_width(), thumb.get_height()
-        if tw <= 0 or th <= 0:
-            pygame.draw.rect(screen, (60, 90, 130), rect, 2, border_radius=radius)
-            return
+    def _thumb_rounded(self, thumb, w, h, radius):
+        """Thumb cover (w, h) bo góc, dựng 1 lần theo size (không smoothscale + mask mỗi frame)."""
+        key = (w, h, radius)
+        if self._thumb_key == key:
+            return self._thumb_surf
 
         # cover scale
-        scale = max(rect.w / tw, rect.h / th)
+        tw, th = thumb.get_width(), thumb.get_height()
+        scale = max(w / tw, h / th)
         nw, nh = int(tw * scale), int(th * scale)
         img = pygame.transform.smoothscale(thumb, (nw, nh)).convert_alpha()
 
         # surface clip
-        clipped = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-        clipped.blit(img, (rect.w // 2 - nw // 2, rect.h // 2 - nh // 2))
+        clipped = pygame.Surface((w, h), pygame.SRCALPHA)
+        clipped.blit(img, (w // 2 - nw // 2, h // 2 - nh // 2))
 
         # mask bo góc
-        mask = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+        mask = pygame.Surface((w, h), pygame.SRCALPHA)
         mask.fill((0, 0, 0, 0))
         pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=radius)
         clipped.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
-        screen.blit(clipped, rect.topleft)
+        self._thumb_key = key
+        self._thumb_surf = clipped
+        return clipped
+
+    def _draw_thumb_rounded_cover(self, screen, thumb, rect, radius=14):
+        # nền
+        pygame.draw.rect(screen, (8, 14, 26), rect, border_radius=radius)
+
+        if thumb is None or thumb.get_width() <= 0 or thumb.get_height() <= 0:
+            pygame.draw.rect(screen, (60, 90, 130), rect, 2, border_radius=radius)
+            return
+
+        screen.blit(self._thumb_rounded(thumb, rect.w, rect.h, radius), rect.topleft)
 
         # viền
         pygame.draw.rect(screen, (60, 90, 130), rect, 2, border_radius=radius)
@@ -123,15 +121,18 @@ class MapCard:
 
         # locked overlay
         if not self.unlocked:
-            overlay = pygame.Surface((r.w, r.h), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, r.topleft)
+            screen.blit(BACKDROPS.overlay((r.w, r.h), (0, 0, 0, 150)), r.topleft)
 
             lock = self.font_title.render("🔒 KHÓA", True, (255, 220, 120))
             screen.blit(lock, lock.get_rect(center=r.center))
 
 
 class MapSelectScene(Scene):
+    @property
+    def animating(self):
+        # chỉ vẽ liên tục khi card còn đang nhấc lên / hạ xuống
+        return not all(card.settled for card in self.cards)
+
     def on_enter(self, **kwargs):
         # fonts
         self.h1 = self.app.assets.font(FONT_PATH, 46)
@@ -173,14 +174,14 @@ class MapSelectScene(Scene):
 
         # đặt "center" để ImageButton hoạt động
         back_img_path = "assets/ui/button/back.png"
-        back_raw = pygame.image.load(back_img_path).convert_alpha()
+        back_w, back_h = source_size(back_img_path)
 
         # ===== KÍCH CỠ & VỊ TRÍ GIỐNG Button((30, 20, 120, 44)) =====
         x, y, w, h = 30, 20, 120, 44
         center = (x + w // 2, y + h // 2)
 
-        scale_x = w / back_raw.get_width()
-        scale_y = h / back_raw.get_height()
+        scale_x = w / back_w
+        scale_y = h / back_h
 
         self.btn_back = ImageButton(
             image_path=back_img_path,
@@ -224,11 +225,7 @@ class MapSelectScene(Scene):
         self.app.scenes.set_scene(FishSelectScene(self.app))
 
     def draw(self, screen):
-        draw_cover(screen, self.bg, self.app.width, self.app.height)
-
-        overlay = pygame.Surface((self.app.width, self.app.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 0, 0, 100))
 
         title = self.h1.render("Select Map", True, self.app.theme["text"])
         screen.blit(title, (70, 70))
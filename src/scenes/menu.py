@@ -2,24 +2,16 @@
 import pygame
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
-
-
-def scale_cover(image, w, h):
-    if image is None:
-        return None
-    iw, ih = image.get_width(), image.get_height()
-    if iw <= 0 or ih <= 0:
-        return None
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    return pygame.transform.smoothscale(image, (nw, nh))
+from src.ui.bg import draw_backdrop
 
 
 class MenuScene(Scene):
+    # tĩnh: chỉ vẽ lại khi có event
+    animating = False
+
     def on_enter(self, **kwargs):
-        # BG raw để rescale lại khi đổi size
+        # BG raw, bản cover theo size màn hình do BACKDROPS giữ
         self.bg_raw = self.app.assets.image("assets/bg/khungchoi_bg.jpg")
-        self.bg = scale_cover(self.bg_raw, self.app.width, self.app.height)
 
         self.title_font = self.app.assets.font("assets/fonts/Fredoka-Bold.ttf", 72)
         self.sub_font = self.app.assets.font("assets/fonts/Baloo2-Bold.ttf", 26)
@@ -140,7 +132,6 @@ class MenuScene(Scene):
         cur = (self.app.width, self.app.height)
         if cur != self._last_size:
             self._last_size = cur
-            self.bg = scale_cover(self.bg_raw, self.app.width, self.app.height)
             self._rebuild_layout()
 
         # sync icon mute/unmute
@@ -150,14 +141,7 @@ class MenuScene(Scene):
     # DRAW
     # =========================
     def draw(self, screen):
-        if self.bg:
-            screen.blit(self.bg, self.bg.get_rect(center=(self.app.width // 2, self.app.height // 2)))
-        else:
-            screen.fill((8, 30, 55))
-
-        overlay = pygame.Surface((self.app.width, self.app.height), pygame.SRCALPHA)
-        overlay.fill((0, 40, 80, 35))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg_raw, self.app.width, self.app.height, overlay=(0, 40, 80, 35))
 
         title = self.title_font.render("Blue Ocean", True, (255, 255, 255))
         subtitle = self.sub_font.render("Một đại dương, một quy luật.", True, (220, 240, 255))
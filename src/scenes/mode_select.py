@@ -1,29 +1,20 @@
 import pygame
 from src.core.scene import Scene
 from src.ui.image_button import ImageButton
+from src.ui.bg import draw_backdrop
 from src.scenes.map_select import MapSelectScene
 
 
-# =========================
-# Helpers
-# =========================
-def scale_cover(image, w, h):
-    iw, ih = image.get_width(), image.get_height()
-    if iw <= 0 or ih <= 0:
-        return None
-    scale = max(w / iw, h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    return pygame.transform.smoothscale(image, (nw, nh))
-
-
 # =========================
 # MODE SELECT SCENE
 # =========================
 class ModeSelectScene(Scene):
+    # tĩnh: chỉ vẽ lại khi có event
+    animating = False
+
     def on_enter(self, **kwargs):
         # ===== BACKGROUND =====
-        bg_raw = self.app.assets.image("assets/bg/mode_bg.png")
-        self.bg = scale_cover(bg_raw, self.app.width, self.app.height)
+        self.bg = self.app.assets.image("assets/bg/mode_bg.png")
 
         # ===== FONT =====
         self.h1 = self.app.assets.font(
@@ -118,21 +109,7 @@ class ModeSelectScene(Scene):
     # DRAW
     # =========================
     def draw(self, screen):
-        if self.bg:
-            screen.blit(
-                self.bg,
-                self.bg.get_rect(
-                    center=(self.app.width // 2, self.app.height // 2)
-                )
-            )
-        else:
-            screen.fill((8, 30, 55))
-
-        overlay = pygame.Surface(
-            (self.app.width, self.app.height), pygame.SRCALPHA
-        )
-        overlay.fill((0, 30, 60, 70))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.bg, self.app.width, self.app.height, overlay=(0, 30, 60, 70))
 
         title = self.h1.render(
             "Select Mode",
@@ -3,9 +3,13 @@ import pygame
 from src.core.scene import Scene
 from src.ui.panel import Panel
 from src.ui.image_button import ImageButton
+from src.ui.bg import draw_overlay
 
 
 class PauseScene(Scene):
+    # gameplay đứng yên phía sau -> chỉ vẽ lại khi có event
+    animating = False
+
     def __init__(self, app, game_scene):
         super().__init__(app)
         self.game_scene = game_scene
@@ -82,6 +86,8 @@ class PauseScene(Scene):
     def _retry(self):
         from src.scenes.game_scene import GameScene
 
+        self.game_scene.stop_recording("quit")
+
         map_data = self.app.runtime.get("map")
         if not map_data:
             map_data = {
@@ -98,11 +104,13 @@ class PauseScene(Scene):
         )
 
     def _go_menu(self):
+        self.game_scene.stop_recording("quit")
         pygame.mixer.music.fadeout(600)
         from src.scenes.menu import MenuScene
         self.app.scenes.set_scene(MenuScene(self.app))
 
     def _go_map_select(self):
+        self.game_scene.stop_recording("quit")
         from src.scenes.map_select import MapSelectScene
         self.app.scenes.set_scene(MapSelectScene(self.app))
 
@@ -125,12 +133,7 @@ class PauseScene(Scene):
         self.game_scene.draw(screen)
 
         # overlay tối
-        overlay = pygame.Surface(
-            (self.app.width, self.app.height),
-            pygame.SRCALPHA
-        )
-        overlay.fill((0, 0, 0, 140))
-        screen.blit(overlay, (0, 0))
+        draw_overlay(screen, (0, 0, 0, 140), self.app.width, self.app.height)
 
         
 
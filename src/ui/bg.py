@@ -1,20 +1,104 @@
+# src/ui/bg.py
+"""
+Nền tĩnh cho các màn menu (BACKDROPS):
+- backdrop = ảnh cover theo màn hình + lớp phủ màu, ghép sẵn thành 1 surface
+  đục (convert) theo key (ảnh, size, overlay) -> mỗi frame chỉ còn 1 lần blit
+  thay vì smoothscale cả ảnh nền + tạo overlay SRCALPHA full màn hình
+- overlay: lớp phủ màu (pause, thẻ map bị khoá) tạo 1 lần theo (size, màu)
+Đổi size màn hình -> key mới, bản của size cũ bị bỏ.
+"""
+from collections import OrderedDict
+
 import pygame
 
-def draw_cover(screen, image, w, h, alpha=255):
-    """Draw image cover the screen while keeping aspect ratio."""
+# vài scene đứng cạnh nhau (menu -> mode -> map -> fish) dùng lại bản đã ghép
+MAX_BACKDROPS = 4
+CLEAR_COLOR = (8, 30, 55)
+
+
+def scale_cover(image, w, h):
+    """Scale image phủ kín (w, h), giữ tỉ lệ. None nếu ảnh lỗi."""
     if image is None:
-        return
+        return None
     iw, ih = image.get_width(), image.get_height()
-    if iw == 0 or ih == 0:
-        return
-
+    if iw <= 0 or ih <= 0:
+        return None
     scale = max(w / iw, h / ih)
     nw, nh = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(image, (nw, nh))
+    return pygame.transform.smoothscale(image, (nw, nh))
+
+
+class BackdropCache:
+    def __init__(self, max_items=MAX_BACKDROPS):
+        self.max_items = int(max_items)
+        self._backdrops = OrderedDict()
+        self._overlays = {}
+        self._size = None
+
+        # thống kê
+        self.hits = 0
+        self.builds = 0
+
+    def _check_size(self, size):
+        if size != self._size:
+            old, self._size = self._size, size
+            self._backdrops.clear()
+            self._overlays = {k: v for k, v in self._overlays.items() if k[0] != old}
+
+    def backdrop(self, image, size, overlay=None, clear=CLEAR_COLOR):
+        """Surface đục `size`: clear -> ảnh cover (đục) -> overlay RGBA (nếu có)."""
+        size = (int(size[0]), int(size[1]))
+        self._check_size(size)
+
+        key = (image, size, tuple(overlay) if overlay else None, tuple(clear))
+        surf = self._backdrops.get(key)
+        if surf is not None:
+            self._backdrops.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        surf = pygame.Surface(size).convert()
+        surf.fill(clear)
+
+        cover = scale_cover(image, *size)
+        if cover is not None:
+            surf.blit(cover, cover.get_rect(center=(size[0] // 2, size[1] // 2)))
+        if overlay:
+            surf.blit(self.overlay(size, overlay), (0, 0))
+
+        self._backdrops[key] = surf
+        while len(self._backdrops) > self.max_items:
+            self._backdrops.popitem(last=False)
+        self.builds += 1
+        return surf
+
+    def overlay(self, size, color) -> pygame.Surface:
+        """Lớp phủ RGBA dùng chung; không vẽ đè lên surface trả về."""
+        key = ((int(size[0]), int(size[1])), tuple(color))
+        surf = self._overlays.get(key)
+        if surf is None:
+            surf = pygame.Surface(key[0], pygame.SRCALPHA)
+            surf.fill(key[1])
+            self._overlays[key] = surf
+        return surf
+
+    def stats(self) -> dict:
+        return {
+            "backdrops": len(self._backdrops),
+            "overlays": len(self._overlays),
+            "hits": self.hits,
+            "builds": self.builds,
+        }
+
+
+# instance dùng chung
+BACKDROPS = BackdropCache()
+
+
+def draw_backdrop(screen, image, w, h, overlay=None):
+    """Vẽ nền (ảnh cover + overlay) đã ghép sẵn."""
+    screen.blit(BACKDROPS.backdrop(image, (w, h), overlay), (0, 0))
 
-    if alpha < 255:
-        surf.set_alpha(alpha)
 
-    x = (w - nw) // 2
-    y = (h - nh) // 2
-    screen.blit(surf, (x, y))
+def draw_overlay(screen, color, w, h):
+    screen.blit(BACKDROPS.overlay((w, h), color), (0, 0))
@@ -1,48 +1,9 @@
 # src/ui/hud.py
 import pygame
 
-
-# =========================================================
-# Text helpers (outline)
-# =========================================================
-def render_outline(font, text, fill=(245, 250, 255), outline=(0, 0, 0)):
-    base = font.render(text, True, fill)
-    out = font.render(text, True, outline)
-    return base, out
-
-
-def blit_outline(screen, base, out, x, y, thick=2):
-    for ox, oy in [
-        (-thick, 0), (thick, 0), (0, -thick), (0, thick),
-        (-thick, -thick), (thick, -thick), (-thick, thick), (thick, thick)
-    ]:
-        screen.blit(out, (x + ox, y + oy))
-    screen.blit(base, (x, y))
-
-
-# =========================================================
-# Icon helpers
-# =========================================================
-def scale_icon(img: pygame.Surface, size: int) -> pygame.Surface:
-    if img is None:
-        return None
-    w, h = img.get_width(), img.get_height()
-    if w <= 0 or h <= 0:
-        return img
-    s = float(size) / float(max(w, h))
-    return pygame.transform.smoothscale(img, (int(w * s), int(h * s)))
-
-
-def draw_icon(screen, img, cx, cy, size, alpha=255):
-    if img is None:
-        return
-    icon = scale_icon(img, int(size))
-    if icon is None:
-        return
-    if alpha < 255:
-        icon = icon.copy()
-        icon.set_alpha(alpha)
-    screen.blit(icon, icon.get_rect(center=(int(cx), int(cy))))
+from src.core.baked import fit_size
+from src.ui.text import RetainedText
+from src.core.profiler import PROFILER
 
 
 # =========================================================
@@ -54,14 +15,53 @@ class HUD:
     - Hàng trên: Score + Map/Time
     - Hàng dưới: Hearts + Buff slots
     - Không vẽ khung đen/đổ bóng ngoài (panel đã có viền đẹp)
+    Retained: panel + nội dung ghép sẵn trong 1 layer offscreen, vùng nào có
+    input đổi (score, giây, mạng, buff) mới vẽ lại; mỗi frame chỉ 1 blit.
+    Layer nới rộng theo nội dung (chữ dài tràn ra ngoài panel không bị cắt).
     """
 
+    # số ô buff (mỗi ô 1 badge thời gian)
+    SLOTS = 2
+
+    MAX_LIVES = 3
+    HEART_SIZE = 48
+    HEART_GAP = 36
+
+    # thứ tự vẽ (z) các vùng trong layer
+    REGIONS = ("score", "time", "hearts", "buffs")
+
     def __init__(self, font_big, font_small):
         self.font_big = font_big
         self.font_small = font_small
 
+        # text chỉ dựng lại khi giá trị đổi (score / giây / badge)
+        self.txt_score = RetainedText(
+            font_big, lambda v: f"{v[0]} / {v[1]}",
+            fill=(245, 252, 255), style="outline", thick=2,
+        )
+        self.txt_time = RetainedText(
+            font_small, self._time_line,
+            fill=(215, 232, 245), style="outline", thick=1,
+        )
+        self.txt_badges = [
+            RetainedText(font_small, fill=(255, 245, 190), style="shadow", offset=1)
+            for _ in range(self.SLOTS)
+        ]
+
         self._loaded = False
 
+        # layer offscreen (panel + nội dung), dựng lại theo vùng
+        self._layer = None
+        self._layer_sw = None
+        self._panel = None
+        self._slot_ops = []
+        self._base = None
+        self._frame = None
+        self._pos = (0, 0)
+        self._lay = {}
+        self._keys = {}
+        self._bounds = {}
+
         # panel image
         self.panel_img = None
         self._panel_cache_size = None
@@ -78,26 +78,38 @@ class HUD:
         # optional: empty slot icon (nếu có)
         self.ico_slot = None
 
-    def _safe_image(self, assets, path):
-        try:
-            return assets.image(path)
-        except Exception:
-            return None
+    @staticmethod
+    def _time_line(v):
+        map_name, secs = v
+        line = f"Time {secs // 60:02d}:{secs % 60:02d}"
+        return f"{map_name} | {line}" if map_name else line
 
     def _ensure_assets(self, assets):
         if self._loaded:
             return
         self._loaded = True
+        self._assets = assets
 
-        self.panel_img = self._safe_image(assets, "assets/ui/hud/panel.png")
+        # chỉ giữ path: ảnh lấy theo đúng size vẽ (texture bake, xem tools/bake_ui.py)
+        self.panel_img = "assets/ui/hud/panel.png"
 
-        self.ico_heart_full = self._safe_image(assets, "assets/ui/button/heart_full.png")
-        self.ico_heart_empty = self._safe_image(assets, "assets/ui/button/heart_empty.png")
+        self.ico_heart_full = "assets/ui/button/heart_full.png"
+        self.ico_heart_empty = "assets/ui/button/heart_empty.png"
 
-        self.ico_x2 = self._safe_image(assets, "assets/ui/items/x2diem.png")
-        self.ico_sh1 = self._safe_image(assets, "assets/ui/items/thuong1.png")
-        self.ico_sh2 = self._safe_image(assets, "assets/ui/items/thuong2.png")
-        self.ico_sh3 = self._safe_image(assets, "assets/ui/items/thuong3.png")
+        self.ico_x2 = "assets/ui/items/x2diem.png"
+        self.ico_sh1 = "assets/ui/items/thuong1.png"
+        self.ico_sh2 = "assets/ui/items/thuong2.png"
+        self.ico_sh3 = "assets/ui/items/thuong3.png"
+
+    def _icon(self, path, size):
+        """Icon vừa khung size x size (giữ tỉ lệ), cache trong Assets."""
+        if path is None:
+            return None
+        try:
+            src = self._assets.source_size(path)
+            return self._assets.image(path, size=fit_size(src, size))
+        except Exception:
+            return None
 
 
     def _panel_scaled(self, w, h):
@@ -112,166 +124,240 @@ class HUD:
             return self._panel_cache_scaled
 
         self._panel_cache_size = key
-        self._panel_cache_scaled = pygame.transform.smoothscale(self.panel_img, key)
+        try:
+            self._panel_cache_scaled = self._assets.image(self.panel_img, size=key)
+        except Exception:
+            self._panel_cache_scaled = None
         return self._panel_cache_scaled
 
-    def draw(
-        self,
-        screen,
-        assets,
-        lives: int,
-        points: int,
-        elapsed: float,
-        target: int,
-        player=None,
-        map_name: str = "",
-    ):
-        self._ensure_assets(assets)
-
-        sw, sh = screen.get_width(), screen.get_height()
+    # =========================================================
+    # Retained layer
+    # =========================================================
+    def invalidate(self):
+        """Dựng lại toàn bộ ở lần draw sau (đổi size màn hình, đổi asset...)."""
+        self._layer = None
 
+    def _build_layer(self, sw):
+        """Layout theo bề rộng màn hình + nền tĩnh (panel + ô buff) + layer trống."""
         # =========================================================
         # PANEL: nhỏ lại + ngắn lại (đẹp, gọn)
         # =========================================================
         panel_w = min(520, int(sw * 0.58))  # ✅ ngắn lại
         panel_h = 92                        # ✅ thấp lại
-        panel_x = 18
-        panel_y = 12
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-
-        # vẽ panel PNG
-        panel_surf = self._panel_scaled(panel_w, panel_h)
-        if panel_surf:
-            screen.blit(panel_surf, panel_rect.topleft)
-        else:
-            # fallback nếu thiếu panel.png
-            fallback = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(fallback, (10, 18, 30, 210), fallback.get_rect(), border_radius=20)
-            pygame.draw.rect(fallback, (110, 210, 255, 140), fallback.get_rect(), width=2, border_radius=20)
-            screen.blit(fallback, panel_rect.topleft)
+        self._pos = (18, 12)
+        self._layer_sw = sw
 
         # =========================================================
-        # LAYOUT "TRONG PANEL"
+        # LAYOUT "TRONG PANEL" (toạ độ trong panel)
         # Dùng tỉ lệ theo panel để không bị lệch khi đổi size
         # =========================================================
-        x0, y0, w0, h0 = panel_rect.x, panel_rect.y, panel_rect.w, panel_rect.h
+        w0, h0 = panel_w, panel_h
 
         # vùng "ruột" (tránh góc trang trí)
-        inner_l = x0 + int(w0 * 0.06)  # tránh icon cua bên trái
-        inner_r = x0 + int(w0 * 0.94)  # tránh sò bên phải
+        inner_l = int(w0 * 0.06)  # tránh icon cua bên trái
+        inner_r = int(w0 * 0.94)  # tránh sò bên phải
         inner_w = inner_r - inner_l
 
         # hàng trên / dưới
-        top_y = y0 + int(h0 * 0.18)
-        bottom_y = y0 + int(h0 * 0.66)
-
-        # =========================================================
-        # TOP: SCORE + MAP/TIME
-        # =========================================================
-        score_text = f"{int(points)} / {int(target)}"
-        score_base, score_out = render_outline(
-            self.font_big,
-            score_text,
-            fill=(245, 252, 255),
-            outline=(0, 0, 0),
-        )
+        top_y = int(h0 * 0.18)
+        bottom_y = int(h0 * 0.66)
 
-        # score nằm trong ruột panel
-        score_x = inner_l + 40 
-        score_y = top_y + 4 
-        blit_outline(screen, score_base, score_out, score_x, score_y, thick=2)
-
-        mm = int(elapsed) // 60
-        ss = int(elapsed) % 60
-        line = f"Time {mm:02d}:{ss:02d}"
-        if map_name:
-            line = f"{map_name} | {line}"
-
-        # time nằm cùng hàng, bên phải score
-        # canh sao cho vẫn nằm trong ruột panel
-        time_base, time_out = render_outline(
-            self.font_small,
-            line,
-            fill=(215, 232, 245),
-            outline=(0, 0, 0),
-        )
-        time_x = inner_l + int(inner_w * 0.30)
-        time_y = top_y + 4
-        blit_outline(screen, time_base, time_out, time_x, time_y, thick=1)
-
-        # =========================================================
-        # BOTTOM: HEARTS (to hơn) + BUFF SLOTS
-        # =========================================================
-        max_lives = 3
-        lives = int(lives)
-
-        heart_size = 48      
-        heart_gap = 36
-        hearts_x = inner_l + int(inner_w * 0.02) + 180
-
-        for i in range(max_lives):
-            img = self.ico_heart_full if i < lives else self.ico_heart_empty
-            draw_icon(
-                screen,
-                img,
-                hearts_x + i * heart_gap,
-                bottom_y,
-                heart_size
-            )
-
-        # ===== Buff slots bên phải (2 ô) =====
         slot_size = 28
         slot_gap = 42
-        slots_count = 2
-
         # slot area sát phải, vẫn nằm trong ruột panel
         slots_right = inner_r - int(inner_w * 0.02) - 50
-        slot_centers = []
-        for i in range(slots_count):
-            cx = slots_right - i * slot_gap
-            slot_centers.append(cx)
 
-        # vẽ slot nền (nếu không có icon slot thì vẽ hình rounded)
-        for cx in slot_centers:
+        self._lay = {
+            # score nằm trong ruột panel, time cùng hàng bên phải
+            "score": (inner_l + 40, top_y + 4),
+            "time": (inner_l + int(inner_w * 0.30), top_y + 4),
+            "hearts_x": inner_l + int(inner_w * 0.02) + 180,
+            "bottom_y": bottom_y,
+            "slot_size": slot_size,
+            "slots": [slots_right - i * slot_gap for i in range(self.SLOTS)],
+        }
+
+        # ===== nền tĩnh: panel =====
+        base = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel_surf = self._panel_scaled(panel_w, panel_h)
+        if panel_surf:
+            base.blit(panel_surf, (0, 0))
+        else:
+            # fallback nếu thiếu panel.png
+            pygame.draw.rect(base, (10, 18, 30, 210), base.get_rect(), border_radius=20)
+            pygame.draw.rect(base, (110, 210, 255, 140), base.get_rect(), width=2, border_radius=20)
+
+        # slot nền (nếu không có icon slot thì vẽ hình rounded): vẽ cùng vùng buffs,
+        # trên tim (màn hẹp tim thứ 3 chồng lên ô slot)
+        self._slot_ops = []
+        for cx in self._lay["slots"]:
             if self.ico_slot:
-                draw_icon(screen, self.ico_slot, cx, bottom_y, slot_size, alpha=255)
+                icon = self._icon(self.ico_slot, slot_size)
+                if icon is not None:
+                    self._slot_ops.append((icon, icon.get_rect(center=(int(cx), int(bottom_y))).topleft))
             else:
                 slot_rect = pygame.Rect(0, 0, slot_size, slot_size)
                 slot_rect.center = (int(cx), int(bottom_y))
                 # nền slot nhẹ, nhìn “game UI”
-                s = pygame.Surface((slot_size, slot_size), pygame.SRCALPHA)
-                pygame.draw.rect(s, (0, 0, 0, 70), s.get_rect(), border_radius=10)
-                pygame.draw.rect(s, (255, 255, 255, 70), s.get_rect(), width=2, border_radius=10)
-                screen.blit(s, slot_rect.topleft)
-
-        # ===== đặt buff icons vào slot (ưu tiên x2 rồi shield) =====
-        if player:
-            buffs = []
-
-            x2_time = float(getattr(player, "x2_time", 0.0))
-            if x2_time > 0:
-                buffs.append(("x2", self.ico_x2, x2_time))
-
-            inv = float(getattr(player, "invincible_time", 0.0))
-            tier = int(getattr(player, "shield_tier", 0))
-            if inv > 0:
-                ico = self.ico_sh1
-                if tier == 2:
-                    ico = self.ico_sh2
-                elif tier == 3:
-                    ico = self.ico_sh3
-                buffs.append(("sh", ico, inv))
-
-            # draw buffs vào slot (tối đa 2)
-            for idx, (kind, img, secs) in enumerate(buffs[:slots_count]):
-                cx = slot_centers[idx]
-                draw_icon(screen, img, cx, bottom_y, slot_size - 4, alpha=255)
-
-                # badge thời gian nhỏ phía dưới icon
-                badge = f"{secs:.0f}s"
-                b = self.font_small.render(badge, True, (255, 245, 190))
-                o = self.font_small.render(badge, True, (0, 0, 0))
-                bx = int(cx - b.get_width() / 2)
-                by = int(bottom_y + slot_size * 0.38)
-                screen.blit(o, (bx + 1, by + 1))
-                screen.blit(b, (bx, by))
+                sl = pygame.Surface((slot_size, slot_size), pygame.SRCALPHA)
+                pygame.draw.rect(sl, (0, 0, 0, 70), sl.get_rect(), border_radius=10)
+                pygame.draw.rect(sl, (255, 255, 255, 70), sl.get_rect(), width=2, border_radius=10)
+                self._slot_ops.append((sl, slot_rect.topleft))
+
+        self._panel = base
+        self._frame = base.get_rect()
+        self._alloc_layer()
+
+    def _alloc_layer(self):
+        """Layer + nền cỡ self._frame (toạ độ panel, có thể rộng hơn panel); mọi vùng vẽ lại."""
+        f = self._frame
+        base = pygame.Surface(f.size, pygame.SRCALPHA)
+        base.blit(self._panel, (-f.x, -f.y))
+        self._base = base
+        self._layer = base.copy()
+        self._keys = {}
+        self._bounds = {}
+
+    # ----- nội dung từng vùng: [(surface, topleft)] -----
+    def _ops_score(self, key):
+        x, y = self._lay["score"]
+        # chữ nằm ở (thick, thick) trong surface viền
+        return [(self.txt_score.set(key), (x - 2, y - 2))]
+
+    def _ops_time(self, key):
+        x, y = self._lay["time"]
+        return [(self.txt_time.set(key), (x - 1, y - 1))]
+
+    def _ops_hearts(self, lives):
+        ops = []
+        hx, by = self._lay["hearts_x"], self._lay["bottom_y"]
+        for i in range(self.MAX_LIVES):
+            path = self.ico_heart_full if i < lives else self.ico_heart_empty
+            icon = self._icon(path, self.HEART_SIZE)
+            if icon is not None:
+                ops.append((icon, icon.get_rect(center=(hx + i * self.HEART_GAP, by)).topleft))
+        return ops
+
+    def _ops_buffs(self, buffs):
+        ops = list(self._slot_ops)
+        by = self._lay["bottom_y"]
+        slot_size = self._lay["slot_size"]
+        for idx, (img, badge) in enumerate(buffs):
+            cx = self._lay["slots"][idx]
+            icon = self._icon(img, slot_size - 4)
+            if icon is not None:
+                ops.append((icon, icon.get_rect(center=(int(cx), int(by))).topleft))
+
+            # badge thời gian nhỏ phía dưới icon
+            b = self.txt_badges[idx].set(badge)
+            bx = int(cx - (b.get_width() - 1) / 2)
+            ops.append((b, (bx, int(by + slot_size * 0.38))))
+        return ops
+
+    def _buff_key(self, player):
+        """[(icon path, badge)] các buff đang chạy (ưu tiên x2 rồi shield, tối đa SLOTS)."""
+        if not player:
+            return ()
+        buffs = []
+
+        x2_time = float(getattr(player, "x2_time", 0.0))
+        if x2_time > 0:
+            buffs.append((self.ico_x2, f"{x2_time:.0f}s"))
+
+        inv = float(getattr(player, "invincible_time", 0.0))
+        tier = int(getattr(player, "shield_tier", 0))
+        if inv > 0:
+            ico = self.ico_sh1
+            if tier == 2:
+                ico = self.ico_sh2
+            elif tier == 3:
+                ico = self.ico_sh3
+            buffs.append((ico, f"{inv:.0f}s"))
+
+        return tuple(buffs[: self.SLOTS])
+
+    @staticmethod
+    def _bounds_of(ops):
+        rects = [pygame.Rect(pos, surf.get_size()) for surf, pos in ops]
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    def _refresh(self, keys):
+        """Vẽ lại các vùng có input đổi (+ vùng chồng lên chúng), trả số vùng đã vẽ."""
+        dirty = [n for n in self.REGIONS if keys[n] != self._keys.get(n)]
+        if not dirty:
+            return 0
+
+        ops = {}
+        area = []
+        for n in dirty:
+            ops[n] = getattr(self, "_ops_" + n)(keys[n])
+            area += [self._bounds.get(n), self._bounds_of(ops[n])]
+        area = [r for r in area if r]
+
+        # vùng chưa đổi nhưng chồng lên vùng sắp xoá -> vẽ lại luôn (giữ đúng thứ tự z)
+        grown = True
+        while grown:
+            grown = False
+            for n in self.REGIONS:
+                b = self._bounds.get(n)
+                if n in ops or b is None or b.collidelist(area) < 0:
+                    continue
+                ops[n] = getattr(self, "_ops_" + n)(keys[n])
+                area += [r for r in (b, self._bounds_of(ops[n])) if r]
+                grown = True
+
+        # nội dung tràn ra ngoài layer (vd tên map dài) -> nới layer, vẽ lại tất cả
+        if not all(self._frame.contains(r) for r in area):
+            self._frame = self._frame.unionall(area)
+            self._alloc_layer()
+            return self._refresh(keys)
+
+        layer = self._layer
+        fx, fy = -self._frame.x, -self._frame.y
+        for r in area:
+            r = r.move(fx, fy)
+            layer.fill((0, 0, 0, 0), r)
+            layer.blit(self._base, r.topleft, r)
+
+        for n in self.REGIONS:
+            if n in ops:
+                if ops[n]:
+                    layer.blits([(surf, (x + fx, y + fy)) for surf, (x, y) in ops[n]], doreturn=False)
+                self._bounds[n] = self._bounds_of(ops[n])
+                self._keys[n] = keys[n]
+        return len(ops)
+
+    # =========================================================
+    # Draw
+    # =========================================================
+    def draw(
+        self,
+        screen,
+        assets,
+        lives: int,
+        points: int,
+        elapsed: float,
+        target: int,
+        player=None,
+        map_name: str = "",
+    ):
+        """
+        Chỉ vẽ lại vùng có input đổi (score / giây / mạng / buff) vào layer offscreen,
+        mỗi frame game chỉ blit 1 surface.
+        """
+        self._ensure_assets(assets)
+
+        sw = screen.get_width()
+        if self._layer is None or self._layer_sw != sw:
+            self._build_layer(sw)
+
+        keys = {
+            "score": (int(points), int(target)),
+            "time": (map_name, int(elapsed)),
+            "hearts": max(0, min(self.MAX_LIVES, int(lives))),
+            "buffs": self._buff_key(player),
+        }
+        PROFILER.count("hud_redraws", self._refresh(keys))
+
+        x, y = self._pos
+        screen.blit(self._layer, (x + self._frame.x, y + self._frame.y))
@@ -1,5 +1,7 @@
 import pygame
 
+from src.core.baked import load_sizes, source_size
+
 
 class ImageButton:
     def __init__(
@@ -14,15 +16,6 @@ class ImageButton:
         alt_image_path=None,
         click_sound=None
     ):
-        # =========================
-        # LOAD IMAGE
-        # =========================
-        self.image_raw = pygame.image.load(image_path).convert_alpha()
-        self.alt_raw = (
-            pygame.image.load(alt_image_path).convert_alpha()
-            if alt_image_path else None
-        )
-
         # =========================
         # CONFIG SIZE
         # =========================
@@ -33,13 +26,15 @@ class ImageButton:
         self.click_sound = click_sound
 
         # =========================
-        # SCALE IMAGE
+        # LOAD + SCALE IMAGE
+        # (ưu tiên texture đã bake đúng size, không decode PNG gốc)
         # =========================
-        self.image = self._scale(self.image_raw, scale)
-        self.image_hover = self._scale(self.image_raw, scale * hover_scale)
+        self.image, self.image_hover = self._load(image_path, scale, hover_scale)
 
-        self.alt_image = self._scale(self.alt_raw, scale) if self.alt_raw else None
-        self.alt_hover = self._scale(self.alt_raw, scale * hover_scale) if self.alt_raw else None
+        self.alt_path = alt_image_path
+        self.alt_image = self.alt_hover = None
+        if alt_image_path:
+            self.alt_image, self.alt_hover = self._load(alt_image_path, scale, hover_scale)
 
         # =========================
         # STATE
@@ -57,12 +52,15 @@ class ImageButton:
     # =========================
     # SCALE
     # =========================
-    def _scale(self, img, scale):
-        w = int(img.get_width() * scale * self.scale_x)
-        h = int(img.get_height() * scale * self.scale_y)
-        w = max(1, w)
-        h = max(1, h)
-        return pygame.transform.smoothscale(img, (w, h))
+    def _size(self, src_size, scale):
+        w = int(src_size[0] * scale * self.scale_x)
+        h = int(src_size[1] * scale * self.scale_y)
+        return max(1, w), max(1, h)
+
+    def _load(self, path, scale, hover_scale):
+        src = source_size(path)
+        sizes = [self._size(src, scale), self._size(src, scale * hover_scale)]
+        return load_sizes(path, sizes)
 
     # =========================
     # PIXEL-PERFECT
@@ -85,7 +83,7 @@ class ImageButton:
     # CURRENT IMAGE
     # =========================
     def _current_img(self):
-        if self.use_alt and self.alt_raw:
+        if self.use_alt and self.alt_image:
             return self.alt_hover if self.hover else self.alt_image
         return self.image_hover if self.hover else self.image
 
@@ -112,7 +110,7 @@ class ImageButton:
                 if callable(self.on_click):
                     self.on_click()
 
-                if self.alt_raw:
+                if self.alt_image:
                     self.use_alt = not self.use_alt
 
             self.pressed = False
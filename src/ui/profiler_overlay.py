@@ -0,0 +1,84 @@
+# src/ui/profiler_overlay.py
+import pygame
+
+from src.ui.text import GlyphCache
+
+
+class ProfilerOverlay:
+    """
+    Overlay F3: bảng p50 / p95 / p99 (ms) từng scope của PROFILER.
+    Nội dung dựng lại ~4 lần/giây; giữa 2 lần chỉ blit surface đã vẽ.
+    """
+
+    REFRESH = 0.25
+    COLS = ("p50", "p95", "p99")
+
+    def __init__(self, profiler, font):
+        self.profiler = profiler
+        self.glyphs = GlyphCache(font)
+        self.visible = False
+
+        self._t = 0.0
+        self._surf = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.profiler.enable(self.visible or bool(self.profiler.trace_path))
+        self._surf = None
+        return self.visible
+
+    def _rebuild(self):
+        rows = self.profiler.report()
+        counters = self.profiler.counter_report()
+        g = self.glyphs
+
+        name_w = max([g.width(n) for n, _ in rows] + [g.width("scope")])
+        col_w = g.width("0000.00")
+        pad = 8
+        lines = [f"{name} {last} (avg {mean:.1f})" for name, last, mean in counters]
+        w = pad * 2 + name_w + (col_w + pad) * len(self.COLS)
+        w = max([w] + [pad * 2 + g.width(t) for t in lines])
+        h = pad * 2 + g.line_h * (len(rows) + len(lines) + 2)
+
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+
+        y = pad
+        frame = self.profiler.stats("frame")
+        fps = 1000.0 / frame["mean"] if frame["mean"] > 0 else 0.0
+        g.draw(surf, f"{fps:5.1f} fps  ({self.profiler.frames} frames)", pad, y)
+        y += g.line_h
+
+        x = pad + name_w + pad
+        g.draw(surf, "scope", pad, y)
+        for c in self.COLS:
+            g.draw(surf, c, x + col_w - g.width(c), y)
+            x += col_w + pad
+        y += g.line_h
+
+        for name, s in rows:
+            g.draw(surf, name, pad, y)
+            x = pad + name_w + pad
+            for c in self.COLS:
+                txt = f"{s[c]:.2f}"
+                g.draw(surf, txt, x + col_w - g.width(txt), y)
+                x += col_w + pad
+            y += g.line_h
+
+        for t in lines:
+            g.draw(surf, t, pad, y)
+            y += g.line_h
+
+        self._surf = surf
+
+    def update(self, dt):
+        if not self.visible:
+            return
+        self._t -= dt
+        if self._t <= 0 or self._surf is None:
+            self._t = self.REFRESH
+            self._rebuild()
+
+    def draw(self, screen):
+        if self.visible and self._surf is not None:
+            screen.blit(self._surf, (8, 8))
@@ -0,0 +1,193 @@
+# src/ui/text.py
+"""
+Text renderer dùng chung (HUD, label điểm, floating text, overlay):
+- GlyphCache: mỗi (font, màu) render từng ký tự 1 lần, chuỗi = glyph đặt theo
+  advance (không kerning) -> cho chữ đổi liên tục, vd overlay profiler
+- TEXT (TextRenderer): font theo (path, size) + chuỗi font.render cả chuỗi (kèm viền /
+  bóng / alpha) trong LRU -> giống hệt font.render, chỉ render lại khi gặp chuỗi mới
+- RetainedText: ô chữ HUD, chỉ dựng lại khi giá trị đổi
+Surface trả về là dùng chung: không set_alpha / vẽ đè lên nó (muốn alpha -> text(alpha=...)).
+"""
+from collections import OrderedDict
+
+import pygame
+
+OUTLINE_DIRS = (
+    (-1, 0), (1, 0), (0, -1), (0, 1),
+    (-1, -1), (1, -1), (-1, 1), (1, 1),
+)
+
+# alpha của floating text làm tròn theo bậc này (ít bản cache hơn, mắt không thấy)
+ALPHA_STEP = 16
+
+
+class GlyphCache:
+    """Render từng ký tự 1 lần, ghép chuỗi bằng blit glyph cách nhau theo advance của font."""
+
+    def __init__(self, font, color=(235, 245, 255)):
+        self.font = font
+        self.color = color
+        self._glyphs = {}
+        self._advance = {}
+        self.line_h = font.get_linesize()
+        self.height = font.get_height()
+
+    def glyph(self, ch):
+        g = self._glyphs.get(ch)
+        if g is None:
+            g = self._glyphs[ch] = self.font.render(ch, True, self.color)
+        return g
+
+    def advance(self, ch):
+        a = self._advance.get(ch)
+        if a is None:
+            m = self.font.metrics(ch)
+            # ký tự font không có -> bề rộng glyph thay thế
+            a = self._advance[ch] = m[0][4] if m and m[0] else self.glyph(ch).get_width()
+        return a
+
+    def width(self, text):
+        return sum(self.advance(ch) for ch in text)
+
+    def draw(self, screen, text, x, y):
+        for ch in text:
+            screen.blit(self.glyph(ch), (x, y))
+            x += self.advance(ch)
+        return x
+
+
+class TextRenderer:
+    def __init__(self, max_items=512):
+        self.max_items = int(max_items)
+        self._fonts = {}
+        self._cache = OrderedDict()
+
+        # thống kê
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # =========================
+    # Fonts
+    # =========================
+    def font(self, path, size: int):
+        """Font theo (path, size), lỗi -> font mặc định (không tạo lại mỗi lần đổi size)."""
+        key = (path, int(size))
+        f = self._fonts.get(key)
+        if f is None:
+            try:
+                f = pygame.font.Font(path, int(size))
+            except Exception:
+                f = pygame.font.Font(None, int(size))
+            self._fonts[key] = f
+        return f
+
+    # =========================
+    # LRU
+    # =========================
+    def _get(self, key):
+        surf = self._cache.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def _put(self, key, surf):
+        self._cache[key] = surf
+        while len(self._cache) > self.max_items:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    # =========================
+    # Strings
+    # =========================
+    def text(self, font, text, color, alpha=255) -> pygame.Surface:
+        alpha = 255 if alpha >= 255 else max(0, int(alpha) // ALPHA_STEP * ALPHA_STEP)
+        key = ("t", font, text, tuple(color), alpha)
+        surf = self._get(key)
+        if surf is not None:
+            return surf
+
+        surf = font.render(text, True, color)
+        if alpha < 255:
+            surf.set_alpha(alpha)
+        return self._put(key, surf)
+
+    def outline(self, font, text, fill, outline=(0, 0, 0), thick=1) -> pygame.Surface:
+        """Chữ + viền 8 hướng dày `thick`; chữ nằm ở (thick, thick) trong surface."""
+        key = ("o", font, text, tuple(fill), tuple(outline), thick)
+        surf = self._get(key)
+        if surf is not None:
+            return surf
+
+        base = font.render(text, True, fill)
+        out = font.render(text, True, outline)
+        surf = pygame.Surface((base.get_width() + thick * 2, base.get_height() + thick * 2), pygame.SRCALPHA)
+        for dx, dy in OUTLINE_DIRS:
+            surf.blit(out, (thick + dx * thick, thick + dy * thick))
+        surf.blit(base, (thick, thick))
+        return self._put(key, surf)
+
+    def shadow(self, font, text, fill, shadow=(0, 0, 0), offset=1) -> pygame.Surface:
+        """Chữ ở (0, 0) + bóng lệch (offset, offset) phía dưới phải."""
+        key = ("s", font, text, tuple(fill), tuple(shadow), offset)
+        surf = self._get(key)
+        if surf is not None:
+            return surf
+
+        base = font.render(text, True, fill)
+        sh = font.render(text, True, shadow)
+        surf = pygame.Surface((base.get_width() + offset, base.get_height() + offset), pygame.SRCALPHA)
+        surf.blit(sh, (offset, offset))
+        surf.blit(base, (0, 0))
+        return self._put(key, surf)
+
+    def stats(self) -> dict:
+        return {
+            "fonts": len(self._fonts),
+            "items": len(self._cache),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# instance dùng chung
+TEXT = TextRenderer()
+
+
+class RetainedText:
+    """
+    Ô chữ giữ surface giữa các frame: set(value) chỉ format + lấy surface mới khi value đổi.
+    style: "plain" | "outline" | "shadow" (kw: outline/thick, shadow/offset).
+    """
+
+    def __init__(self, font, fmt=str, fill=(245, 250, 255), style="plain", renderer=None, **style_kw):
+        self.font = font
+        self.fmt = fmt
+        self.fill = fill
+        self.style = style
+        self.style_kw = style_kw
+        self.renderer = renderer or TEXT
+
+        self._value = object()
+        self.surface = None
+        self.rebuilds = 0
+
+    def set(self, value) -> pygame.Surface:
+        if value != self._value:
+            self._value = value
+            text = self.fmt(value)
+            r = self.renderer
+            if self.style == "outline":
+                self.surface = r.outline(self.font, text, self.fill, **self.style_kw)
+            elif self.style == "shadow":
+                self.surface = r.shadow(self.font, text, self.fill, **self.style_kw)
+            else:
+                self.surface = r.text(self.font, text, self.fill)
+            self.rebuilds += 1
+        return self.surface
@@ -0,0 +1,78 @@
+# src/world/bots.py
+import math
+
+
+class GreedyBot:
+    """
+    Bot đơn giản cho mô phỏng cân bằng:
+    - có mối nguy (cá to hơn / obstacle) trong danger_radius -> bơi ngược ra
+    - không thì đuổi con mồi ăn được gần nhất
+    Trả về hướng kiểu bàn phím (-1/0/1) như KeyboardInput.
+    Cần bind(world) sau khi tạo World.
+    """
+
+    def __init__(self, danger_radius=220.0, deadzone=0.35):
+        self.world = None
+        self.danger_radius = float(danger_radius)
+        self.deadzone = float(deadzone)
+
+    def bind(self, world):
+        self.world = world
+
+    def _edible(self, player, e, is_pred):
+        if is_pred:
+            return e.points <= int(player.points * 0.92)
+        return e.points <= int(player.points * 1.02)
+
+    def read(self, player):
+        w = self.world
+        if w is None:
+            return 0, 0
+
+        px, py = player.pos.x, player.pos.y
+        danger2 = self.danger_radius ** 2
+
+        flee_x = flee_y = 0.0
+        best, best_d2 = None, 10 ** 18
+
+        for group, is_pred in ((w.preys, False), (w.predators, True)):
+            for e in group:
+                if not e.alive:
+                    continue
+                dx, dy = e.pos.x - px, e.pos.y - py
+                d2 = dx * dx + dy * dy
+                if self._edible(player, e, is_pred):
+                    if d2 < best_d2:
+                        best, best_d2 = e, d2
+                elif d2 < danger2 and d2 > 1:
+                    k = 1.0 / d2
+                    flee_x -= dx * k
+                    flee_y -= dy * k
+
+        for d in w.drops:
+            if not d.alive or not str(d.kind).startswith("ob"):
+                continue
+            dx, dy = d.pos.x - px, d.pos.y - py
+            d2 = dx * dx + dy * dy
+            if 1 < d2 < danger2:
+                k = 1.0 / d2
+                flee_x -= dx * k
+                flee_y -= dy * k
+
+        if flee_x or flee_y:
+            vx, vy = flee_x, flee_y
+        elif best is not None:
+            vx, vy = best.pos.x - px, best.pos.y - py
+        else:
+            # không có gì: bơi về giữa map
+            vx, vy = w.world_w / 2 - px, w.world_h / 2 - py
+
+        n = math.hypot(vx, vy)
+        if n <= 1e-9:
+            return 0, 0
+        vx, vy = vx / n, vy / n
+        dz = self.deadzone
+        return (
+            (1 if vx > dz else -1 if vx < -dz else 0),
+            (1 if vy > dz else -1 if vy < -dz else 0),
+        )
@@ -11,9 +11,12 @@ class Camera:
     - world_to_screen trả về Vector2
     - shake ổn định (không dùng pygame.Vector2.random)
     - tương thích spawner: sw/sh
+    - nội suy lúc vẽ: alpha (0..1) giữa tick trước (prev_offset / prev_pos) và tick hiện tại,
+      alpha = 1 -> vẽ đúng vị trí sim (headless / tool không dùng fixed step)
     """
 
-    def __init__(self, screen_w, screen_h, world_w, world_h):
+    def __init__(self, screen_w, screen_h, world_w, world_h, rng=None):
+        self.rng = rng or random
         self.screen_w = int(screen_w)
         self.screen_h = int(screen_h)
 
@@ -25,6 +28,8 @@ class Camera:
         self.world_h = int(world_h)
 
         self.offset = pygame.Vector2(0, 0)
+        self.prev_offset = pygame.Vector2(0, 0)
+        self.alpha = 1.0
 
         # shake
         self.shake_time = 0.0
@@ -44,19 +49,57 @@ class Camera:
         self.offset.x = max(0, min(self.offset.x, max_x))
         self.offset.y = max(0, min(self.offset.y, max_y))
 
+    def render_offset(self) -> pygame.Vector2:
+        """Offset dùng để vẽ (nội suy theo alpha)."""
+        a = self.alpha
+        if a >= 1.0:
+            return pygame.Vector2(self.offset)
+        return self.prev_offset.lerp(self.offset, a)
+
     def world_to_screen(self, world_pos: pygame.Vector2) -> pygame.Vector2:
+        off = self.render_offset()
         pos = pygame.Vector2(
-            world_pos.x - self.offset.x,
-            world_pos.y - self.offset.y
+            world_pos.x - off.x,
+            world_pos.y - off.y
         )
         return pos + self._shake_offset
 
+    def entity_to_screen(self, e) -> pygame.Vector2:
+        """Như world_to_screen(e.pos) nhưng nội suy e.prev_pos -> e.pos theo alpha."""
+        a = self.alpha
+        if a >= 1.0:
+            return self.world_to_screen(e.pos)
+        return self.world_to_screen(e.prev_pos.lerp(e.pos, a))
+
     def screen_to_world(self, screen_pos: pygame.Vector2) -> pygame.Vector2:
         return pygame.Vector2(
             screen_pos.x + self.offset.x,
             screen_pos.y + self.offset.y
         ) - self._shake_offset
 
+    # =========================
+    # Culling
+    # =========================
+    def view_rect(self, margin=0) -> pygame.Rect:
+        """Vùng nhìn trong toạ độ world (nới thêm margin + biên độ shake)."""
+        m = int(margin + self.shake_strength)
+        return pygame.Rect(
+            int(self.offset.x) - m,
+            int(self.offset.y) - m,
+            self.screen_w + m * 2,
+            self.screen_h + m * 2,
+        )
+
+    def sees(self, world_pos, radius, view: pygame.Rect) -> bool:
+        """Hình tròn (world_pos, radius) có giao view_rect không."""
+        x, y = world_pos.x, world_pos.y
+        return (
+            x + radius >= view.left
+            and x - radius <= view.right
+            and y + radius >= view.top
+            and y - radius <= view.bottom
+        )
+
     def shake(self, strength=6, time=0.25):
         self.shake_strength = float(strength)
         self.shake_time = float(time)
@@ -66,8 +109,8 @@ class Camera:
             self.shake_time -= dt
             # random offset mỗi frame khi đang shake
             s = self.shake_strength
-            self._shake_offset.x = random.uniform(-s, s)
-            self._shake_offset.y = random.uniform(-s, s)
+            self._shake_offset.x = self.rng.uniform(-s, s)
+            self._shake_offset.y = self.rng.uniform(-s, s)
 
             if self.shake_time <= 0:
                 self.shake_time = 0.0
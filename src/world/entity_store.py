@@ -0,0 +1,432 @@
+# src/world/entity_store.py
+"""
+Entity store dạng structure-of-arrays (NumPy) cho prey / shy prey / predator.
+
+Mỗi thuộc tính là 1 mảng (x, y, vx, vy, timers, kind, points, scale,
+hit_radius...) và step() cập nhật toàn bộ AI wander / dart / shy /
+predator bằng phép toán mảng, kể cả ma trận khoảng cách tới players và
+bounce biên. Các class PreyFish / ShyPreyFish / PredatorFish vẫn là hành
+vi chuẩn; store chỉ tái hiện cùng công thức (RNG dùng numpy Generator nên
+không trùng từng số với bản object, chỉ trùng về phân phối).
+
+Tuỳ chọn: không có numpy thì HAS_NUMPY = False và EntityStore báo lỗi khi tạo.
+"""
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    np = None
+    HAS_NUMPY = False
+
+from src.entities.shy_prey_fish import ShyPreyFish
+from src.entities.ai_fish import PredatorFish
+
+
+KIND_WANDER = 0
+KIND_DART = 1
+KIND_SHY = 2
+KIND_PRED = 3
+
+
+class EntityStore:
+    """SoA cho cá AI. add(entity) -> index; step(dt, ...); write_back()."""
+
+    FLOAT_FIELDS = (
+        "x", "y", "vx", "vy", "speed", "scale", "hit_radius",
+        # prey wander / dart
+        "turn_t", "turn_cd", "dart_t", "dart_cd", "dart_time",
+        # shy + predator wander
+        "wander_t", "wander_cd", "wdir_x", "wdir_y",
+        "flee_radius", "flee_boost",
+        # predator
+        "aggro_radius", "chase_on", "chase_off", "chase_on_cd", "chase_off_cd",
+        "steer_gain", "wander_gain",
+        "dash_cd", "dash_t", "dash_left", "dash_time", "dash_speed",
+    )
+
+    BOUNCE_PAD = 40.0
+
+    def __init__(self, capacity=256, seed=None):
+        if not HAS_NUMPY:
+            raise RuntimeError("EntityStore cần numpy (pip install numpy)")
+
+        self.rng = np.random.default_rng(seed)
+        self.n = 0
+        self.capacity = 0
+        self.entities = []
+
+        self._alloc(max(16, int(capacity)))
+
+    # =========================
+    # Storage
+    # =========================
+    def _alloc(self, cap):
+        old_n = self.n
+        for name in self.FLOAT_FIELDS:
+            self._grow(name, cap, np.float64, old_n)
+        self._grow("points", cap, np.int32, old_n)
+        self._grow("kind", cap, np.int8, old_n)
+        self._grow("is_boss", cap, np.bool_, old_n)
+        self._grow("alive", cap, np.bool_, old_n)
+        self._grow("flip_x", cap, np.bool_, old_n)
+        self.capacity = cap
+
+    def _grow(self, name, cap, dtype, keep):
+        arr = np.zeros(cap, dtype=dtype)
+        old = getattr(self, name, None)
+        if old is not None and keep:
+            arr[:keep] = old[:keep]
+        setattr(self, name, arr)
+
+    def __len__(self):
+        return self.n
+
+    def add(self, e) -> int:
+        """Copy trạng thái 1 entity (PreyFish / ShyPreyFish / PredatorFish) vào store."""
+        if self.n >= self.capacity:
+            self._alloc(self.capacity * 2)
+
+        i = self.n
+        self.n += 1
+        self.entities.append(e)
+
+        self.x[i], self.y[i] = e.pos.x, e.pos.y
+        self.vx[i], self.vy[i] = e.vel.x, e.vel.y
+        self.points[i] = e.points
+        self.scale[i] = e.scale
+        self.hit_radius[i] = e.hit_radius
+        self.alive[i] = getattr(e, "alive", True)
+
+        if isinstance(e, PredatorFish):
+            self.kind[i] = KIND_PRED
+            self.speed[i] = e.speed
+            self.is_boss[i] = e.is_boss
+            self.aggro_radius[i] = e.aggro_radius
+            self.chase_on[i], self.chase_off[i] = e._chase_on, e._chase_off
+            self.chase_on_cd[i], self.chase_off_cd[i] = e._chase_on_cd, e._chase_off_cd
+            self.steer_gain[i], self.wander_gain[i] = e._steer_gain, e._wander_gain
+            self.wander_t[i], self.wander_cd[i] = e._wander_t, e._wander_cd
+            self.wdir_x[i], self.wdir_y[i] = e._wander_dir.x, e._wander_dir.y
+            self.dash_cd[i], self.dash_t[i] = e._dash_cd, e._dash_t
+            self.dash_left[i], self.dash_time[i] = e._dash_left, e._dash_time
+            self.dash_speed[i] = e._dash_speed
+            self.flip_x[i] = bool(e.sprite and e.sprite.flip_x)
+            return i
+
+        self.speed[i] = e.base_speed
+        self.turn_t[i], self.turn_cd[i] = e._turn_t, e._turn_cd
+        self.dart_t[i], self.dart_cd[i], self.dart_time[i] = e._dart_t, e._dart_cd, e._dart_time
+        self.flip_x[i] = e.flip_x
+
+        if isinstance(e, ShyPreyFish):
+            self.kind[i] = KIND_SHY
+            self.wander_t[i] = e._wander_t
+            self.flee_radius[i] = e.flee_radius
+            self.flee_boost[i] = e.flee_boost
+        elif e.ai == "dart":
+            self.kind[i] = KIND_DART
+        else:
+            self.kind[i] = KIND_WANDER
+        return i
+
+    def remove_dead(self):
+        """Nén mảng, bỏ entity alive=False (giữ thứ tự)."""
+        n = self.n
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        for name in self.FLOAT_FIELDS + ("points", "kind", "is_boss", "alive", "flip_x"):
+            arr = getattr(self, name)
+            arr[:len(keep)] = arr[keep]
+        self.entities = [self.entities[j] for j in keep]
+        self.n = len(keep)
+
+    def write_back(self):
+        """Đẩy pos / vel / flip ngược về object (để vẽ / va chạm bằng code cũ)."""
+        n = self.n
+        xs, ys = self.x[:n].tolist(), self.y[:n].tolist()
+        vxs, vys = self.vx[:n].tolist(), self.vy[:n].tolist()
+        flips = self.flip_x[:n].tolist()
+        for i, e in enumerate(self.entities):
+            e.pos.x, e.pos.y = xs[i], ys[i]
+            e.vel.x, e.vel.y = vxs[i], vys[i]
+            if hasattr(e, "flip_x"):
+                e.flip_x = flips[i]
+            if e.sprite:
+                e.sprite.flip_x = flips[i]
+
+    # =========================
+    # Helpers
+    # =========================
+    def _rand_dirs(self, k, min_len2):
+        ux = self.rng.uniform(-1.0, 1.0, k)
+        uy = self.rng.uniform(-1.0, 1.0, k)
+        l2 = ux * ux + uy * uy
+        ok = l2 > min_len2
+        inv = np.where(ok, 1.0 / np.sqrt(np.where(ok, l2, 1.0)), 0.0)
+        return np.where(ok, ux * inv, 1.0), np.where(ok, uy * inv, 0.0)
+
+    @staticmethod
+    def _set_speed(vx, vy, idx, speed):
+        """vel[idx] = normalize(vel[idx]) * speed, chỉ khi |vel|^2 > 1."""
+        ax, ay = vx[idx], vy[idx]
+        l2 = ax * ax + ay * ay
+        ok = l2 > 1.0
+        k = np.where(ok, speed / np.sqrt(np.where(ok, l2, 1.0)), 1.0)
+        vx[idx] = ax * k
+        vy[idx] = ay * k
+
+    def _nearest(self, ix, px, py):
+        """Ma trận khoảng cách (len(ix) x players) -> (dx, dy, d2) tới player gần nhất."""
+        dx = px[None, :] - self.x[ix][:, None]
+        dy = py[None, :] - self.y[ix][:, None]
+        d2 = dx * dx + dy * dy
+        j = np.argmin(d2, axis=1)
+        r = np.arange(len(ix))
+        return dx[r, j], dy[r, j], d2[r, j]
+
+    # =========================
+    # Behaviors
+    # =========================
+    def _wander(self, ix, dt):
+        vx, vy = self.vx, self.vy
+        self.turn_t[ix] += dt
+        fire = ix[self.turn_t[ix] >= self.turn_cd[ix]]
+        if len(fire):
+            self.turn_t[fire] = 0.0
+            self.turn_cd[fire] = self.rng.uniform(0.9, 1.6, len(fire))
+            dx, dy = self._rand_dirs(len(fire), 0.001)
+            s = self.speed[fire]
+            vx[fire] += (dx * s - vx[fire]) * 0.35
+            vy[fire] += (dy * s - vy[fire]) * 0.35
+        self._set_speed(vx, vy, ix, self.speed[ix])
+
+    def _dart(self, ix, dt):
+        vx, vy = self.vx, self.vy
+        self.turn_t[ix] += dt
+        fire = ix[self.turn_t[ix] >= 0.55]
+        if len(fire):
+            self.turn_t[fire] = 0.0
+            dx, dy = self._rand_dirs(len(fire), 0.001)
+            s = self.speed[fire]
+            vx[fire] += (dx * s - vx[fire]) * 0.55
+            vy[fire] += (dy * s - vy[fire]) * 0.55
+
+        self.dart_t[ix] += dt
+        active = self.dart_time[ix] > 0.0
+        on = ix[active]
+        self.dart_time[on] -= dt
+        start = ix[~active & (self.dart_t[ix] >= self.dart_cd[ix])]
+        if len(start):
+            self.dart_t[start] = 0.0
+            self.dart_cd[start] = self.rng.uniform(1.2, 2.4, len(start))
+            self.dart_time[start] = self.rng.uniform(0.18, 0.32, len(start))
+
+        boost = np.where(self.dart_time[ix] > 0.0, 1.65, 1.0)
+        self._set_speed(vx, vy, ix, self.speed[ix] * boost)
+
+    def _shy(self, ix, dt, px, py):
+        vx, vy = self.vx, self.vy
+        flee = np.zeros(len(ix), dtype=bool)
+        if len(px):
+            dx, dy, d2 = self._nearest(ix, px, py)
+            fr = self.flee_radius[ix]
+            flee = (d2 <= fr * fr) & (d2 > 1.0)
+
+        f = ix[flee]
+        if len(f):
+            d = np.sqrt(d2[flee])
+            fx, fy = -dx[flee] / d, -dy[flee] / d
+            top = self.speed[f] * self.flee_boost[f]
+            a = min(1.0, dt * 7.0)
+            vx[f] += (fx * top - vx[f]) * a
+            vy[f] += (fy * top - vy[f]) * a
+            self._set_speed(vx, vy, f, top)
+
+        w = ix[~flee]
+        if len(w):
+            self.wander_t[w] += dt
+            rot = w[self.wander_t[w] > 1.1]
+            if len(rot):
+                self.wander_t[rot] = 0.0
+                ang = self.rng.uniform(-0.65, 0.65, len(rot))
+                c, s = np.cos(ang), np.sin(ang)
+                ax, ay = vx[rot], vy[rot]
+                vx[rot] = ax * c - ay * s
+                vy[rot] = ax * s + ay * c
+            self._set_speed(vx, vy, w, self.speed[w])
+
+        # ShyPreyFish gọi tiếp PreyFish.update (ai="wander")
+        self._wander(ix, dt)
+
+    def _predator(self, ix, dt, px, py):
+        vx, vy = self.vx, self.vy
+        boss = self.is_boss[ix]
+
+        aggro = np.zeros(len(ix), dtype=bool)
+        if len(px):
+            dx, dy, d2 = self._nearest(ix, px, py)
+            ar = self.aggro_radius[ix]
+            aggro = d2 <= ar * ar
+
+        # ===== aggro: burst đuổi / nghỉ =====
+        a = ix[aggro]
+        if len(a):
+            ab = self.is_boss[a]
+            on = self.chase_on[a] > 0
+            off = ~on & (self.chase_off[a] > 0)
+            init = ~on & ~off
+
+            i_on = a[on]
+            self.chase_on[i_on] -= dt
+            end = self.chase_on[i_on] <= 0
+            e = i_on[end]
+            self.chase_off[e] = self.chase_off_cd[e]
+            self.chase_off_cd[e] = np.where(
+                self.is_boss[e],
+                self.rng.uniform(0.28, 0.55, len(e)),
+                self.rng.uniform(0.5, 0.9, len(e)),
+            )
+
+            i_off = a[off]
+            self.chase_off[i_off] -= dt
+            end = self.chase_off[i_off] <= 0
+            e = i_off[end]
+            self.chase_on[e] = self.chase_on_cd[e]
+            self.chase_on_cd[e] = np.where(
+                self.is_boss[e],
+                self.rng.uniform(1.4, 2.1, len(e)),
+                self.rng.uniform(1.0, 1.6, len(e)),
+            )
+
+            i_init = a[init]
+            self.chase_on[i_init] = self.chase_on_cd[i_init]
+
+            ddx, ddy = dx[aggro], dy[aggro]
+            dist = np.sqrt(d2[aggro])
+            far = dist > 1
+            inv = np.where(far, 1.0 / np.where(far, dist, 1.0), 0.0)
+            dirx = np.where(far, ddx * inv, 1.0)
+            diry = np.where(far, ddy * inv, 0.0)
+
+            # dash (boss)
+            dashing = ab & (self.dash_left[a] > 0)
+            d = a[dashing]
+            if len(d):
+                self.dash_left[d] -= dt
+                g = min(1.0, dt * 10.0)
+                sp = self.dash_speed[d]
+                vx[d] += (dirx[dashing] * sp - vx[d]) * g
+                vy[d] += (diry[dashing] * sp - vy[d]) * g
+
+            idle = ab & ~dashing
+            b = a[idle]
+            if len(b):
+                self.dash_t[b] += dt
+                go = (
+                    (dist[idle] < 260)
+                    & (self.dash_t[b] >= self.dash_cd[b])
+                    & (self.chase_off[b] <= 0)
+                )
+                g = b[go]
+                self.dash_t[g] = 0.0
+                self.dash_cd[g] = self.rng.uniform(1.8, 3.0, len(g))
+                self.dash_left[g] = self.dash_time[g]
+
+            steer = ~(ab & (self.dash_left[a] > 0))
+            rest = steer & (self.chase_off[a] > 0)
+            chase = steer & ~rest
+
+            r = a[rest]
+            if len(r):
+                k = self.speed[r] * np.where(self.is_boss[r], 0.58, 0.55)
+                gain = np.minimum(1.0, dt * self.wander_gain[r])
+                vx[r] += (self.wdir_x[r] * k - vx[r]) * gain
+                vy[r] += (self.wdir_y[r] * k - vy[r]) * gain
+
+            c = a[chase]
+            if len(c):
+                cb = self.is_boss[c]
+                cd = dist[chase]
+                slow = np.minimum(1.0, np.maximum(np.where(cb, 0.48, 0.35), cd / np.where(cb, 460.0, 420.0)))
+                close = cd < np.where(cb, 135.0, 120.0)
+                slow = np.where(close, np.minimum(1.0, slow + np.where(cb, 0.16, 0.10)), slow)
+                k = self.speed[c] * slow
+                gain = np.minimum(1.0, dt * self.steer_gain[c])
+                vx[c] += (dirx[chase] * k - vx[c]) * gain
+                vy[c] += (diry[chase] * k - vy[c]) * gain
+
+        # ===== ngoài aggro: wander =====
+        w = ix[~aggro]
+        if len(w):
+            self.wander_t[w] += dt
+            fire = w[self.wander_t[w] >= self.wander_cd[w]]
+            if len(fire):
+                self.wander_t[fire] = 0.0
+                self.wander_cd[fire] = self.rng.uniform(0.9, 1.8, len(fire))
+                self.wdir_x[fire], self.wdir_y[fire] = self._rand_dirs(len(fire), 0.01)
+            k = self.speed[w] * np.where(self.is_boss[w], 0.55, 0.50)
+            gain = np.minimum(1.0, dt * self.wander_gain[w])
+            vx[w] += (self.wdir_x[w] * k - vx[w]) * gain
+            vy[w] += (self.wdir_y[w] * k - vy[w]) * gain
+
+        # clamp velocity
+        ax, ay = vx[ix], vy[ix]
+        ln = np.sqrt(ax * ax + ay * ay)
+        maxv = self.speed[ix] * np.where(boss & (self.dash_left[ix] > 0), 1.35, 1.0)
+        over = (ln * ln > 1.0) & (ln > maxv)
+        k = np.where(over, maxv / np.where(over, ln, 1.0), 1.0)
+        vx[ix] = ax * k
+        vy[ix] = ay * k
+
+        moving = vx[ix] != 0
+        m = ix[moving]
+        self.flip_x[m] = vx[m] < 0
+
+    # =========================
+    # Step
+    # =========================
+    def step(self, dt, world_w, world_h, players=()):
+        """1 tick cho toàn bộ cá còn sống (giống update() của từng class)."""
+        n = self.n
+        if n == 0:
+            return
+
+        players = list(players or ())
+        px_all = np.array([p.pos.x for p in players], dtype=np.float64)
+        py_all = np.array([p.pos.y for p in players], dtype=np.float64)
+        alive_p = np.array([getattr(p, "lives", 1) > 0 for p in players], dtype=bool)
+
+        kind = self.kind[:n]
+        alive = self.alive[:n]
+
+        # ===== prey (wander / dart / shy) =====
+        self._wander(np.flatnonzero(kind == KIND_WANDER), dt)
+        self._dart(np.flatnonzero(kind == KIND_DART), dt)
+        # shy nhìn mọi player (kể cả đã chết) như bản object
+        self._shy(np.flatnonzero(kind == KIND_SHY), dt, px_all, py_all)
+
+        prey = np.flatnonzero(kind != KIND_PRED)
+        if len(prey):
+            x, y, vx, vy = self.x, self.y, self.vx, self.vy
+            x[prey] += vx[prey] * dt
+            y[prey] += vy[prey] * dt
+
+            pad = self.BOUNCE_PAD
+            for pos, vel, hi in ((x, vx, world_w - pad), (y, vy, world_h - pad)):
+                p = pos[prey]
+                lo_hit = p < pad
+                hi_hit = ~lo_hit & (p > hi)
+                hit = prey[lo_hit | hi_hit]
+                pos[prey] = np.where(lo_hit, pad, np.where(hi_hit, hi, p))
+                vel[hit] *= -1
+
+            pv = vx[prey]
+            self.flip_x[prey] = np.where(pv < 0, True, np.where(pv > 0, False, self.flip_x[prey]))
+
+        # ===== predator (chỉ player còn sống) =====
+        pred = np.flatnonzero((kind == KIND_PRED) & alive)
+        if len(pred):
+            self._predator(pred, dt, px_all[alive_p], py_all[alive_p])
+            self.x[pred] = np.clip(self.x[pred] + self.vx[pred] * dt, 0, world_w)
+            self.y[pred] = np.clip(self.y[pred] + self.vy[pred] * dt, 0, world_h)
@@ -0,0 +1,96 @@
+# src/world/pools.py
+"""
+Object pool cho entity sống ngắn (prey, predator, drop, floating text):
+- entity chết (bị ăn / despawn / rơi khỏi map) -> release() vào pool
+- spawn -> acquire(): lấy object cũ + obj.reset(...) (cùng tham số __init__),
+  hết thì mới tạo mới -> không vứt bỏ Vector2 / AnimatedSprite / label cache mỗi lần spawn
+- compact(): bỏ entity chết khỏi list tại chỗ (không dựng list mới mỗi tick)
+Mỗi class entity: __init__ tạo field 1 lần rồi gọi reset(); reset() đặt lại toàn bộ state.
+"""
+from src.entities.prey import PreyFish
+from src.entities.shy_prey_fish import ShyPreyFish
+from src.entities.ai_fish import PredatorFish
+from src.entities.powerup import PowerUp
+from src.entities.obstacle import Obstacle
+from src.entities.floating_text import FloatingText
+
+# giữ tối đa chừng này object rảnh / kiểu (trận đông nhất ~50 cá)
+MAX_FREE = 64
+
+
+class Pool:
+    """Pool 1 kiểu: acquire(*args, **kw) ~ cls(*args, **kw)."""
+
+    def __init__(self, cls, max_free=MAX_FREE, enabled=True):
+        self.cls = cls
+        self.max_free = int(max_free)
+        self.enabled = bool(enabled)
+        self._free = []
+
+        # thống kê
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args, **kw):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kw)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kw)
+
+    def release(self, obj):
+        if self.enabled and len(self._free) < self.max_free:
+            self._free.append(obj)
+            self.released += 1
+
+    def stats(self) -> dict:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "free": len(self._free),
+        }
+
+
+class EntityPools:
+    """Pool theo từng kiểu entity của 1 trận (World giữ, Spawner / DropSpawner dùng chung)."""
+
+    def __init__(self, enabled=True):
+        self.prey = Pool(PreyFish, enabled=enabled)
+        self.shy = Pool(ShyPreyFish, enabled=enabled)
+        self.predator = Pool(PredatorFish, enabled=enabled)
+        self.powerup = Pool(PowerUp, enabled=enabled)
+        self.obstacle = Pool(Obstacle, enabled=enabled)
+        self.floating = Pool(FloatingText, enabled=enabled)
+
+        self._by_cls = {p.cls: p for p in self.all()}
+
+    def all(self):
+        return (self.prey, self.shy, self.predator, self.powerup, self.obstacle, self.floating)
+
+    def release(self, obj):
+        pool = self._by_cls.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    def stats(self) -> dict:
+        return {p.cls.__name__: p.stats() for p in self.all()}
+
+
+def compact(items, keep, release=None):
+    """
+    Giữ lại phần tử có keep(e) == True, tại chỗ và giữ nguyên thứ tự
+    (thứ tự list = thứ tự vẽ / update, đảo thứ tự làm cá chồng nhau nhảy lớp).
+    Phần tử bị bỏ -> release(e).
+    """
+    j = 0
+    for e in items:
+        if keep(e):
+            items[j] = e
+            j += 1
+        elif release is not None:
+            release(e)
+    del items[j:]
@@ -0,0 +1,526 @@
+# src/world/replay.py
+"""
+Replay 1 trận (tái hiện giật khung / chết "oan" do người chơi báo):
+- World đã tất định: RNG seeded riêng của trận + bước sim cố định
+  -> chỉ cần header (seed, map, player, config cá) + input từng tick + dt từng frame
+- ghi: ReplayRecorder bọc input player, mỗi frame append vài byte vào buffer,
+  thread riêng nén (zlib) + ghi đĩa -> không chặn frame
+- phát: ReplayPlayer dựng lại World từ header, đẩy input từng tick;
+  1x (GameScene, có sprite, theo dt đã ghi) hoặc headless tối đa tốc độ (replay.py)
+- checkpoint digest mỗi CHECK_EVERY tick -> biết chính xác tick bắt đầu lệch
+- seek: snapshot World (deepcopy) mỗi SNAPSHOT_EVERY tick trong lúc phát,
+  seek = khôi phục snapshot gần nhất trước đó rồi chạy tiếp
+
+File (.fgr): MAGIC + version (1 byte) + luồng zlib gồm các record:
+  H <u32 len> <json header>
+  F <f32 dt> <u8 n> <n byte input>      1 frame: dt thật + n tick sim
+  C <u32 tick> <u32 crc>                 checkpoint
+  E <u32 len> <json footer>              kết thúc (result, ticks, digest...)
+1 byte input / tick: player 1 ở 4 bit thấp, player 2 ở 4 bit cao, mã = (x+1)*3 + (y+1).
+"""
+import atexit
+import copy
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+from src.entities.player import PlayerFish
+from src.world.world import World
+
+MAGIC = b"FGRP"
+# 2: RNG tách stream theo hệ thống / entity (src/core/rng.py) -> replay v1 không phát lại được
+# 3: spawn / drop chọn bằng bảng alias (src/core/sampler.py) -> cùng seed ra cá khác
+VERSION = 3
+EXT = ".fgr"
+
+# checkpoint digest mỗi 1 giây sim, snapshot để seek mỗi 5 giây
+CHECK_EVERY = 60
+SNAPSHOT_EVERY = 300
+
+# buffer đủ chừng này byte thì đẩy sang thread ghi
+FLUSH_BYTES = 4096
+
+_F = struct.Struct("<fB")
+_C = struct.Struct("<II")
+_U32 = struct.Struct("<I")
+
+# (x, y) kiểu bàn phím <-> mã 0..8
+DIRS = [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1)]
+
+
+def _axis(v) -> int:
+    return -1 if v < 0 else 1 if v > 0 else 0
+
+
+def encode_dir(d) -> int:
+    return (_axis(d[0]) + 1) * 3 + (_axis(d[1]) + 1)
+
+
+# =========================
+# World helpers
+# =========================
+def state_digest(world) -> int:
+    """crc32 của state quan trọng (RNG, player, số entity) -> so sánh khi phát lại."""
+    parts = [repr(world.spawner.rng.getstate()).encode(), repr(world.drop_spawner.rng.getstate()).encode()]
+    parts.append(struct.pack("<Iiii", world.ticks, len(world.preys), len(world.predators), len(world.drops)))
+    for p in world.players:
+        parts.append(struct.pack("<ddii", p.pos.x, p.pos.y, int(p.points), int(p.lives)))
+    return zlib.crc32(b"".join(parts))
+
+
+def snapshot_world(world):
+    """
+    Bản sao sâu cả trận. Surface không deepcopy được:
+    frames của AnimatedSprite dùng chung (AnimatedSprite.__deepcopy__),
+    label cache của entity cũng dùng chung qua memo.
+    """
+    memo = {}
+    groups = [world.players, world.preys, world.predators]
+    groups += [pool._free for pool in world.pools.all()]
+    for group in groups:
+        for e in group:
+            surf = getattr(e, "_label_surf", None)
+            if surf is not None:
+                memo[id(surf)] = surf
+    return copy.deepcopy(world, memo)
+
+
+# =========================
+# Inputs
+# =========================
+class RecordingInput:
+    """Bọc input thật, nhớ hướng đọc được ở tick hiện tại."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.last = (0, 0)
+
+    def bind(self, world):
+        if hasattr(self.inner, "bind"):
+            self.inner.bind(world)
+
+    def read(self, player):
+        self.last = self.inner.read(player)
+        return self.last
+
+
+class ReplayInput:
+    """Trả về hướng ReplayPlayer đặt cho tick hiện tại."""
+
+    def __init__(self):
+        self.value = (0, 0)
+
+    def read(self, player):
+        return self.value
+
+
+# =========================
+# Write
+# =========================
+_OPEN = []
+
+
+@atexit.register
+def _close_all():
+    # thoát game giữa trận -> vẫn ghi nốt phần đã có
+    for w in list(_OPEN):
+        w.close()
+
+
+class ReplayWriter:
+    """
+    Ghi record: frame chỉ append vào bytearray (không I/O);
+    đủ FLUSH_BYTES thì đẩy sang thread nền nén + ghi file.
+    Mỗi lần ghi flush zlib (Z_SYNC_FLUSH) -> file dở dang vẫn đọc được.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._buf = bytearray()
+        self._q = queue.Queue()
+        self._closed = False
+        self.bytes_in = 0
+
+        self._thread = threading.Thread(target=self._run, name="replay-writer", daemon=True)
+        self._thread.start()
+        _OPEN.append(self)
+
+    def write(self, data):
+        if self._closed:
+            return
+        self._buf += data
+        if len(self._buf) >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self.bytes_in += len(self._buf)
+            self._q.put(bytes(self._buf))
+            self._buf.clear()
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._q.put(None)
+        self._thread.join(timeout=5.0)
+        if self in _OPEN:
+            _OPEN.remove(self)
+
+    def _run(self):
+        z = zlib.compressobj(6)
+        f = None
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            f = open(self.path, "wb")
+            f.write(MAGIC + bytes([VERSION]))
+            while True:
+                chunk = self._q.get()
+                if chunk is None:
+                    f.write(z.flush())
+                    break
+                f.write(z.compress(chunk) + z.flush(zlib.Z_SYNC_FLUSH))
+                f.flush()
+        except Exception as e:
+            print("[WARN] Replay write failed:", self.path, e)
+            # bỏ phần còn lại, không để frame chờ queue
+            while self._q.get() is not None:
+                pass
+        finally:
+            if f is not None:
+                f.close()
+
+
+class ReplayRecorder:
+    """
+    Ghi 1 trận đang chơi. Dùng trong GameScene:
+        rec = ReplayRecorder(world, path, fish=[...])   # ngay sau khi tạo World
+        mỗi tick sim: world.step(); rec.tick()
+        cuối update:  rec.frame(dt)
+        hết trận:     rec.close()
+    """
+
+    def __init__(self, world, path, fish=()):
+        self.world = world
+        self.path = path
+        self.inputs = []
+        for p in world.players:
+            src = RecordingInput(p.input)
+            p.input = src
+            self.inputs.append(src)
+
+        self._ticks = bytearray()
+        self.frames = 0
+        self.writer = ReplayWriter(path)
+
+        header = self._header(world, fish)
+        data = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        self.writer.write(b"H" + _U32.pack(len(data)) + data)
+
+    @staticmethod
+    def _header(world, fish):
+        key = f"map{world.map_id}"
+        return {
+            "version": VERSION,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "seed": world.seed,
+            "map": world.map,
+            "mode": world.mode,
+            "fixed_dt": world.fixed_dt,
+            "view_size": [world.camera.sw, world.camera.sh],
+            "target": world.TARGET_POINTS,
+            "enemies": {key: world.spawner.enemies_cfg.get(key, [])},
+            "players": [
+                {
+                    "fish": fish[i] if i < len(fish) else None,
+                    "frame_size": list(p.frame_size),
+                    "pos": [p.pos.x, p.pos.y],
+                    "points": p.points,
+                    "lives": p.lives,
+                }
+                for i, p in enumerate(world.players)
+            ],
+        }
+
+    def tick(self):
+        """Gọi sau mỗi world.step(): ghi input của tick (+ checkpoint)."""
+        ins = self.inputs
+        b = encode_dir(ins[0].last)
+        ins[0].last = (0, 0)
+        if len(ins) > 1:
+            b |= encode_dir(ins[1].last) << 4
+            ins[1].last = (0, 0)
+        self._ticks.append(b)
+
+        w = self.world
+        if w.ticks % CHECK_EVERY == 0:
+            self.writer.write(b"C" + _C.pack(w.ticks, state_digest(w)))
+
+    def frame(self, dt):
+        """Gọi 1 lần / frame (kể cả frame không có tick nào)."""
+        self.writer.write(b"F" + _F.pack(dt, len(self._ticks)) + self._ticks)
+        self._ticks.clear()
+        self.frames += 1
+
+    def close(self, result=None):
+        if self._ticks:
+            self.frame(0.0)
+        w = self.world
+        footer = {
+            "result": result or w.result or "quit",
+            "ticks": w.ticks,
+            "elapsed": w.elapsed,
+            "frames": self.frames,
+            "points": w.team_points(),
+            "lives": [p.lives for p in w.players],
+            "digest": state_digest(w),
+        }
+        data = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+        self.writer.write(b"E" + _U32.pack(len(data)) + data)
+        self.writer.close()
+
+
+def new_replay_path(folder, map_id, mode) -> str:
+    name = time.strftime("%Y%m%d_%H%M%S") + f"_map{int(map_id)}_{int(mode)}p{EXT}"
+    return os.path.join(folder, name)
+
+
+def prune_replays(folder, keep):
+    """Giữ `keep` file replay mới nhất (tên bắt đầu bằng thời gian)."""
+    try:
+        names = sorted(n for n in os.listdir(folder) if n.endswith(EXT))
+    except OSError:
+        return
+    for n in names[:max(0, len(names) - int(keep))]:
+        try:
+            os.remove(os.path.join(folder, n))
+        except OSError as e:
+            print("[WARN] Cannot remove old replay:", n, e)
+
+
+# =========================
+# Read
+# =========================
+class Replay:
+    """Nội dung 1 file replay: header, frames [(dt, bytes input)], checkpoint, footer."""
+
+    def __init__(self, header, frames, checks, footer=None, path=None):
+        self.header = header
+        self.frames = frames
+        self.checks = checks
+        self.footer = footer
+        self.path = path
+
+    @property
+    def ticks(self) -> int:
+        return sum(len(t) for _, t in self.frames)
+
+
+def load_replay(path) -> Replay:
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:4] != MAGIC:
+        raise ValueError(f"not a replay file: {path}")
+    if raw[4] != VERSION:
+        raise ValueError(f"unsupported replay version {raw[4]}: {path}")
+
+    # decompressobj: file dở dang (game bị tắt) vẫn đọc được tới chỗ đã ghi
+    data = zlib.decompressobj().decompress(raw[5:])
+
+    header, footer = None, None
+    frames, checks = [], {}
+    i, n = 0, len(data)
+    while i < n:
+        tag = data[i:i + 1]
+        i += 1
+        if tag == b"F":
+            if i + _F.size > n:
+                break
+            dt, k = _F.unpack_from(data, i)
+            i += _F.size
+            if i + k > n:
+                break
+            frames.append((dt, data[i:i + k]))
+            i += k
+        elif tag == b"C":
+            if i + _C.size > n:
+                break
+            tick, crc = _C.unpack_from(data, i)
+            checks[tick] = crc
+            i += _C.size
+        elif tag in (b"H", b"E"):
+            if i + 4 > n:
+                break
+            (k,) = _U32.unpack_from(data, i)
+            i += 4
+            if i + k > n:
+                break
+            obj = json.loads(data[i:i + k].decode("utf-8"))
+            i += k
+            if tag == b"H":
+                header = obj
+            else:
+                footer = obj
+        else:
+            raise ValueError(f"bad replay record {tag!r} at {i - 1}: {path}")
+
+    if header is None:
+        raise ValueError(f"replay has no header: {path}")
+    return Replay(header, frames, checks, footer, path)
+
+
+# =========================
+# Playback
+# =========================
+class ReplayPlayer:
+    """
+    Dựng lại World từ Replay và phát từng frame đã ghi.
+    sprites=False -> headless (không cần màn hình / asset cá).
+    """
+
+    def __init__(self, replay: Replay, sprites=False, snapshot_every=SNAPSHOT_EVERY):
+        self.replay = replay
+        self.sprites = bool(sprites)
+        self.snapshot_every = int(snapshot_every)
+
+        self.inputs = [ReplayInput() for _ in replay.header["players"]]
+        self.world = self._new_world()
+        self.frame_i = 0
+
+        # tick đầu tiên digest lệch với bản ghi (None = khớp)
+        self.desync = None
+        self.checked = 0
+
+        # [(tick, frame_i, world)] tăng dần theo tick
+        self.snapshots = [(0, 0, snapshot_world(self.world))]
+
+    def _new_world(self):
+        h = self.replay.header
+        players = []
+        for i, ph in enumerate(h["players"]):
+            fish = ph.get("fish") if self.sprites else None
+            p = PlayerFish(
+                pos=ph["pos"],
+                fish_folder=fish,
+                player_id=i + 1,
+                input_source=self.inputs[i],
+                frame_size=ph["frame_size"],
+            )
+            p.points = ph["points"]
+            p.lives = ph["lives"]
+            players.append(p)
+
+        world = World(
+            h["map"],
+            players,
+            mode=h["mode"],
+            seed=h["seed"],
+            view_size=h["view_size"],
+            enemies_cfg=h["enemies"],
+            load_sprites=self.sprites,
+            fixed_dt=h["fixed_dt"],
+            targets={int(h["map"].get("id", 1)): h["target"]},
+        )
+        return world
+
+    # =========================
+    # State
+    # =========================
+    @property
+    def tick(self) -> int:
+        return self.world.ticks
+
+    @property
+    def done(self) -> bool:
+        return self.frame_i >= len(self.replay.frames) or self.world.result is not None
+
+    # =========================
+    # Step
+    # =========================
+    def next_frame(self):
+        """Phát 1 frame đã ghi -> (dt, số tick) hoặc None khi hết."""
+        if self.done:
+            return None
+        dt, ticks = self.replay.frames[self.frame_i]
+        self.frame_i += 1
+
+        for b in ticks:
+            self._step(b)
+            if self.world.result is not None:
+                break
+
+        if self.world.ticks - self.snapshots[-1][0] >= self.snapshot_every:
+            self.snapshots.append((self.world.ticks, self.frame_i, snapshot_world(self.world)))
+        return dt, len(ticks)
+
+    def _step(self, b):
+        ins = self.inputs
+        ins[0].value = DIRS[b & 15]
+        if len(ins) > 1:
+            ins[1].value = DIRS[b >> 4]
+
+        w = self.world
+        w.step()
+
+        crc = self.replay.checks.get(w.ticks)
+        if crc is not None:
+            self.checked += 1
+            if self.desync is None and state_digest(w) != crc:
+                self.desync = w.ticks
+
+    def run(self):
+        """Chạy tới hết (headless, tối đa tốc độ) -> verify()."""
+        while self.next_frame() is not None:
+            pass
+        return self.verify()
+
+    # =========================
+    # Seek
+    # =========================
+    def seek(self, tick: int):
+        """Tới tick (tính theo biên frame): khôi phục snapshot gần nhất <= tick rồi chạy tiếp."""
+        tick = max(0, int(tick))
+        best = None
+        for snap in self.snapshots:
+            if snap[0] > tick:
+                break
+            best = snap
+
+        # chỉ khôi phục khi phải lùi, hoặc snapshot xa hơn vị trí hiện tại
+        if tick < self.world.ticks or best[0] > self.world.ticks:
+            self._restore(best)
+
+        while self.world.ticks < tick and self.next_frame() is not None:
+            pass
+
+    def _restore(self, snap):
+        _, frame_i, world = snap
+        self.world = snapshot_world(world)
+        self.frame_i = frame_i
+        for p, src in zip(self.world.players, self.inputs):
+            p.input = src
+
+    # =========================
+    # Verify
+    # =========================
+    def verify(self) -> dict:
+        foot = self.replay.footer or {}
+        w = self.world
+        digest_ok = None
+        if foot and self.done:
+            digest_ok = state_digest(w) == foot.get("digest")
+        return {
+            "ok": self.desync is None and digest_ok is not False,
+            "desync": self.desync,
+            "checked": self.checked,
+            "ticks": w.ticks,
+            "result": w.result,
+            "points": w.team_points(),
+            "expected": foot or None,
+            "digest_ok": digest_ok,
+        }
@@ -0,0 +1,121 @@
+# src/world/sim.py
+import os
+import json
+import time
+import random
+
+from src.core.input import NullInput, RandomWalkInput
+from src.core.rng import derive
+from src.entities.player import PlayerFish
+from src.world.world import World
+from src.world.bots import GreedyBot
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+# =========================
+# Helpers
+# =========================
+def load_map(map_id: int) -> dict:
+    path = os.path.join(PROJECT_ROOT, "data", "maps", f"map{int(map_id)}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {
+            "id": int(map_id),
+            "name": f"Map {int(map_id)}",
+            "bg": None,
+            "world_size": [3200, 1800],
+        }
+
+
+def make_input(kind: str, rng, dt):
+    if kind == "random":
+        return RandomWalkInput(rng=rng, dt=dt)
+    if kind == "bot":
+        return GreedyBot()
+    return NullInput()
+
+
+def make_players(map_data, mode=1, inputs=()):
+    """Players không sprite, vị trí xuất phát giống GameScene."""
+    world_w, world_h = map_data.get("world_size", [2400, 1344])
+    players = []
+    for i in range(2 if int(mode) == 2 else 1):
+        x = world_w / 2 + (80 if i else -80)
+        src = inputs[i] if i < len(inputs) else NullInput()
+        p = PlayerFish(pos=(x, world_h / 2), player_id=i + 1, input_source=src)
+        p.points = 5
+        players.append(p)
+    return players
+
+
+# =========================
+# Run
+# =========================
+def run_match(
+    map_id=1,
+    mode=1,
+    seed=None,
+    seconds=600.0,
+    input_kind="random",
+    enemies_cfg=None,
+    targets=None,
+    drop_cfg=None,
+    sample_every=10.0,
+):
+    """
+    Chạy 1 trận headless (không sprite, không vẽ) tới khi thắng/thua
+    hoặc hết `seconds` mô phỏng. Trả về dict kết quả (kèm đường điểm
+    lấy mẫu mỗi `sample_every` giây).
+    """
+    seed = seed if seed is not None else random.randrange(2 ** 32)
+    map_data = load_map(map_id)
+
+    # input có RNG riêng (tách khỏi RNG của trận)
+    in_rng = derive(seed, "input")
+    dt = World.FIXED_DT
+    inputs = [make_input(input_kind, in_rng, dt) for _ in range(2)]
+
+    world = World(
+        map_data,
+        make_players(map_data, mode, inputs),
+        mode=mode,
+        seed=seed,
+        enemies_cfg=enemies_cfg,
+        load_sprites=False,
+        targets=targets,
+        drop_cfg=drop_cfg,
+    )
+    for src in inputs:
+        if hasattr(src, "bind"):
+            src.bind(world)
+
+    every = max(1, int(round(float(sample_every) / dt)))
+    n = int(round(float(seconds) / dt))
+    curve = [world.team_points()]
+
+    t0 = time.perf_counter()
+    for i in range(1, n + 1):
+        done = world.step() is not None
+        if i % every == 0 or done:
+            curve.append(world.team_points())
+        if done:
+            break
+    wall = time.perf_counter() - t0
+
+    return {
+        "map_id": int(map_id),
+        "mode": int(mode),
+        "seed": seed,
+        "result": world.result or "timeout",
+        "sim_seconds": world.elapsed,
+        "ticks": world.ticks,
+        "points": world.team_points(),
+        "target": world.TARGET_POINTS,
+        "lives": [p.lives for p in world.players],
+        "deaths": sum(p.deaths for p in world.players),
+        "curve": curve,
+        "wall_seconds": wall,
+    }
@@ -0,0 +1,161 @@
+# src/world/spatial_hash.py
+from operator import attrgetter
+
+
+class SpatialHash:
+    """
+    Lưới đều (uniform grid) cho broad-phase va chạm:
+    - mỗi tick bucket entity theo tâm (pos) vào ô cell_size x cell_size
+    - query(x, y, r) chỉ duyệt các ô chồng lên vòng tròn (mở rộng thêm
+      max_radius để không sót entity có tâm ở ô bên cạnh)
+    - incremental=False: rebuild O(n) mỗi tick (đơn giản, ổn định)
+    - incremental=True : chỉ di chuyển entity đổi ô + gỡ entity đã biến mất
+      (lợi khi phần lớn cá đứng yên trong ô của nó giữa 2 tick)
+    - radius_attr: tên thuộc tính bán kính (cá: hit_radius, drop: radius)
+    """
+
+    def __init__(self, cell_size=128, incremental=False, radius_attr="hit_radius"):
+        self.cell_size = max(8, int(cell_size))
+        self.incremental = bool(incremental)
+        self._radius_of = attrgetter(radius_attr)
+
+        # (cx, cy) -> list entity
+        self._cells = {}
+        # id(entity) -> [entity, key, generation] (chỉ dùng cho incremental)
+        self._where = {}
+        self._gen = 0
+
+        # bán kính lớn nhất đã thấy -> nới vùng query
+        self.max_radius = 0.0
+
+    # =========================
+    # Helpers
+    # =========================
+    def clear(self):
+        self._cells.clear()
+        self._where.clear()
+        self.max_radius = 0.0
+
+    def __len__(self):
+        return sum(len(c) for c in self._cells.values())
+
+    # =========================
+    # Build
+    # =========================
+    def rebuild(self, entities):
+        """Xoá sạch rồi bucket lại toàn bộ (O(n))."""
+        self._cells.clear()
+        self._where.clear()
+        cells = self._cells
+        cs = self.cell_size
+        live = []
+
+        for e in entities:
+            if not e.alive:
+                continue
+            live.append(e)
+            pos = e.pos
+            key = (int(pos.x // cs), int(pos.y // cs))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [e]
+            else:
+                bucket.append(e)
+
+        self.max_radius = float(max(map(self._radius_of, live), default=0.0))
+
+    def update(self, entities):
+        """
+        Cập nhật tăng dần: entity giữ nguyên ô thì không động tới,
+        entity đổi ô thì chuyển bucket, entity không còn trong list
+        (hoặc alive=False) thì gỡ ra.
+        """
+        self._gen += 1
+        gen = self._gen
+        cells = self._cells
+        where = self._where
+        cs = self.cell_size
+        max_r = self.max_radius
+
+        for e in entities:
+            if not e.alive:
+                continue
+            pos = e.pos
+            key = (int(pos.x // cs), int(pos.y // cs))
+            slot = where.get(id(e))
+
+            if slot is None:
+                where[id(e)] = [e, key, gen]
+                cells.setdefault(key, []).append(e)
+                r = self._radius_of(e)
+                if r > max_r:
+                    max_r = r
+                continue
+
+            slot[2] = gen
+            old = slot[1]
+            if old != key:
+                self._remove_from_cell(old, e)
+                cells.setdefault(key, []).append(e)
+                slot[1] = key
+
+        # gỡ entity không còn được thấy ở tick này
+        stale = [k for k, slot in where.items() if slot[2] != gen]
+        for k in stale:
+            e, key, _ = where.pop(k)
+            self._remove_from_cell(key, e)
+
+        self.max_radius = max_r
+
+    def sync(self, entities):
+        """Gọi 1 lần mỗi tick: chọn rebuild/incremental theo cấu hình."""
+        if self.incremental:
+            self.update(entities)
+        else:
+            self.rebuild(entities)
+
+    def _remove_from_cell(self, key, e):
+        bucket = self._cells.get(key)
+        if not bucket:
+            return
+        try:
+            bucket.remove(e)
+        except ValueError:
+            return
+        if not bucket:
+            del self._cells[key]
+
+    # =========================
+    # Query
+    # =========================
+    def query(self, x, y, radius):
+        """
+        Trả về list entity có thể chạm vòng tròn (x, y, radius).
+        Đây chỉ là broad-phase: vẫn phải test va chạm chính xác sau đó.
+        """
+        cells = self._cells
+        if not cells:
+            return []
+
+        cs = self.cell_size
+        r = float(radius) + self.max_radius
+        x0 = int((x - r) // cs)
+        x1 = int((x + r) // cs)
+        y0 = int((y - r) // cs)
+        y1 = int((y + r) // cs)
+
+        out = []
+        # vùng query rộng hơn cả lưới đang có -> duyệt thẳng các ô có dữ liệu
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    out.extend(bucket)
+            return out
+
+        get = cells.get
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = get((cx, cy))
+                if bucket:
+                    out.extend(bucket)
+        return out
@@ -2,10 +2,18 @@
 import os
 import json
 import random
+from bisect import bisect_right
 
-from src.entities.prey import PreyFish
-from src.entities.shy_prey_fish import ShyPreyFish
-from src.entities.ai_fish import PredatorFish
+from src.world.pools import EntityPools
+from src.core.rng import child
+from src.core.sampler import AliasTable, CumulativeTable
+
+
+# prey điểm <= SMALL_POINTS bị giới hạn số lượng (chặn spam cá 5)
+SMALL_POINTS = 5
+
+# mốc pp mà trọng số / giới hạn cá nhỏ trong _build_pool đổi giá trị
+PP_THRESHOLDS = (60, 120, 140, 160, 220)
 
 
 # =========================
@@ -24,36 +32,79 @@ def _load_fish_enemies():
         return json.load(f) or {}
 
 
-def _weighted_choice(items):
-    if not items:
-        return None
-    total = 0
-    for it in items:
-        w = int(it.get("weight", 1))
-        if w > 0:
-            total += w
-    if total <= 0:
-        return items[-1]
-
-    r = random.uniform(0, total)
-    s = 0
-    for it in items:
-        w = int(it.get("weight", 1))
-        if w <= 0:
-            continue
-        s += w
-        if r <= s:
-            return it
-    return items[-1]
+def _weighted_choice(items, rng=random):
+    """Chọn từ pool dựng tại chỗ (trọng số đổi mỗi lần) -> bảng cộng dồn, không build alias."""
+    return CumulativeTable(items, [int(it.get("weight", 1)) for it in items]).pick(rng)
+
+
+def _small_limit(pp) -> int:
+    """Số cá nhỏ tối đa cùng lúc theo pp."""
+    return 11 if pp < 60 else (8 if pp < 140 else 6)
+
+
+# =========================
+# Spawn tables (compile 1 lần / map)
+# =========================
+def _table(pool) -> AliasTable:
+    return AliasTable(pool, [e["weight"] for e in pool])
+
+
+class SpawnTables:
+    """
+    Bảng spawn (alias, pick O(1)) của 1 map, chia trục pp thành các khoảng tại min_pp / max_pp + 1
+    của từng con và PP_THRESHOLDS. Trong 1 khoảng mọi điều kiện của _build_pool
+    không đổi -> build 1 lần tại đầu khoảng.
+    Prey có 2 bản: đủ, và bỏ cá nhỏ (khi số cá nhỏ chạm _small_limit).
+    """
+
+    def __init__(self, spawner, enemies):
+        breaks = {0, *PP_THRESHOLDS}
+        for e in enemies:
+            breaks.add(int(e.get("min_pp", 0)))
+            breaks.add(int(e.get("max_pp", 999999)) + 1)
+        self.breaks = sorted(breaks)
+
+        no_small = 1 << 30
+        self.prey = []
+        self.pred = []
+        for pp in self.breaks:
+            self.prey.append((
+                _table(spawner._build_pool(enemies, pp, 0, want_predator=False)),
+                _table(spawner._build_pool(enemies, pp, no_small, want_predator=False)),
+                _small_limit(pp),
+            ))
+            self.pred.append(_table(spawner._build_pool(enemies, pp, 0, want_predator=True)))
+
+    def _index(self, pp) -> int:
+        return bisect_right(self.breaks, pp) - 1
+
+    def prey_table(self, pp, small_count):
+        """None khi pp nằm ngoài bảng (< mốc đầu) -> gọi _build_pool trực tiếp."""
+        i = self._index(pp)
+        if i < 0:
+            return None
+        full, no_small, limit = self.prey[i]
+        return no_small if small_count >= limit else full
+
+    def pred_table(self, pp):
+        i = self._index(pp)
+        return self.pred[i] if i >= 0 else None
 
 
 # =========================
 # Spawner
 # =========================
 class Spawner:
-    def __init__(self, world_w, world_h):
+    def __init__(self, world_w, world_h, rng=None, enemies_cfg=None, load_sprites=True, pools=None):
         self.world_w = world_w
         self.world_h = world_h
+        self.rng = rng or random
+
+        # cá mới lấy từ pool (cá chết được World trả lại)
+        self.pools = pools or EntityPools()
+
+        # False -> cá không có sprite (mô phỏng headless)
+        self.load_sprites = bool(load_sprites)
 
         # 2 nhịp spawn
         self.prey_timer = 0.0
@@ -67,11 +118,19 @@ class Spawner:
         self.pred_base_interval = 1.15
         self.pred_min_interval  = 0.78
 
-        self.enemies_cfg = _load_fish_enemies()
+        self.enemies_cfg = enemies_cfg if enemies_cfg is not None else _load_fish_enemies()
+
+        # map key -> SpawnTables (compile lần đầu spawn ở map đó)
+        self._tables = {}
+
+        # số prey <= SMALL_POINTS đang có: +1 khi spawn, -1 qua prey_removed()
+        # (World gọi khi dọn prey chết) -> không quét list preys mỗi lần spawn
+        self.small_preys = 0
 
     def _spawn_pos_outside_view(self, camera):
         margin = 260
-        side = random.choice(["left", "right", "top", "bottom"])
+        rng = self.rng
+        side = rng.choice(["left", "right", "top", "bottom"])
 
         view_l = int(camera.offset.x)
         view_r = int(camera.offset.x + camera.sw)
@@ -80,15 +139,15 @@ class Spawner:
 
         if side == "left":
             x = max(60, view_l - margin)
-            y = random.randint(max(60, view_t - 120), min(self.world_h - 60, view_b + 120))
+            y = rng.randint(max(60, view_t - 120), min(self.world_h - 60, view_b + 120))
         elif side == "right":
             x = min(self.world_w - 60, view_r + margin)
-            y = random.randint(max(60, view_t - 120), min(self.world_h - 60, view_b + 120))
+            y = rng.randint(max(60, view_t - 120), min(self.world_h - 60, view_b + 120))
         elif side == "top":
-            x = random.randint(max(60, view_l - 120), min(self.world_w - 60, view_r + 120))
+            x = rng.randint(max(60, view_l - 120), min(self.world_w - 60, view_r + 120))
             y = max(60, view_t - margin)
         else:
-            x = random.randint(max(60, view_l - 120), min(self.world_w - 60, view_r + 120))
+            x = rng.randint(max(60, view_l - 120), min(self.world_w - 60, view_r + 120))
             y = min(self.world_h - 60, view_b + margin)
 
         return x, y
@@ -98,9 +157,22 @@ class Spawner:
         role = e.get("role", "prey")
         return (role == "predator" or ai == "predator")
 
-    def _build_pool(self, enemies, pp, preys, want_predator: bool):
-        small_count = sum(1 for p in preys if getattr(p, "points", 0) <= 5)
+    def tables(self, map_id) -> SpawnTables:
+        key = f"map{int(map_id)}"
+        t = self._tables.get(key)
+        if t is None:
+            t = self._tables[key] = SpawnTables(self, self.enemies_cfg.get(key, []))
+        return t
+
+    def rebuild_tables(self):
+        """Gọi sau khi sửa enemies_cfg (bảng compile lại ở lần spawn kế)."""
+        self._tables.clear()
+
+    def prey_removed(self, prey):
+        if prey.points <= SMALL_POINTS:
+            self.small_preys -= 1
 
+    def _build_pool(self, enemies, pp, small_count, want_predator: bool):
         pool = []
         for e in enemies:
             pts = int(e.get("points", 5))
@@ -119,9 +191,8 @@ class Spawner:
                 continue
 
             # chặn spam cá 5 (để vẫn có mồi nhưng không loạn)
-            if (not want_predator) and pts <= 5:
-                limit = 11 if pp < 60 else (8 if pp < 140 else 6)
-                if small_count >= limit:
+            if (not want_predator) and pts <= SMALL_POINTS:
+                if small_count >= _small_limit(pp):
                     continue
 
             # ===== cân tỉ lệ (không sửa JSON) =====
@@ -157,12 +228,22 @@ class Spawner:
 
         return pool
 
+    def _pick(self, enemies, tables, pp, want_predator: bool):
+        if want_predator:
+            table = tables.pred_table(pp)
+        else:
+            table = tables.prey_table(pp, self.small_preys)
+        if table is None:
+            return _weighted_choice(self._build_pool(enemies, pp, self.small_preys, want_predator), self.rng)
+        return table.pick(self.rng)
+
     def update(self, dt, player_points, preys, predators, camera, map_id=1):
         enemies = self.enemies_cfg.get(f"map{int(map_id)}", [])
         if not enemies:
             return
 
         pp = int(player_points)
+        tables = self.tables(map_id)
 
         # =========================
         # 1) SPAWN PREY
@@ -173,33 +254,36 @@ class Spawner:
         if self.prey_timer >= prey_interval:
             self.prey_timer = 0.0
 
-            pool = self._build_pool(enemies, pp, preys, want_predator=False)
-            enemy = _weighted_choice(pool)
+            enemy = self._pick(enemies, tables, pp, want_predator=False)
             if enemy:
                 x, y = self._spawn_pos_outside_view(camera)
 
-                fish_folder = enemy["path"]
+                fish_folder = enemy["path"] if self.load_sprites else None
                 points = int(enemy.get("points", 10))
                 speed = float(enemy.get("speed", 120))
                 ai = enemy.get("ai", "wander")
+                if points <= SMALL_POINTS:
+                    self.small_preys += 1
 
                 if ai == "shy":
                     preys.append(
-                        ShyPreyFish(
+                        self.pools.shy.acquire(
                             pos=(x, y),
                             fish_folder=fish_folder,
                             points=points,
                             speed=speed,
+                            rng=child(self.rng),
                         )
                     )
                 else:
                     preys.append(
-                        PreyFish(
+                        self.pools.prey.acquire(
                             pos=(x, y),
                             fish_folder=fish_folder,
                             points=points,
                             speed=speed,
                             ai=ai,
+                            rng=child(self.rng),
                         )
                     )
 
@@ -219,9 +303,8 @@ class Spawner:
             max_pred = 2 + pp // 180
             max_pred = min(max_pred, 7)
 
-            # pool predator
-            pool = self._build_pool(enemies, pp, preys, want_predator=True)
-            enemy = _weighted_choice(pool)
+            # bảng predator
+            enemy = self._pick(enemies, tables, pp, want_predator=True)
             if not enemy:
                 return
 
@@ -236,9 +319,10 @@ class Spawner:
 
             x, y = self._spawn_pos_outside_view(camera)
             predators.append(
-                PredatorFish(
+                self.pools.predator.acquire(
                     pos=(x, y),
-                    fish_folder=enemy["path"],
+                    fish_folder=enemy["path"] if self.load_sprites else None,
                     points=pts,
+                    rng=child(self.rng),
                 )
             )
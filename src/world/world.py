@@ -0,0 +1,345 @@
+# src/world/world.py
+import random
+import pygame
+
+from src.world.camera import Camera
+from src.world.spawner import Spawner
+from src.world.spatial_hash import SpatialHash
+from src.world.pools import EntityPools, compact
+from src.entities.item_drop import DropSpawner
+from src.core.profiler import PROFILER
+from src.core.rng import derive
+
+
+def _is_alive(e) -> bool:
+    return e.alive
+
+
+class World:
+    """
+    Mô phỏng 1 trận (thuần dữ liệu, không vẽ):
+    - players / preys / predators / drops + spawner + drop spawner
+    - va chạm, despawn, điều kiện thắng/thua (self.result)
+    - RNG: mỗi hệ thống 1 stream riêng derive từ seed trận (spawner / drops / camera),
+      mỗi con cá 1 stream riêng; bước thời gian cố định (fixed_dt)
+    - mỗi tick lưu prev_pos (và camera.prev_offset) để vẽ nội suy giữa 2 tick
+    GameScene chỉ vẽ World; headless.py chạy World không cần màn hình.
+    """
+
+    MAP_TARGETS = {1: 500, 2: 3000, 3: 5000}
+
+    # broad-phase va chạm (spatial hash)
+    GRID_CELL = 128
+    GRID_INCREMENTAL = False
+
+    FIXED_DT = 1.0 / 60.0
+
+    def __init__(
+        self,
+        map_data,
+        players,
+        mode=1,
+        seed=None,
+        view_size=(1280, 720),
+        enemies_cfg=None,
+        load_sprites=True,
+        fixed_dt=FIXED_DT,
+        targets=None,
+        drop_cfg=None,
+        pooling=True,
+    ):
+        self.map = map_data or {
+            "id": 1,
+            "bg": None,
+            "world_size": [2400, 1344],
+            "name": "Map 1",
+        }
+
+        self.world_w, self.world_h = self.map.get("world_size", [2400, 1344])
+        self.map_id = int(self.map.get("id", 1))
+        # targets chỉ ghi đè các map có trong đó, map khác giữ MAP_TARGETS
+        self.TARGET_POINTS = {**self.MAP_TARGETS, **(targets or {})}.get(self.map_id, 300)
+
+        self.mode = 2 if int(mode) == 2 else 1
+        self.fixed_dt = float(fixed_dt)
+
+        # ===== RNG của trận (stream riêng / hệ thống, xem src/core/rng.py) =====
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+
+        # ===== Camera (vùng nhìn: spawn/despawn dựa theo) =====
+        # shake chỉ để vẽ -> stream riêng, không ăn vào số ngẫu nhiên gameplay
+        vw, vh = view_size
+        self.camera = Camera(vw, vh, self.world_w, self.world_h, rng=derive(self.seed, "camera"))
+
+        # ===== Players =====
+        self.players = list(players)
+
+        # ===== Enemies / Drops (entity chết trả về pool, spawn lấy lại) =====
+        self.pools = EntityPools(enabled=pooling)
+        self.preys = []
+        self.predators = []
+        self.spawner = Spawner(
+            self.world_w,
+            self.world_h,
+            rng=derive(self.seed, "spawner"),
+            enemies_cfg=enemies_cfg,
+            load_sprites=load_sprites,
+            pools=self.pools,
+        )
+
+        self.drops = []
+        self.drop_spawner = DropSpawner(
+            self.world_w, self.world_h, rng=derive(self.seed, "drops"), pools=self.pools, **(drop_cfg or {})
+        )
+
+        self.floating = []
+        self.elapsed = 0.0
+        self.ticks = 0
+
+        # None | "win" | "lose"
+        self.result = None
+
+        # ===== Broad-phase grids (bucket 1 lần mỗi tick) =====
+        self.prey_grid = SpatialHash(self.GRID_CELL, incremental=self.GRID_INCREMENTAL)
+        self.pred_grid = SpatialHash(self.GRID_CELL, incremental=self.GRID_INCREMENTAL)
+        self.drop_grid = SpatialHash(self.GRID_CELL, incremental=self.GRID_INCREMENTAL, radius_attr="radius")
+
+        # ===== Spawn caps theo map/mode (EASY BALANCE) =====
+        if self.map_id == 1:
+            self.max_preys = 22 if self.mode == 1 else 28
+            self.max_predators = 2 if self.mode == 1 else 3
+        elif self.map_id == 2:
+            self.max_preys = 28 if self.mode == 1 else 36
+            self.max_predators = 3 if self.mode == 1 else 4
+        else:  # map3+
+            self.max_preys = 34 if self.mode == 1 else 44
+            self.max_predators = 4 if self.mode == 1 else 5
+
+        # ===== Camera init =====
+        self._camera_follow_players()
+        self.camera.update(0.0)
+
+    # =========================
+    # Helpers
+    # =========================
+    def player_radius(self, p) -> float:
+        return p.collision_radius()
+
+    def player_rect(self, p, r: float = None) -> pygame.Rect:
+        if r is None:
+            r = self.player_radius(p)
+        return pygame.Rect(int(p.pos.x - r), int(p.pos.y - r), int(r * 2), int(r * 2))
+
+    def _camera_follow_players(self):
+        if len(self.players) >= 2:
+            center = (self.players[0].pos + self.players[1].pos) / 2
+            self.camera.follow(center)
+        else:
+            self.camera.follow(self.players[0].pos)
+
+    def team_points(self) -> int:
+        return int(sum(p.points for p in self.players))
+
+    def all_dead(self) -> bool:
+        return all(p.lives <= 0 for p in self.players)
+
+    def difficulty_points(self) -> int:
+        # - 1P: dùng điểm player[0]
+        # - 2P: dùng trung bình team để spawn hợp lý hơn
+        if self.mode == 1:
+            return int(self.players[0].points)
+        return max(1, int(self.team_points() / max(1, len(self.players))))
+
+    # DESPAWN xa camera để cá không tích tụ mãi
+    def _despawn_far_entities(self):
+        view_l = self.camera.offset.x
+        view_r = self.camera.offset.x + self.camera.sw
+        view_t = self.camera.offset.y
+        view_b = self.camera.offset.y + self.camera.sh
+
+        pad = 520  # càng lớn càng ít despawn (520 là cân bằng)
+        left = view_l - pad
+        right = view_r + pad
+        top = view_t - pad
+        bottom = view_b + pad
+
+        for e in self.preys:
+            if getattr(e, "alive", True):
+                if e.pos.x < left or e.pos.x > right or e.pos.y < top or e.pos.y > bottom:
+                    e.alive = False
+
+        for e in self.predators:
+            if getattr(e, "alive", True):
+                if e.pos.x < left or e.pos.x > right or e.pos.y < top or e.pos.y > bottom:
+                    e.alive = False
+
+    # =========================
+    # Step
+    # =========================
+    def _snapshot_positions(self):
+        """Vị trí đầu tick -> prev_pos (GameScene nội suy prev -> pos lúc vẽ)."""
+        self.camera.prev_offset.update(self.camera.offset)
+        for group in (self.players, self.preys, self.predators, self.drops, self.floating):
+            for e in group:
+                e.prev_pos.update(e.pos)
+
+    def step(self, dt=None):
+        """Tiến 1 bước mô phỏng (mặc định fixed_dt). Trả về self.result."""
+        if self.result is not None:
+            return self.result
+
+        dt = self.fixed_dt if dt is None else float(dt)
+        self.elapsed += dt
+        self.ticks += 1
+
+        prof = PROFILER
+        self._snapshot_positions()
+
+        # players
+        with prof.scope("player_update"):
+            for p in self.players:
+                if p.lives > 0:
+                    p.update(dt)
+
+                r = self.player_radius(p)
+                p.pos.x = max(r, min(self.world_w - r, p.pos.x))
+                p.pos.y = max(r, min(self.world_h - r, p.pos.y))
+
+            # camera follow
+            self._camera_follow_players()
+            self.camera.update(dt)
+
+        diff_pts = self.difficulty_points()
+
+        # update prey
+        with prof.scope("prey_update"):
+            for prey in self.preys:
+                prey.update(dt, self.world_w, self.world_h, players=self.players)
+
+        # update predator
+        with prof.scope("predator_update"):
+            for pr in self.predators:
+                pr.update(dt, self.world_w, self.world_h, players=self.players)
+
+        # spawn: theo TỔNG cap (tránh OR spawn miết)
+        total_now = len(self.preys) + len(self.predators)
+        total_cap = self.max_preys + self.max_predators
+
+        with prof.scope("spawner"):
+            if total_now < total_cap:
+                self.spawner.update(
+                    dt,
+                    player_points=diff_pts,
+                    preys=self.preys,
+                    predators=self.predators,
+                    camera=self.camera,
+                    map_id=self.map_id
+                )
+
+        # drops
+        with prof.scope("drop_spawner"):
+            self.drop_spawner.update(dt, self.drops, self.map_id, diff_pts)
+            for d in self.drops:
+                d.update(dt, self.world_w, self.world_h)
+
+        # collision
+        with prof.scope("collisions"):
+            self._handle_collisions()
+
+        with prof.scope("cleanup"):
+            # despawn xa camera (giảm đông dần theo thời gian)
+            self._despawn_far_entities()
+
+            # cleanup tại chỗ, entity chết về pool
+            release = self.pools.release
+            compact(self.preys, _is_alive, self._release_prey)
+            compact(self.predators, _is_alive, release)
+            compact(self.drops, _is_alive, release)
+            compact(self.floating, lambda ft: ft.update(dt), release)
+
+        self._check_end_conditions()
+        return self.result
+
+    def _release_prey(self, e):
+        # spawner giữ số cá nhỏ đang có -> báo trước khi về pool
+        self.spawner.prey_removed(e)
+        self.pools.release(e)
+
+    def run(self, seconds, max_ticks=None):
+        """Chạy liên tục tới khi hết `seconds` mô phỏng hoặc có kết quả."""
+        n = int(round(float(seconds) / self.fixed_dt))
+        if max_ticks is not None:
+            n = min(n, int(max_ticks))
+        for _ in range(n):
+            if self.step() is not None:
+                break
+        return self.result
+
+    # =========================
+    # Collision
+    # =========================
+    def _handle_collisions(self):
+        self.prey_grid.sync(self.preys)
+        self.pred_grid.sync(self.predators)
+        self.drop_grid.sync(self.drops)
+
+        for p in self.players:
+            if p.lives <= 0:
+                continue
+
+            r = self.player_radius(p)
+            p_rect = self.player_rect(p, r)
+            px, py = p.pos.x, p.pos.y
+
+            # ===== prey collisions =====
+            for prey in self.prey_grid.query(px, py, r):
+                if getattr(prey, "alive", True) and p_rect.colliderect(prey.rect()):
+                    if prey.points <= int(p.points * 1.02):
+                        prey.alive = False
+                        gained = p.add_points(prey.points)
+                        self.floating.append(self.pools.floating.acquire(prey.pos, f"+{gained}"))
+                    else:
+                        p.hit()
+                        self.camera.shake(6, 0.15)
+
+            # ===== predator collisions (EASY FAIR RULE) =====
+            for pr in self.pred_grid.query(px, py, r):
+                if not getattr(pr, "alive", True):
+                    continue
+                if not p_rect.colliderect(pr.rect()):
+                    continue
+
+                # ✅ đủ lớn thì ăn predator (công bằng)
+                if pr.points <= int(p.points * 0.92):
+                    pr.alive = False
+                    gained = p.add_points(pr.points)
+                    self.floating.append(self.pools.floating.acquire(pr.pos, f"+{gained}"))
+                    self.camera.shake(6, 0.12)
+                else:
+                    p.hit()
+                    self.camera.shake(10, 0.22)
+
+            # ===== drops collisions =====
+            for d in self.drop_grid.query(px, py, r):
+                if d.alive and p_rect.colliderect(d.rect()):
+                    d.alive = False
+                    if str(d.kind).startswith("ob"):
+                        p.hit()
+                        self.camera.shake(8, 0.2)
+                    else:
+                        p.apply_item(d.kind)
+
+    # =========================
+    # End game
+    # =========================
+    def _check_end_conditions(self):
+        if self.team_points() >= self.TARGET_POINTS:
+            self.result = "win"
+            return
+
+        if self.mode == 1:
+            if self.players[0].lives <= 0:
+                self.result = "lose"
+        else:
+            if self.all_dead():
+                self.result = "lose"
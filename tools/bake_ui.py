@@ -0,0 +1,216 @@
+# tools/bake_ui.py
+"""
+Bake texture UI: ảnh nguồn quá lớn (button 1536x1024 ~2MB, heart ~2MB, panel,
+items) -> bản đã scale đúng size scene dùng + trim viền trong suốt,
+ghi vào assets/baked/ kèm manifest.json. Runtime (src/core/baked.py) tự dùng
+bản bake khi có, nguồn đổi mà chưa bake lại thì quay về file gốc.
+
+Chạy từ thư mục gốc (sau khi đổi ảnh UI hoặc scale trong scene):
+    python -m tools.bake_ui            # bake + báo cáo
+    python -m tools.bake_ui --report   # chỉ so sánh decode / bộ nhớ
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.baked import BAKED_DIR, MANIFEST, fit_size
+from src.core.sprite_cache import PROJECT_ROOT
+
+BTN = "assets/ui/button"
+
+# (path, scale, scale_x, scale_y, hover_scale) - khớp các ImageButton trong scenes
+UI_BUTTONS = [
+    # menu
+    (f"{BTN}/start.png", 0.2, 1.5, 1.0, 1.2),
+    (f"{BTN}/ranking.png", 0.2, 1.5, 1.0, 1.2),
+    (f"{BTN}/history.png", 0.2, 1.5, 1.0, 1.2),
+    (f"{BTN}/exit.png", 0.2, 1.5, 1.0, 1.2),
+    (f"{BTN}/sound.png", 0.11, 1.0, 1.0, 1.12),
+    (f"{BTN}/mute.png", 0.11, 1.0, 1.0, 1.12),
+    (f"{BTN}/setting.png", 0.11, 1.0, 1.0, 1.2),
+    # mode select
+    (f"{BTN}/1_player.png", 0.22, 1.5, 1.0, 1.15),
+    (f"{BTN}/2_player.png", 0.22, 1.5, 1.0, 1.15),
+    (f"{BTN}/back.png", 0.18, 1.4, 1.0, 1.12),
+    # map select (ép 120x44)
+    (f"{BTN}/back.png", 2.5, 120 / 1536, 44 / 1024, 1.08),
+    # fish select
+    (f"{BTN}/back.png", 0.1, 1.0, 1.0, 1.15),
+    (f"{BTN}/start.png", 0.15, 1.6, 1.0, 1.15),
+    # leaderboard / history / settings
+    (f"{BTN}/back.png", 0.15, 1.0, 1.0, 1.1),
+    (f"{BTN}/back.png", 0.18, 1.0, 1.0, 1.1),
+    (f"{BTN}/back.png", 0.12, 1.0, 1.0, 1.1),
+    (f"{BTN}/apply.png", 0.18, 1.0, 1.0, 1.1),
+    # game / pause
+    (f"{BTN}/pause.png", 0.08, 1.0, 1.0, 1.15),
+    (f"{BTN}/retry.png", 0.22, 2.0, 1.0, 1.15),
+    (f"{BTN}/resume.png", 0.2, 2.0, 1.0, 1.15),
+    (f"{BTN}/map_select.png", 0.2, 2.0, 1.0, 1.15),
+    (f"{BTN}/menu.png", 0.2, 2.0, 1.0, 1.15),
+    # game over / victory
+    (f"{BTN}/retry.png", 0.22, 1.6, 1.0, 1.15),
+    (f"{BTN}/next.png", 0.22, 1.6, 1.0, 1.15),
+    (f"{BTN}/map_select.png", 0.22, 1.6, 1.0, 1.15),
+    (f"{BTN}/menu.png", 0.22, 1.6, 1.0, 1.15),
+]
+
+# (path, cạnh lớn nhất) - icon HUD (khớp src/core/preload.HUD_ICONS)
+UI_ICONS = [
+    (f"{BTN}/heart_full.png", 48),
+    (f"{BTN}/heart_empty.png", 48),
+    ("assets/ui/items/x2diem.png", 24),
+    ("assets/ui/items/thuong1.png", 24),
+    ("assets/ui/items/thuong2.png", 24),
+    ("assets/ui/items/thuong3.png", 24),
+]
+
+# (path, (w, h)) - panel HUD ở 1280px
+UI_FIXED = [
+    ("assets/ui/hud/panel.png", (520, 92)),
+]
+
+# drops vẽ theo scale cố định (falling_item.DRAW_SCALE)
+ITEM_DIR = "assets/ui/items"
+ITEM_SCALE = 0.55
+
+
+def _abs(p):
+    return os.path.join(PROJECT_ROOT, p)
+
+
+def _button_size(src, scale, sx, sy):
+    # giống ImageButton._size
+    return max(1, int(src[0] * scale * sx)), max(1, int(src[1] * scale * sy))
+
+
+def collect_sizes():
+    """path -> set((w, h)) cần bake."""
+    sizes = {}
+    src_cache = {}
+
+    def src_size(p):
+        if p not in src_cache:
+            src_cache[p] = pygame.image.load(_abs(p)).get_size()
+        return src_cache[p]
+
+    for p, scale, sx, sy, hover in UI_BUTTONS:
+        src = src_size(p)
+        s = sizes.setdefault(p, set())
+        s.add(_button_size(src, scale, sx, sy))
+        s.add(_button_size(src, scale * hover, sx, sy))
+
+    for p, box in UI_ICONS:
+        sizes.setdefault(p, set()).add(fit_size(src_size(p), box))
+
+    for p, wh in UI_FIXED:
+        sizes.setdefault(p, set()).add(tuple(wh))
+
+    for name in sorted(os.listdir(_abs(ITEM_DIR))):
+        if name.lower().endswith(".png"):
+            p = f"{ITEM_DIR}/{name}"
+            src = src_size(p)
+            sizes.setdefault(p, set()).add(
+                (max(2, int(src[0] * ITEM_SCALE)), max(2, int(src[1] * ITEM_SCALE)))
+            )
+
+    return sizes
+
+
+def _out_name(path, size):
+    stem = os.path.splitext(path.replace("assets/", "", 1))[0].replace("/", "__")
+    return f"{BAKED_DIR}/{stem}_{size[0]}x{size[1]}.png"
+
+
+def bake(sizes):
+    os.makedirs(_abs(BAKED_DIR), exist_ok=True)
+
+    # xoá bản bake cũ (tránh file mồ côi)
+    for name in os.listdir(_abs(BAKED_DIR)):
+        if name.endswith(".png"):
+            os.remove(os.path.join(_abs(BAKED_DIR), name))
+
+    entries = {}
+    for path in sorted(sizes):
+        raw = pygame.image.load(_abs(path)).convert_alpha()
+        variants = []
+        for size in sorted(sizes[path]):
+            surf = pygame.transform.smoothscale(raw, size)
+            trim = surf.get_bounding_rect(min_alpha=1)
+            if trim.w == 0 or trim.h == 0:
+                trim = surf.get_rect()
+            out = _out_name(path, size)
+            pygame.image.save(surf.subsurface(trim).copy(), _abs(out))
+            variants.append({"file": out, "size": list(size), "trim": [trim.x, trim.y, trim.w, trim.h]})
+
+        entries[path] = {
+            "src_size": list(raw.get_size()),
+            "src_bytes": os.path.getsize(_abs(path)),
+            "variants": variants,
+        }
+
+    with open(_abs(MANIFEST), "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "entries": entries}, f, indent=1, sort_keys=True)
+
+    n = sum(len(e["variants"]) for e in entries.values())
+    print(f"baked {n} textures from {len(entries)} sources -> {MANIFEST}")
+
+
+def report(sizes):
+    """Decode time + bộ nhớ thường trú: ảnh gốc vs bản bake (đúng các size dùng)."""
+    from src.core.baked import BakedTextures
+
+    t0 = time.perf_counter()
+    before_bytes = 0
+    before_disk = 0
+    for path in sizes:
+        surf = pygame.image.load(_abs(path)).convert_alpha()
+        before_bytes += surf.get_width() * surf.get_height() * 4
+        before_disk += os.path.getsize(_abs(path))
+    t_before = time.perf_counter() - t0
+
+    baked = BakedTextures()
+    t0 = time.perf_counter()
+    after_bytes = 0
+    after_disk = 0
+    missing = 0
+    for path, ss in sizes.items():
+        for size in ss:
+            v = baked.pick(path, size)
+            surf = baked.load(path, size)
+            if surf is None:
+                missing += 1
+                continue
+            after_bytes += surf.get_width() * surf.get_height() * 4
+            after_disk += os.path.getsize(_abs(v["file"]))
+    t_after = time.perf_counter() - t0
+
+    mb = 1024 * 1024
+    print(f"{'':>8} {'decode ms':>10} {'file MB':>9} {'resident MB':>12}")
+    print(f"{'source':>8} {t_before * 1000:>10.1f} {before_disk / mb:>9.2f} {before_bytes / mb:>12.2f}")
+    print(f"{'baked':>8} {t_after * 1000:>10.1f} {after_disk / mb:>9.2f} {after_bytes / mb:>12.2f}")
+    if missing:
+        print(f"[WARN] {missing} sizes have no baked texture (run without --report)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bake oversized UI PNGs into runtime-sized textures")
+    ap.add_argument("--report", action="store_true", help="chỉ đo, không bake")
+    args = ap.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    sizes = collect_sizes()
+    if not args.report:
+        bake(sizes)
+    report(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# tools/bench_atlas.py
+"""
+Benchmark atlas cá (tools/build_atlas.py) vs file rời:
+- load: frames gốc của 1 map (cá địch + 1 cá người chơi) / toàn bộ cá,
+  số lần mở file + thời gian (có / không tạo sẵn size vẽ + flip như preload)
+- draw: N cá / frame ở size vẽ thật; blit từng cái vs gộp bằng Surface.blits
+
+Chạy từ thư mục gốc (cần build atlas trước):
+    python -m tools.bench_atlas
+"""
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.atlas import FishAtlas
+from src.core.sprite_cache import PROJECT_ROOT, SpriteRegistry, folder_paths
+from src.entities.animated_sprite import AnimatedSprite
+from src.entities.ai_fish import PredatorFish
+from src.entities.prey import PreyFish
+from tools.build_atlas import find_folders
+
+COUNTS = (100, 1000)
+FRAMES = 120
+REPEAT = 5
+VIEW_W, VIEW_H = 1280, 720
+PLAYER = "assets/fish/player/fish01"
+
+
+def _draw_scales():
+    """folder -> set scale vẽ (giống build_map_preloader)."""
+    with open(os.path.join(PROJECT_ROOT, "data/fish_enemies.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    out = {}
+    for enemies in data.values():
+        for e in enemies:
+            pts = int(e.get("points", 10))
+            is_pred = e.get("role", "prey") == "predator" or e.get("ai", "wander") == "predator"
+            s = PredatorFish.scale_for_points(pts) if is_pred else PreyFish.scale_for_points(pts)
+            out.setdefault(e["path"], set()).add(AnimatedSprite.quantize_scale(s))
+    out[PLAYER] = {AnimatedSprite.quantize_scale(0.55 + i * 0.05) for i in range(12)}
+    return out
+
+
+def _warm(registry, folders, scales):
+    """Frames gốc (+ size vẽ cả 2 hướng flip). Trả [(fs, index, w, h, flip)]."""
+    jobs = []
+    for folder in folders:
+        fs = registry.frames(folder_paths(folder))
+        for s in sorted(scales.get(folder, ())):
+            w, h = max(1, int(fs.base_w * s)), max(1, int(fs.base_h * s))
+            for i in range(len(fs.frames)):
+                for flip in (False, True):
+                    registry.scaled_frame(fs, i, w, h, flip)
+                    jobs.append((fs, i, w, h, flip))
+    return jobs
+
+
+def _load(folders, scales, use_atlas):
+    """(ms tốt nhất trong REPEAT lần, số file mở)."""
+    best = None
+    for _ in range(REPEAT):
+        registry = SpriteRegistry(atlas=FishAtlas() if use_atlas else None)
+        t0 = time.perf_counter()
+        _warm(registry, folders, scales)
+        ms = (time.perf_counter() - t0) * 1000.0
+        best = ms if best is None else min(best, ms)
+    opens = registry.atlas.sheet_loads if use_atlas else registry.disk_loads
+    return best, opens
+
+
+def _draw(n, jobs, registry, batched, screen):
+    rnd = random.Random(n)
+    picks = [rnd.choice(jobs) for _ in range(n)]
+    pos = [(rnd.uniform(-60, VIEW_W), rnd.uniform(-60, VIEW_H)) for _ in range(n)]
+
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill((0, 0, 0))
+        if batched:
+            screen.blits([(registry.scaled_frame(*j), p) for j, p in zip(picks, pos)], doreturn=False)
+        else:
+            for j, p in zip(picks, pos):
+                screen.blit(registry.scaled_frame(*j), p)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode((VIEW_W, VIEW_H))
+
+    scales = _draw_scales()
+    folders = find_folders()
+    map1 = [f for f in folders if "/enemies/map1/" in f] + [PLAYER]
+
+    print(f"load (best of {REPEAT}, ms / file opens)")
+    print(f"{'set':>16} {'loose':>8} {'opens':>6} {'atlas':>8} {'opens':>6} {'speedup':>8}")
+    for name, fl, sc in (
+        ("map1 frames", map1, {}),
+        ("map1 +sizes", map1, scales),
+        ("all frames", folders, {}),
+    ):
+        old, old_n = _load(fl, sc, False)
+        new, new_n = _load(fl, sc, True)
+        print(f"{name:>16} {old:>8.1f} {old_n:>6} {new:>8.1f} {new_n:>6} {old / new:>7.2f}x")
+
+    loose = SpriteRegistry(atlas=None)
+    atlas = SpriteRegistry(atlas=FishAtlas())
+    loose_jobs = _warm(loose, map1, scales)
+    atlas_jobs = _warm(atlas, map1, scales)
+
+    print(f"\ndraw ({FRAMES} frames, map1 fish at draw sizes, ms/frame)")
+    print(f"{'fish':>6} {'loose blit':>11} {'atlas blit':>11} {'atlas blits':>12}")
+    for n in COUNTS:
+        a = _draw(n, loose_jobs, loose, False, screen)
+        b = _draw(n, atlas_jobs, atlas, False, screen)
+        c = _draw(n, atlas_jobs, atlas, True, screen)
+        print(f"{n:>6} {a:>11.3f} {b:>11.3f} {c:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# tools/bench_drops.py
+"""
+Benchmark vẽ drops: smoothscale mỗi frame (cách cũ) vs Assets.scaled_image.
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_drops
+"""
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.assets import Assets
+from src.entities.item_drop import DropSpawner
+from src.entities.falling_item import DRAW_SCALE
+from src.entities.obstacle import Obstacle
+from src.entities.powerup import PowerUp
+from src.world.camera import Camera
+
+COUNTS = (10, 100)
+FRAMES = 120
+VIEW_W, VIEW_H = 1280, 720
+
+
+def _draw_old(drop, screen, camera, assets):
+    """Obstacle/PowerUp.draw trước khi có cache: smoothscale mỗi lần vẽ."""
+    p = camera.world_to_screen(drop.pos)
+    y = p.y + (math.sin(drop._t * 4.0) * 3.0)
+    img = assets.image(drop.asset_path())
+    w = max(2, int(img.get_width() * DRAW_SCALE))
+    h = max(2, int(img.get_height() * DRAW_SCALE))
+    surf = pygame.transform.smoothscale(img, (w, h))
+    screen.blit(surf, surf.get_rect(center=(int(p.x), int(y))))
+
+
+def _make_drops(n, seed=7):
+    rnd = random.Random(seed)
+    kinds = list(DropSpawner.WEIGHTS)
+    drops = []
+    for _ in range(n):
+        kind = rnd.choice(kinds)
+        pos = (rnd.uniform(0, VIEW_W), rnd.uniform(0, VIEW_H))
+        if kind.startswith("ob"):
+            drops.append(Obstacle(pos, ob_id=int(kind[-1]), rng=rnd))
+        else:
+            drops.append(PowerUp(pos, kind=kind, rng=rnd))
+    return drops
+
+
+def _run(n, cached, screen, assets):
+    drops = _make_drops(n)
+    camera = Camera(VIEW_W, VIEW_H, VIEW_W, VIEW_H)
+    if cached:
+        # giống preload lúc vào map
+        for d in drops:
+            assets.scaled_image(d.asset_path(), DRAW_SCALE)
+
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        for d in drops:
+            d.update(1 / 60, VIEW_W, VIEW_H * 10)
+            if cached:
+                d.draw(screen, camera, assets)
+            else:
+                _draw_old(d, screen, camera, assets)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode((VIEW_W, VIEW_H))
+    assets = Assets()
+
+    print(f"{FRAMES} frames (ms/frame)")
+    print(f"{'drops':>6} {'smoothscale':>12} {'cached':>9} {'speedup':>8}")
+    for n in COUNTS:
+        old = _run(n, False, screen, assets)
+        new = _run(n, True, screen, assets)
+        print(f"{n:>6} {old:>12.3f} {new:>9.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# tools/bench_entity_store.py
+"""
+Benchmark AI cá: update() từng object (pygame.Vector2) vs EntityStore (NumPy SoA).
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_entity_store
+"""
+import random
+import time
+
+import pygame
+
+from src.entities.prey import PreyFish
+from src.entities.shy_prey_fish import ShyPreyFish
+from src.entities.ai_fish import PredatorFish
+from src.world.entity_store import EntityStore, KIND_SHY
+
+WORLD_W, WORLD_H = 9600, 5400
+COUNTS = (100, 1000, 10000)
+FRAMES = 60
+DT = 1.0 / 60.0
+
+
+class _P:
+    """Player giả: chỉ cần pos + lives."""
+
+    def __init__(self, x, y):
+        self.pos = pygame.Vector2(x, y)
+        self.lives = 3
+
+
+def _make_fish(n, seed=1234):
+    rnd = random.Random(seed)
+    fish = []
+    for i in range(n):
+        pos = (rnd.uniform(40, WORLD_W - 40), rnd.uniform(40, WORLD_H - 40))
+        k = i % 10
+        if k < 4:
+            fish.append(PreyFish(pos, points=rnd.choice((5, 10, 25)), ai="wander", rng=rnd))
+        elif k < 6:
+            fish.append(PreyFish(pos, points=rnd.choice((10, 40)), ai="dart", rng=rnd))
+        elif k < 8:
+            fish.append(ShyPreyFish(pos, points=rnd.choice((20, 60)), rng=rnd))
+        else:
+            fish.append(PredatorFish(pos, points=rnd.choice((80, 200, 600)), rng=rnd))
+    return fish
+
+
+def _players():
+    return [_P(WORLD_W / 2 - 80, WORLD_H / 2), _P(WORLD_W / 2 + 80, WORLD_H / 2)]
+
+
+def _bench_objects(n):
+    fish, players = _make_fish(n), _players()
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        for e in fish:
+            e.update(DT, WORLD_W, WORLD_H, players=players)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def _bench_store(n):
+    fish, players = _make_fish(n), _players()
+    store = EntityStore(capacity=n, seed=1)
+    for e in fish:
+        store.add(e)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        store.step(DT, WORLD_W, WORLD_H, players)
+    return (time.perf_counter() - t0) / FRAMES * 1000.0
+
+
+def _parity(n=2000):
+    """1 tick từ cùng trạng thái: so pos object vs store (bỏ shy vì rotate random ngay tick đầu)."""
+    fish, players = _make_fish(n), _players()
+    store = EntityStore(capacity=n, seed=1)
+    for e in fish:
+        store.add(e)
+    for e in fish:
+        e.update(DT, WORLD_W, WORLD_H, players=players)
+    store.step(DT, WORLD_W, WORLD_H, players)
+
+    worst = 0.0
+    for i, e in enumerate(fish):
+        if store.kind[i] == KIND_SHY:
+            continue
+        worst = max(worst, abs(e.pos.x - store.x[i]), abs(e.pos.y - store.y[i]))
+    return worst
+
+
+def main():
+    print(f"parity (1 tick, max |dpos|): {_parity():.2e}")
+    print(f"{FRAMES} frames, world {WORLD_W}x{WORLD_H}, 2 players (ms/tick)")
+    print(f"{'fish':>7} {'objects':>10} {'numpy':>10} {'speedup':>9}")
+    for n in COUNTS:
+        obj = _bench_objects(n)
+        vec = _bench_store(n)
+        print(f"{n:>7} {obj:>10.3f} {vec:>10.3f} {obj / vec:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# tools/bench_hud.py
+"""
+Benchmark HUD: vẽ lại toàn bộ mỗi frame (immediate) vs layer retained (chỉ vẽ lại vùng đổi).
+Kịch bản giống trận thật ở 60fps: giây tăng đều, ăn cá ~2 lần/giây, buff đếm ngược.
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_hud
+"""
+import os
+import time
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.assets import Assets
+from src.ui.hud import HUD
+
+FRAMES = 1800
+DT = 1.0 / 60.0
+VIEW_W, VIEW_H = 1280, 720
+
+
+def _state(i):
+    t = i * DT
+    player = types.SimpleNamespace(
+        x2_time=max(0.0, 12.0 - t),
+        invincible_time=max(0.0, 20.0 - t),
+        shield_tier=2,
+    )
+    return dict(
+        lives=3 - int(t // 12),
+        points=10 * (i // 30),
+        elapsed=t,
+        target=1500,
+        player=player,
+        map_name="Coral Reef",
+    )
+
+
+def _draw_immediate(hud, screen, assets, st):
+    """Như HUD trước đây: nền panel + mọi text/icon blit thẳng lên screen mỗi frame."""
+    hud._ensure_assets(assets)
+    if hud._panel is None:
+        hud._build_layer(screen.get_width())
+    x, y = hud._pos
+    # panel gốc (hud._base có thể rộng hơn panel khi chữ tràn)
+    screen.blit(hud._panel_scaled(*hud._panel.get_size()), (x, y))
+    keys = {
+        "score": (int(st["points"]), int(st["target"])),
+        "time": (st["map_name"], int(st["elapsed"])),
+        "hearts": max(0, min(hud.MAX_LIVES, int(st["lives"]))),
+        "buffs": hud._buff_key(st["player"]),
+    }
+    for n in hud.REGIONS:
+        for surf, (ox, oy) in getattr(hud, "_ops_" + n)(keys[n]):
+            screen.blit(surf, (x + ox, y + oy))
+
+
+def _run(screen, assets, retained):
+    hud = HUD(assets.font(None, 34), assets.font(None, 18))
+    states = [_state(i) for i in range(FRAMES)]
+    times = []
+    for st in states:
+        t0 = time.perf_counter()
+        if retained:
+            hud.draw(screen, assets, **st)
+        else:
+            _draw_immediate(hud, screen, assets, st)
+        times.append((time.perf_counter() - t0) * 1000.0)
+    times.sort()
+    return sum(times) / len(times), times[len(times) // 2], times[int(len(times) * 0.99)]
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((VIEW_W, VIEW_H))
+    assets = Assets()
+
+    # warm cache (icon / glyph) cho cả 2 cách
+    _run(screen, assets, True)
+
+    print(f"{FRAMES} frames (ms/frame)")
+    print(f"{'':>10} {'mean':>7} {'p50':>7} {'p99':>7}")
+    for name, retained in (("immediate", False), ("retained", True)):
+        mean, p50, p99 = _run(screen, assets, retained)
+        print(f"{name:>10} {mean:>7.3f} {p50:>7.3f} {p99:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
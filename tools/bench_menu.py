@@ -0,0 +1,71 @@
+# tools/bench_menu.py
+"""
+Benchmark menu đứng yên (không input): update + draw mỗi scene menu N frame,
+đo CPU time (process_time) và wall time / frame.
+Khi không bị giới hạn fps, CPU / frame * 60 = % 1 core bị chiếm ở 60fps.
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_menu
+"""
+import importlib
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.core.game import GameApp
+
+FRAMES = 300
+DT = 1.0 / 60.0
+
+SCENES = (
+    ("src.scenes.menu", "MenuScene", {}),
+    ("src.scenes.mode_select", "ModeSelectScene", {}),
+    ("src.scenes.map_select", "MapSelectScene", {}),
+    ("src.scenes.fish_select", "FishSelectScene", {}),
+    ("src.scenes.leaderboard", "LeaderboardScene", {}),
+    ("src.scenes.history", "HistoryScene", {}),
+    ("src.core.settings", "SettingsScene", {}),
+    ("src.scenes.victory", "VictoryScene", {"map_id": 1, "points": 10, "time_alive": 3.0}),
+    ("src.scenes.game_over", "GameOverScene", {"map_id": 1, "points": 10, "time_alive": 3.0}),
+)
+
+
+def _run(app, scene):
+    screen = app.screen
+    # warm (font / ảnh / nền ghép)
+    for _ in range(5):
+        scene.update(DT)
+        scene.draw(screen)
+
+    c0, w0 = time.process_time(), time.perf_counter()
+    for _ in range(FRAMES):
+        pygame.event.pump()
+        scene.update(DT)
+        scene.draw(screen)
+    cpu = (time.process_time() - c0) * 1000.0 / FRAMES
+    wall = (time.perf_counter() - w0) * 1000.0 / FRAMES
+    return cpu, wall
+
+
+def main():
+    app = GameApp()
+    # victory / game over ghi kết quả khi on_enter -> không ghi ra data/save.json
+    app.save.save = lambda *a, **kw: None
+    print(f"{app.width}x{app.height}, {FRAMES} frames idle / scene")
+    print(f"{'scene':>18} {'cpu ms':>7} {'wall ms':>8} {'cpu@60':>7}")
+    total = 0.0
+    for mod, cls, kw in SCENES:
+        scene = getattr(importlib.import_module(mod), cls)(app)
+        scene.on_enter(**kw)
+        cpu, wall = _run(app, scene)
+        total += cpu
+        print(f"{cls:>18} {cpu:>7.3f} {wall:>8.3f} {cpu * 60 / 10:>6.1f}%")
+    print(f"{'mean':>18} {total / len(SCENES):>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# tools/bench_pacing.py
+"""
+Đo CPU của GameApp.run thật (clock.tick + event + update + draw + flip) khi
+đứng yên (không input) trong vài scene, mỗi scene chạy SECONDS giây.
+CPU % = process_time / wall time (100% = chiếm trọn 1 core).
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_pacing
+Mỗi scene chạy trong 1 process riêng (GameApp.run gọi pygame.quit khi thoát).
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SECONDS = 5.0
+SCENARIOS = ("menu", "map_select", "leaderboard", "pause", "game")
+MAP_FILE = "data/maps/map1.json"
+
+
+def _scene(app, name):
+    if name == "menu":
+        from src.scenes.menu import MenuScene
+        return MenuScene(app), {}
+    if name == "map_select":
+        from src.scenes.map_select import MapSelectScene
+        return MapSelectScene(app), {}
+    if name == "leaderboard":
+        from src.scenes.leaderboard import LeaderboardScene
+        return LeaderboardScene(app), {}
+
+    from src.scenes.game_scene import GameScene
+    with open(MAP_FILE, "r", encoding="utf-8") as f:
+        map_data = json.load(f)
+    app.runtime["map"] = map_data
+    game = GameScene(app)
+    if name == "game":
+        return game, {"map_data": map_data}
+
+    from src.scenes.pause import PauseScene
+    game.on_enter(map_data=map_data)
+    return PauseScene(app, game), {}
+
+
+def run_one(name):
+    import pygame
+    from src.core.game import GameApp
+
+    app = GameApp()
+    # không ghi save.json trong lúc đo
+    app.save.save = lambda *a, **kw: None
+
+    scene, kw = _scene(app, name)
+    app.scenes.scene = scene
+    scene.on_enter(**kw)
+
+    pygame.time.set_timer(pygame.QUIT, int(SECONDS * 1000), 1)
+    c0, w0 = time.process_time(), time.perf_counter()
+    app.run()
+    cpu, wall = time.process_time() - c0, time.perf_counter() - w0
+    print(json.dumps({"cpu": cpu, "wall": wall}))
+
+
+def main():
+    if len(sys.argv) > 1:
+        run_one(sys.argv[1])
+        return
+
+    print(f"idle {SECONDS:.0f}s / scene")
+    print(f"{'scene':>12} {'cpu s':>7} {'cpu %':>7}")
+    for name in SCENARIOS:
+        out = subprocess.run(
+            [sys.executable, "-m", "tools.bench_pacing", name],
+            capture_output=True, text=True,
+        ).stdout.strip().splitlines()
+        r = json.loads(out[-1])
+        print(f"{name:>12} {r['cpu']:>7.2f} {r['cpu'] / r['wall'] * 100:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# tools/bench_player_radius.py
+"""
+Hit radius của PlayerFish: bản cũ (get_image rồi đọc w/h) vs bản tính sẵn.
+- kiểm tra khớp trên toàn dải scale cho mọi cá player
+- đo thời gian / lần gọi
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_player_radius
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.entities.player import PlayerFish
+
+CALLS = 20000
+
+
+def sprite_radius(p):
+    """Cách tính cũ: scale frame thật rồi đo."""
+    img = p.sprite.get_image(scale=(p.scale / p.render_div))
+    return max(img.get_width(), img.get_height()) * 0.35
+
+
+def check_consistency(folders):
+    worst = 0.0
+    checked = 0
+    for folder in folders:
+        p = PlayerFish((0, 0), fish_folder=folder)
+        s = 0.30
+        while s <= 6.2:
+            p.scale = s
+            p._refresh_hit_radius()
+            worst = max(worst, abs(p.collision_radius() - sprite_radius(p)))
+            checked += 1
+            s += 0.013
+    return checked, worst
+
+
+def bench(folder):
+    p = PlayerFish((0, 0), fish_folder=folder)
+    p.points = 900
+
+    # scale đang ease liên tục như trong game (mỗi call 1 frame)
+    t0 = time.perf_counter()
+    for _ in range(CALLS):
+        p._update_scale(1 / 60)
+        sprite_radius(p)
+    t_old = time.perf_counter() - t0
+
+    p = PlayerFish((0, 0), fish_folder=folder)
+    p.points = 900
+    t0 = time.perf_counter()
+    for _ in range(CALLS):
+        p._update_scale(1 / 60)
+        p.collision_radius()
+    t_new = time.perf_counter() - t0
+    return t_old, t_new
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    root = "assets/fish/player"
+    folders = [f"{root}/{d}" for d in sorted(os.listdir(root)) if os.path.isdir(os.path.join(root, d))]
+
+    checked, worst = check_consistency(folders)
+    print(f"consistency: {checked} (fish, scale) pairs, max |diff| = {worst:.6f}")
+    if worst > 1e-9:
+        raise SystemExit("FAIL: analytic radius differs from sprite-derived radius")
+
+    t_old, t_new = bench(folders[0])
+    print(f"{CALLS} calls: sprite-derived {t_old * 1e6 / CALLS:.2f} us/call, "
+          f"cached {t_new * 1e6 / CALLS:.2f} us/call ({t_old / max(1e-12, t_new):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
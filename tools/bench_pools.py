@@ -0,0 +1,107 @@
+# tools/bench_pools.py
+"""
+So sánh World có / không object pool (World(pooling=...)):
+- entity tạo mới vs lấy lại từ pool (prey / predator / drop / floating text)
+- số lần GC chạy theo generation + thời gian dừng (đo bằng gc.callbacks)
+Trận 2P map 3 (đông cá nhất), player không chết + target rất cao để chạy đủ SECONDS,
+có sprite (AnimatedSprite được dùng lại khi cá về pool).
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_pools
+"""
+import gc
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.input import RandomWalkInput
+from src.world.sim import load_map, make_players
+from src.world.world import World
+
+SECONDS = 600.0
+MAP_ID = 3
+SEED = 5
+
+
+class GcTimer:
+    """gc.callbacks: đếm số lần GC + thời gian dừng mỗi lần (ms) theo generation."""
+
+    def __init__(self):
+        self.pauses = {0: [], 1: [], 2: []}
+        self._t0 = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._t0 = time.perf_counter()
+        else:
+            self.pauses[info["generation"]].append((time.perf_counter() - self._t0) * 1000.0)
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def run(pooling):
+    import random
+
+    map_data = load_map(MAP_ID)
+    rng = random.Random(SEED)
+    inputs = [RandomWalkInput(rng=rng, dt=World.FIXED_DT) for _ in range(2)]
+    world = World(
+        map_data,
+        make_players(map_data, 2, inputs),
+        mode=2,
+        seed=SEED,
+        targets={MAP_ID: 10 ** 9},
+        pooling=pooling,
+    )
+    for p in world.players:
+        p.lives = 10 ** 9
+
+    n = int(SECONDS / world.fixed_dt)
+    with GcTimer() as gct:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            world.step()
+        wall = time.perf_counter() - t0
+    return world, gct, wall
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    # warm: sprite frames nạp 1 lần cho cả 2 lượt
+    run(True)
+
+    print(f"map {MAP_ID} 2P, {SECONDS:.0f}s sim")
+    for pooling in (False, True):
+        world, gct, wall = run(pooling)
+        st = world.pools.stats()
+        created = sum(s["created"] for s in st.values())
+        reused = sum(s["reused"] for s in st.values())
+
+        print(f"\npooling={pooling}  wall {wall:.2f}s")
+        print(f"  entities created {created}, reused {reused}")
+        for name, s in st.items():
+            print(f"    {name:>13}: created {s['created']:>5} reused {s['reused']:>5}")
+        for gen, ps in gct.pauses.items():
+            if not ps:
+                print(f"  gc gen{gen}: 0 runs")
+                continue
+            ps.sort()
+            print(
+                f"  gc gen{gen}: {len(ps):>5} runs, total {sum(ps):7.2f} ms, "
+                f"p99 {ps[int(len(ps) * 0.99)]:.3f} ms, max {ps[-1]:.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# tools/bench_sampler.py
+"""
+Microbenchmark chọn theo trọng số (src/core/sampler.py), bảng 10 / 100 / 10000 entry:
+- build: CumulativeTable vs AliasTable (us / lần)
+- pick 1: quét tuyến tính (kiểu _weighted_choice cũ), rng.choices(weights=, k=1)
+  (kiểu DropSpawner cũ), CumulativeTable.pick, AliasTable.pick (ns / lần)
+- batch k = BATCH: rng.choices(weights=), CumulativeTable.sample, AliasTable.sample (ns / item)
+- sai số bảng alias: phân phối suy ra từ prob / alias so với trọng số thật (max |lệch|)
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_sampler
+"""
+import random
+import time
+
+from src.core.sampler import AliasTable, CumulativeTable
+
+SIZES = (10, 100, 10000)
+PICKS = 50000
+BATCH = 1000
+BUILDS = 50
+SEED = 7
+
+
+def linear_pick(items, weights, rng):
+    total = sum(weights)
+    r = rng.uniform(0, total)
+    s = 0
+    for it, w in zip(items, weights):
+        s += w
+        if r <= s:
+            return it
+    return items[-1]
+
+
+def _ns(fn, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) * 1e9 / n
+
+
+def alias_error(table, weights):
+    n = len(table)
+    p = [0.0] * n
+    for i in range(n):
+        p[table.items[i]] += table.prob[i] / n
+        p[table.items[table.alias[i]]] += (1.0 - table.prob[i]) / n
+    total = sum(weights)
+    return max(abs(p[i] - w / total) for i, w in enumerate(weights))
+
+
+def main():
+    print(f"pick: {PICKS} lần, batch: k={BATCH}")
+    print(f"{'n':>6} | {'build cum':>9} {'build alias':>11} | {'linear':>8} {'choices':>8} "
+          f"{'cum':>6} {'alias':>6} | {'choices k':>9} {'cum k':>6} {'alias k':>7} | {'err alias':>9}")
+
+    for n in SIZES:
+        rng = random.Random(SEED)
+        items = list(range(n))
+        weights = [rng.randint(1, 100) for _ in items]
+
+        b_cum = _ns(lambda: CumulativeTable(items, weights), BUILDS) / 1000.0
+        b_alias = _ns(lambda: AliasTable(items, weights), BUILDS) / 1000.0
+        cum = CumulativeTable(items, weights)
+        alias = AliasTable(items, weights)
+
+        # quét tuyến tính O(n) -> ít lần hơn với bảng lớn
+        picks = PICKS if n <= 100 else PICKS // 50
+        t_lin = _ns(lambda: linear_pick(items, weights, rng), picks)
+        t_choices = _ns(lambda: rng.choices(items, weights=weights, k=1)[0], picks)
+        t_cum = _ns(lambda: cum.pick(rng), PICKS)
+        t_alias = _ns(lambda: alias.pick(rng), PICKS)
+
+        rounds = max(1, PICKS // BATCH)
+        k_choices = _ns(lambda: rng.choices(items, weights=weights, k=BATCH), rounds) / BATCH
+        k_cum = _ns(lambda: cum.sample(rng, BATCH), rounds) / BATCH
+        k_alias = _ns(lambda: alias.sample(rng, BATCH), rounds) / BATCH
+
+        err = alias_error(alias, weights)
+
+        print(f"{n:>6} | {b_cum:>9.1f} {b_alias:>11.1f} | {t_lin:>8.0f} {t_choices:>8.0f} "
+              f"{t_cum:>6.0f} {t_alias:>6.0f} | {k_choices:>9.0f} {k_cum:>6.0f} {k_alias:>7.0f} | {err:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# tools/bench_spatial_hash.py
+"""
+Benchmark broad-phase va chạm: quét O(players x entities) vs SpatialHash.
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_spatial_hash
+"""
+import random
+import time
+
+import pygame
+
+from src.entities.prey import PreyFish
+from src.world.spatial_hash import SpatialHash
+
+WORLD_W, WORLD_H = 9600, 5400
+COUNTS = (50, 500, 5000)
+FRAMES = 120
+DT = 1.0 / 60.0
+PLAYER_R = 40.0
+
+
+def _make_world(n, seed=1234):
+    rnd = random.Random(seed)
+    preys = []
+    for _ in range(n):
+        pos = (rnd.uniform(40, WORLD_W - 40), rnd.uniform(40, WORLD_H - 40))
+        preys.append(PreyFish(pos, fish_folder=None, points=rnd.choice((5, 10, 25, 40))))
+    players = [
+        pygame.Vector2(WORLD_W / 2 - 80, WORLD_H / 2),
+        pygame.Vector2(WORLD_W / 2 + 80, WORLD_H / 2),
+    ]
+    return preys, players
+
+
+def _naive(preys, players):
+    hits = 0
+    for pos in players:
+        r = PLAYER_R
+        p_rect = pygame.Rect(int(pos.x - r), int(pos.y - r), int(r * 2), int(r * 2))
+        for e in preys:
+            if p_rect.colliderect(e.rect()):
+                hits += 1
+    return hits
+
+
+def _grid(grid, preys, players):
+    grid.sync(preys)
+    hits = 0
+    for pos in players:
+        r = PLAYER_R
+        p_rect = pygame.Rect(int(pos.x - r), int(pos.y - r), int(r * 2), int(r * 2))
+        for e in grid.query(pos.x, pos.y, r):
+            if p_rect.colliderect(e.rect()):
+                hits += 1
+    return hits
+
+
+def _run(n, mode):
+    random.seed(n)
+    preys, players = _make_world(n)
+    grid = SpatialHash(128, incremental=(mode == "incremental"))
+
+    t_update = 0.0
+    t_coll = 0.0
+    hits = 0
+    for _ in range(FRAMES):
+        t0 = time.perf_counter()
+        for e in preys:
+            e.update(DT, WORLD_W, WORLD_H)
+        t1 = time.perf_counter()
+        if mode == "naive":
+            hits += _naive(preys, players)
+        else:
+            hits += _grid(grid, preys, players)
+        t2 = time.perf_counter()
+        t_update += t1 - t0
+        t_coll += t2 - t1
+
+    return (t_update / FRAMES) * 1000.0, (t_coll / FRAMES) * 1000.0, hits
+
+
+def main():
+    print(f"{FRAMES} frames, world {WORLD_W}x{WORLD_H}, 2 players (ms/frame)")
+    print(f"{'entities':>9} {'mode':>12} {'update':>9} {'collide':>9} {'frame':>9} {'hits':>7}")
+    for n in COUNTS:
+        for mode in ("naive", "rebuild", "incremental"):
+            upd, coll, hits = _run(n, mode)
+            print(f"{n:>9} {mode:>12} {upd:>9.3f} {coll:>9.3f} {upd + coll:>9.3f} {hits:>7}")
+
+
+if __name__ == "__main__":
+    main()
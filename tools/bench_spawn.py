@@ -0,0 +1,103 @@
+# tools/bench_spawn.py
+"""
+Chi phí 1 lần chọn cá khi spawn, mọi map x nhiều mức pp x số prey trên màn:
+- cũ: quét list preys đếm cá nhỏ + _build_pool (lọc / copy dict) + _weighted_choice
+- mới: bảng compile sẵn (SpawnTables, alias) + số cá nhỏ giữ tăng dần
+Kiểm tra luôn tần suất chọn của 2 cách khớp nhau (lệch tối đa TOL mỗi loài).
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_spawn
+"""
+import random
+import time
+from collections import Counter
+
+from src.world.spawner import Spawner, SMALL_POINTS, _weighted_choice
+
+PP = (0, 30, 59, 60, 100, 139, 140, 200, 300, 600)
+PREYS = (10, 40)
+PICKS = 20000
+SEED = 11
+TOL = 0.02
+
+
+class _Prey:
+    __slots__ = ("points",)
+
+    def __init__(self, points):
+        self.points = points
+
+
+def _preys(rng, n):
+    return [_Prey(rng.choice((5, 5, 10, 20, 40, 80))) for _ in range(n)]
+
+
+def old_pick(sp, tables, enemies, pp, preys, rng, want_predator):
+    small = sum(1 for p in preys if getattr(p, "points", 0) <= SMALL_POINTS)
+    return _weighted_choice(sp._build_pool(enemies, pp, small, want_predator), rng)
+
+
+def new_pick(sp, tables, enemies, pp, preys, rng, want_predator):
+    sp.rng = rng
+    return sp._pick(enemies, tables, pp, want_predator)
+
+
+def bench(fn, sp, tables, enemies, pp, preys, want_predator):
+    rng = random.Random(SEED)
+    picks = []
+    t0 = time.perf_counter()
+    for _ in range(PICKS):
+        e = fn(sp, tables, enemies, pp, preys, rng, want_predator)
+        picks.append(e["path"] if e else None)
+    return (time.perf_counter() - t0) * 1e9 / PICKS, picks
+
+
+def _freq_diff(a, b):
+    ca, cb = Counter(a), Counter(b)
+    return max(abs(ca[k] - cb[k]) for k in ca.keys() | cb.keys()) / len(a)
+
+
+def main():
+    sp = Spawner(0, 0, load_sprites=False)
+    maps = sorted(sp.enemies_cfg)
+    print(f"{PICKS} picks / ô, ns/pick (cũ -> mới)")
+    print(f"{'map':>5} {'n':>4} {'preys':>6} " + " ".join(f"{'pp ' + str(pp):>15}" for pp in PP))
+
+    mismatches = 0
+    worst = 0.0
+    tot_old = tot_new = 0.0
+    for key in maps:
+        enemies = sp.enemies_cfg[key]
+        sp.rebuild_tables()
+        t0 = time.perf_counter()
+        tables = sp.tables(int(key[3:]))
+        build_us = (time.perf_counter() - t0) * 1e6
+
+        for n in PREYS:
+            preys = _preys(random.Random(n), n)
+            sp.small_preys = sum(1 for p in preys if p.points <= SMALL_POINTS)
+            cells = []
+            for pp in PP:
+                ns = [0.0, 0.0]
+                for want_predator in (False, True):
+                    t_old, a = bench(old_pick, sp, tables, enemies, pp, preys, want_predator)
+                    t_new, b = bench(new_pick, sp, tables, enemies, pp, preys, want_predator)
+                    d = _freq_diff(a, b)
+                    worst = max(worst, d)
+                    mismatches += d > TOL
+                    ns[0] += t_old
+                    ns[1] += t_new
+                tot_old += ns[0]
+                tot_new += ns[1]
+                cells.append(f"{ns[0] / 2:>6.0f} -> {ns[1] / 2:>4.0f}")
+            print(f"{key:>5} {len(enemies):>4} {n:>6} " + " ".join(f"{c:>15}" for c in cells))
+        print(f"{'':>5} compile {build_us:.0f} us, {len(tables.breaks)} khoảng pp")
+
+    print(f"\ntrung bình: cũ {tot_old / max(1, tot_new):.1f}x chậm hơn mới")
+    print(f"tần suất lệch tối đa {worst:.4f}")
+    if mismatches:
+        print(f"[WARN] {mismatches} ô lệch tần suất > {TOL}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# tools/bench_sprite_cache.py
+"""
+Player lớn dần (ăn liên tục, pop khi ăn, đổi hướng) - có / không prefetch frame:
+- miss lúc vẽ = frame phải smoothscale ngay trong lúc draw player
+- thời gian get_image mỗi frame (draw) và update + prefetch + get_image (tick): p99 / max (ms)
+- số frame được prefetch trước, dung lượng LRU cuối lượt
+Kèm so sánh evict của LRU: list.pop(0) (bản cũ) vs OrderedDict.popitem.
+
+Chạy từ thư mục gốc:
+    python -m tools.bench_sprite_cache
+"""
+import os
+import random
+import time
+from collections import OrderedDict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.sprite_cache import SPRITES
+from src.entities.player import PlayerFish
+
+PLAYER = "assets/fish/player/fish01"
+SECONDS = 60.0
+DT = 1.0 / 60.0
+SEED = 3
+
+LRU_KEYS = 600
+LRU_PUTS = 200000
+
+
+class _Input:
+    """Bơi ngang, đổi hướng ngẫu nhiên."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.dir = 1
+
+    def read(self, player):
+        if self.rng.random() < 0.02:
+            self.dir = -self.dir
+        return self.dir, 0
+
+
+def run(per_frame):
+    PlayerFish.PREFETCH_PER_FRAME = per_frame
+    SPRITES.scaled.clear()
+
+    rng = random.Random(SEED)
+    p = PlayerFish((0, 0), fish_folder=PLAYER, input_source=_Input(rng))
+    cache = SPRITES.scaled
+    m0, pf0 = cache.misses, cache.prefetched
+
+    times = []
+    ticks = []
+    draw_misses = 0
+    for _ in range(int(SECONDS / DT)):
+        if rng.random() < 0.03:
+            p.add_points(rng.choice((5, 10, 20, 40)))
+        t0 = time.perf_counter()
+        p.update(DT)
+        # như GameScene.draw: prefetch 1 lần / frame vẽ
+        p.prefetch()
+
+        before = cache.misses
+        t1 = time.perf_counter()
+        p.sprite.get_image(scale=(p.scale + p._pop) / p.render_div)
+        t2 = time.perf_counter()
+        times.append((t2 - t1) * 1000.0)
+        ticks.append((t2 - t0) * 1000.0)
+        draw_misses += cache.misses - before
+
+    times.sort()
+    ticks.sort()
+    return {
+        "points": p.points,
+        "draw_misses": draw_misses,
+        "misses": cache.misses - m0,
+        "prefetched": cache.prefetched - pf0,
+        "p99": times[int(len(times) * 0.99)],
+        "max": times[-1],
+        "tick_p99": ticks[int(len(ticks) * 0.99)],
+        "tick_max": ticks[-1],
+        "resident_mb": cache.resident_bytes / (1024 * 1024),
+        "items": len(cache),
+    }
+
+
+def bench_evict():
+    """put liên tục với LRU đầy LRU_KEYS key -> mỗi put evict 1 key."""
+    order = list(range(LRU_KEYS))
+    t0 = time.perf_counter()
+    for k in range(LRU_KEYS, LRU_KEYS + LRU_PUTS):
+        order.append(k)
+        order.pop(0)
+    t_list = time.perf_counter() - t0
+
+    od = OrderedDict.fromkeys(range(LRU_KEYS))
+    t0 = time.perf_counter()
+    for k in range(LRU_KEYS, LRU_KEYS + LRU_PUTS):
+        od[k] = None
+        od.popitem(last=False)
+    t_od = time.perf_counter() - t0
+    return t_list, t_od
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    # warm: frames gốc
+    run(False)
+
+    print(f"player {PLAYER}, {SECONDS:.0f}s @ 60Hz")
+    print("prefetch = PlayerFish.PREFETCH_PER_FRAME (0 = tắt)")
+    print(f"{'prefetch':>9} {'points':>7} {'draw miss':>10} {'prefetched':>11} "
+          f"{'draw p99':>9} {'draw max':>9} {'tick p99':>9} {'tick max':>9} {'LRU MB':>7} {'items':>6}")
+    for prefetch in (0, 1, 2):
+        r = run(prefetch)
+        print(f"{prefetch:>9} {r['points']:>7} {r['draw_misses']:>10} {r['prefetched']:>11} "
+              f"{r['p99']:>9.3f} {r['max']:>9.3f} {r['tick_p99']:>9.3f} {r['tick_max']:>9.3f} "
+              f"{r['resident_mb']:>7.1f} {r['items']:>6}")
+
+    t_list, t_od = bench_evict()
+    print(f"\nLRU evict ({LRU_KEYS} keys, {LRU_PUTS} puts): "
+          f"list.pop(0) {t_list * 1e9 / LRU_PUTS:.0f} ns/put, "
+          f"OrderedDict {t_od * 1e9 / LRU_PUTS:.0f} ns/put")
+
+
+if __name__ == "__main__":
+    main()
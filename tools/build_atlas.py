@@ -0,0 +1,181 @@
+# tools/build_atlas.py
+"""
+Build atlas frame cá: swim_01 / swim_02 của mọi loài trong assets/fish
+xếp vào vài sheet lớn (cá địch theo map, cá người chơi theo loài) + index JSON.
+
+Chỉ lưu frame size gốc: bản scale (size chuẩn theo points) vẫn tạo lúc preload
+bằng smoothscale - decode pixel PNG đã scale sẵn chậm hơn smoothscale ~10 lần,
+sheet có cả bản scale làm load chậm gần 2x (xem tools/bench_atlas.py).
+Sheet tối đa 1024px -> mỗi map vài sheet, preload vẫn decode song song.
+
+Atlas là bước đóng gói (không commit, xem .gitignore): giảm số file mở
+(map1: 32 -> 4), có lợi khi mở file đắt (exe onefile, ổ mạng, antivirus quét
+từng file). Không có atlas -> game load file rời như cũ.
+
+Chạy từ thư mục gốc (build lại sau khi thêm / đổi ảnh cá):
+    python -m tools.build_atlas
+"""
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.core.atlas import ATLAS_DIR, ATLAS_INDEX
+from src.core.sprite_cache import PROJECT_ROOT, folder_paths
+
+FISH_DIR = "assets/fish"
+SHEET_MAX = 1024
+PAD = 1
+
+
+def _abs(p):
+    return os.path.join(PROJECT_ROOT, p)
+
+
+def find_folders():
+    """Mọi thư mục cá có đủ swim_01 / swim_02 (path tương đối, '/')."""
+    out = []
+    for dirpath, _, files in os.walk(_abs(FISH_DIR)):
+        if "swim_01.png" in files and "swim_02.png" in files:
+            out.append(os.path.relpath(dirpath, PROJECT_ROOT).replace("\\", "/"))
+    return sorted(out)
+
+
+def group_of(folder):
+    """
+    Cá địch theo map (vào map là dùng cả nhóm), cá người chơi theo loài
+    (1 trận chỉ dùng 1-2 loài, decode cả nhóm là phí).
+    """
+    parts = folder.split("/")
+    if parts[2] == "enemies":
+        return f"enemies_{parts[3]}"
+    return f"player_{parts[-1]}"
+
+
+# =========================
+# Packing (shelf)
+# =========================
+def pack(units):
+    """
+    units: [(id, w, h)] -> ({id: (sheet_idx, x, y)}, [(w, h)] từng sheet).
+    Thử nhiều bề rộng sheet, lấy cách xếp tốn ít pixel nhất
+    (decode PNG tốn theo pixel, kể cả vùng trống).
+    """
+    min_w = max(w for _, w, _ in units)
+    best = None
+    for width in range(min_w, SHEET_MAX + 1, 16):
+        placed, sheets = _shelf(units, width)
+        area = sum(w * h for w, h in sheets)
+        if best is None or area < best[0]:
+            best = (area, placed, sheets)
+    return best[1], best[2]
+
+
+def _shelf(units, width):
+    """Xếp theo hàng (shelf), cao trước; sheet đầy -> mở sheet mới."""
+    placed = {}
+    sheets = []
+    x = y = shelf_h = used_w = 0
+    idx = 0
+
+    for uid, w, h in sorted(units, key=lambda u: (-u[2], -u[1], u[0])):
+        if x + w > width:
+            x, y, shelf_h = 0, y + shelf_h + PAD, 0
+        if y + h > SHEET_MAX:
+            sheets.append((used_w, y - PAD))
+            idx += 1
+            x = y = shelf_h = used_w = 0
+        placed[uid] = (idx, x, y)
+        x += w + PAD
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x - PAD)
+
+    if placed:
+        sheets.append((used_w, y + shelf_h))
+    return placed, sheets
+
+
+def _unit_size(frames, horizontal):
+    gap = PAD * (len(frames) - 1)
+    if horizontal:
+        return sum(f.get_width() for f in frames) + gap, max(f.get_height() for f in frames)
+    return max(f.get_width() for f in frames), sum(f.get_height() for f in frames) + gap
+
+
+def _horizontal(frames):
+    return _unit_size(frames, True)[0] <= SHEET_MAX
+
+
+def build():
+    folders = find_folders()
+
+    # group -> {folder: [frames]}
+    groups = {}
+    for folder in folders:
+        frames = [pygame.image.load(_abs(p)).convert_alpha() for p in folder_paths(folder)]
+        groups.setdefault(group_of(folder), {})[folder] = frames
+
+    os.makedirs(_abs(ATLAS_DIR), exist_ok=True)
+    for name in os.listdir(_abs(ATLAS_DIR)):
+        if name.endswith(".png"):
+            os.remove(os.path.join(_abs(ATLAS_DIR), name))
+
+    index = {"version": 1, "sheets": {}, "fish": {}}
+
+    for group in sorted(groups):
+        species = groups[group]
+        # 1 unit = các frame 1 loài (không bị tách sang sheet khác),
+        # xếp ngang, quá rộng thì xếp dọc
+        units = []
+        for folder, frames in species.items():
+            units.append((folder,) + _unit_size(frames, _horizontal(frames)))
+
+        placed, sheet_sizes = pack(units)
+        names = [f"{ATLAS_DIR}/{group}_{i}.png" for i in range(len(sheet_sizes))]
+        sheets = [pygame.Surface(wh, pygame.SRCALPHA) for wh in sheet_sizes]
+
+        for folder, frames in species.items():
+            si, x, y = placed[folder]
+            horizontal = _horizontal(frames)
+            rects = []
+            for f in frames:
+                sheets[si].blit(f, (x, y))
+                rects.append([x, y, f.get_width(), f.get_height()])
+                if horizontal:
+                    x += f.get_width() + PAD
+                else:
+                    y += f.get_height() + PAD
+
+            paths = folder_paths(folder)
+            index["fish"][folder] = {
+                "paths": list(paths),
+                "src_bytes": [os.path.getsize(_abs(p)) for p in paths],
+                "sheet": names[si],
+                "rects": rects,
+            }
+
+        for n, sh in zip(names, sheets):
+            pygame.image.save(sh, _abs(n))
+            index["sheets"][n] = list(sh.get_size())
+
+    with open(_abs(ATLAS_INDEX), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+
+    disk = sum(os.path.getsize(_abs(n)) for n in index["sheets"])
+    n_frames = sum(len(e["rects"]) for e in index["fish"].values())
+    print(
+        f"packed {n_frames} frames of {len(folders)} species into "
+        f"{len(index['sheets'])} sheets ({disk / 1024 / 1024:.2f} MB) -> {ATLAS_INDEX}"
+    )
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    build()
+
+
+if __name__ == "__main__":
+    main()
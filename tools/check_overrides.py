@@ -0,0 +1,46 @@
+# tools/check_overrides.py
+"""
+Kiểm tra ghi đè cấu hình của batch.py (map_targets) chỉ đổi đúng map được ghi:
+- override 1 map -> TARGET_POINTS map đó = giá trị override
+- các map còn lại giữ World.MAP_TARGETS
+Sai -> in [FAIL] và thoát mã 1.
+
+Chạy từ thư mục gốc:
+    python -m tools.check_overrides
+"""
+import sys
+
+from batch import build_overrides
+from src.world.sim import load_map, make_players
+from src.world.spawner import _load_fish_enemies
+from src.world.world import World
+
+OVERRIDE = 600
+
+
+def target_for(map_id, targets):
+    map_data = load_map(map_id)
+    return World(map_data, make_players(map_data), targets=targets).TARGET_POINTS
+
+
+def main():
+    base_enemies = _load_fish_enemies()
+    failed = 0
+    for changed in World.MAP_TARGETS:
+        # đi qua build_overrides như 1 cấu hình JSON thật (key kiểu str)
+        targets = build_overrides({"map_targets": {str(changed): OVERRIDE}}, base_enemies)["targets"]
+        for map_id, default in World.MAP_TARGETS.items():
+            want = OVERRIDE if map_id == changed else default
+            got = target_for(map_id, targets)
+            ok = got == want
+            failed += not ok
+            print(f"{'[OK]  ' if ok else '[FAIL]'} override map{changed} -> map{map_id} target {got} (want {want})")
+
+    if failed:
+        print(f"[FAIL] {failed} map target sai")
+        sys.exit(1)
+    print("map_targets override OK")
+
+
+if __name__ == "__main__":
+    main()
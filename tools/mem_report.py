@@ -0,0 +1,86 @@
+# tools/mem_report.py
+"""
+Bộ nhớ / entity: tạo N object mỗi kiểu, đo bằng tracemalloc (byte cấp phát
+còn giữ sau khi tạo, chia N). Gồm object + Vector2 + AnimatedSprite riêng của nó;
+frames dùng chung (SPRITES) được nạp trước khi đo nên không tính vào.
+Dùng để theo dõi footprint mỗi entity khi thêm tính năng.
+
+Chạy từ thư mục gốc:
+    python -m tools.mem_report            # N = 2000
+    python -m tools.mem_report 10000
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.entities.prey import PreyFish
+from src.entities.shy_prey_fish import ShyPreyFish
+from src.entities.ai_fish import PredatorFish
+from src.entities.player import PlayerFish
+from src.entities.powerup import PowerUp
+from src.entities.obstacle import Obstacle
+from src.entities.floating_text import FloatingText
+from src.entities.food import Food
+
+N = 2000
+ENEMY = "assets/fish/enemies/map1/fish01"
+PLAYER = "assets/fish/player/fish01"
+
+
+def _factories(rng, sprites):
+    enemy = ENEMY if sprites else None
+    player = PLAYER if sprites else None
+    return (
+        ("PreyFish", lambda: PreyFish((10, 10), fish_folder=enemy, points=10, rng=rng)),
+        ("ShyPreyFish", lambda: ShyPreyFish((10, 10), fish_folder=enemy, rng=rng)),
+        ("PredatorFish", lambda: PredatorFish((10, 10), fish_folder=enemy, rng=rng)),
+        ("PlayerFish", lambda: PlayerFish((10, 10), fish_folder=player)),
+        ("PowerUp", lambda: PowerUp((10, 10), "x2", rng=rng)),
+        ("Obstacle", lambda: Obstacle((10, 10), 1, rng=rng)),
+        ("FloatingText", lambda: FloatingText((10, 10), "+10")),
+        ("Food", lambda: Food((10, 10))),
+    )
+
+
+def measure(make, n):
+    """-> byte / object (cấp phát còn sống sau khi tạo n object)."""
+    make()  # warm: frames, cache nội bộ
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [make() for _ in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(s.size_diff for s in stats)
+    # bỏ phần list chứa object (8 byte / phần tử)
+    total -= sys.getsizeof(items)
+    return total / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(0)
+
+    print(f"N = {n} / kiểu")
+    print(f"{'entity':>14} {'bytes (headless)':>17} {'bytes (sprite)':>15}")
+    rows = {}
+    for sprites in (False, True):
+        for name, make in _factories(rng, sprites):
+            rows.setdefault(name, []).append(measure(make, n))
+    for name, (plain, spr) in rows.items():
+        print(f"{name:>14} {plain:>17.0f} {spr:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()